@@ -0,0 +1,74 @@
+"""add_notification_dispatch_indexes
+
+Revision ID: 5d1f3c9a7b2e
+Revises: 88491fbe47f5
+Create Date: 2026-10-17 09:12:44.518207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d1f3c9a7b2e'
+down_revision: Union[str, None] = '88491fbe47f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built concurrently so large notification tables stay writable during the migration
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_notification_pending_due',
+            'notification',
+            ['scheduled_for', 'priority'],
+            unique=False,
+            postgresql_where=sa.text("status = 'pending'"),
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            'ix_notification_queued_updated_at',
+            'notification',
+            ['updated_at'],
+            unique=False,
+            postgresql_where=sa.text("status = 'queued'"),
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            op.f('ix_notification_user_id'),
+            'notification',
+            ['user_id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            op.f('ix_notification_template_id'),
+            'notification',
+            ['template_id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            op.f('ix_deliverystatus_notification_id'),
+            'deliverystatus',
+            ['notification_id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(op.f('ix_deliverystatus_notification_id'), table_name='deliverystatus', postgresql_concurrently=True, if_exists=True)
+        op.drop_index(op.f('ix_notification_template_id'), table_name='notification', postgresql_concurrently=True, if_exists=True)
+        op.drop_index(op.f('ix_notification_user_id'), table_name='notification', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_notification_queued_updated_at', table_name='notification', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_notification_pending_due', table_name='notification', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,63 @@
+"""add_notification_keyset_indexes
+
+Revision ID: b7e4a2d9c1f0
+Revises: 5d1f3c9a7b2e
+Create Date: 2026-10-17 11:03:27.904113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e4a2d9c1f0'
+down_revision: Union[str, None] = '5d1f3c9a7b2e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_notification_created_at_id',
+            'notification',
+            ['created_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            'ix_notification_user_created_at_id',
+            'notification',
+            ['user_id', 'created_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            'ix_notification_status_created_at_id',
+            'notification',
+            ['status', 'created_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        # Superseded by the leading user_id column of ix_notification_user_created_at_id
+        op.drop_index(op.f('ix_notification_user_id'), table_name='notification', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_notification_user_id'),
+            'notification',
+            ['user_id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.drop_index('ix_notification_status_created_at_id', table_name='notification', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_notification_user_created_at_id', table_name='notification', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_notification_created_at_id', table_name='notification', postgresql_concurrently=True, if_exists=True)
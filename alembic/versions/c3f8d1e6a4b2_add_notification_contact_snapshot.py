@@ -0,0 +1,43 @@
+"""add_notification_contact_snapshot
+
+Revision ID: c3f8d1e6a4b2
+Revises: b7e4a2d9c1f0
+Create Date: 2026-10-17 14:22:08.516204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f8d1e6a4b2'
+down_revision: Union[str, None] = 'b7e4a2d9c1f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('notification', sa.Column('recipient', sa.String(255), nullable=True))
+    op.add_column('notification', sa.Column('subject', sa.String(100), nullable=True))
+
+    # Snapshot contacts for notifications that may still be sent; sent
+    # history is left alone. Rows missed here are filled in at send time.
+    op.execute("""
+        UPDATE notification
+        SET recipient = CASE notification.channel
+                WHEN 'email' THEN "user".email
+                WHEN 'sms' THEN "user".phone
+            END,
+            subject = notificationtemplate.name
+        FROM "user", notificationtemplate
+        WHERE "user".id = notification.user_id
+          AND notificationtemplate.id = notification.template_id
+          AND notification.status IN ('pending', 'queued', 'processing', 'failed')
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('notification', 'subject')
+    op.drop_column('notification', 'recipient')
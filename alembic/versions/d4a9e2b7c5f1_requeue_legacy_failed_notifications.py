@@ -0,0 +1,38 @@
+"""requeue_legacy_failed_notifications
+
+Revision ID: d4a9e2b7c5f1
+Revises: c3f8d1e6a4b2
+Create Date: 2026-10-17 16:41:53.207319
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a9e2b7c5f1'
+down_revision: Union[str, None] = 'c3f8d1e6a4b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Failed attempts used to stay 'failed' while a Celery countdown retried
+    # them. Retries are now scheduled in the database and only 'pending'
+    # rows are dispatched, so hand the ones with attempts left to the
+    # scheduler; they become due immediately.
+    op.execute("""
+        UPDATE notification
+        SET status = 'pending',
+            updated_at = now()
+        WHERE status = 'failed'
+          AND retry_count < max_retries
+    """)
+
+
+def downgrade() -> None:
+    # Requeued rows cannot be told apart from other pending rows, so they
+    # are left pending
+    pass
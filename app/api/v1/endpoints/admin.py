@@ -0,0 +1,65 @@
+# app/api/v1/endpoints/admin.py
+
+# Standard library imports
+from typing import Any, Dict
+
+# Third-party imports
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import JSONResponse
+
+# Local application imports
+from app.core.auth import require_admin
+from app.db.session import get_pool_metrics
+from app.models.user import User
+from app.schemas.common import APIResponse
+from app.services.senders.circuit_breaker import circuit_breaker
+
+# Router initialization
+router = APIRouter()
+
+@router.get("/db-pool", response_model=APIResponse[Dict[str, Any]])
+async def get_db_pool_metrics(
+    current_user: User = Depends(require_admin)
+):
+    """
+    Report this API process's database pool usage.
+
+    Shows checked-out and overflow connections and checkout wait times for
+    the sync and async engines. Multiply pool_size + max_overflow by the
+    number of API and worker processes to check against Postgres
+    max_connections.
+    """
+    return APIResponse(
+        status="success",
+        data=get_pool_metrics(),
+        message="Database pool metrics retrieved successfully"
+    )
+
+@router.get("/circuit-breakers", response_model=APIResponse[Dict[str, Any]])
+def get_circuit_breakers(
+    current_user: User = Depends(require_admin)
+):
+    """
+    Report the provider circuit breakers shared by all workers.
+
+    Providers with no recent failures are closed and not listed. For open
+    breakers, retry_in is the number of seconds until a probe send is
+    allowed. Answers 503 if Redis cannot be reached. Declared without
+    async so the Redis calls run in the threadpool.
+    """
+    states = circuit_breaker.states()
+    if states is None:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content=APIResponse(
+                status="error",
+                data=None,
+                message="Circuit breaker states are unavailable: Redis cannot be reached"
+            ).model_dump()
+        )
+
+    return APIResponse(
+        status="success",
+        data=states,
+        message="Circuit breaker states retrieved successfully"
+    )
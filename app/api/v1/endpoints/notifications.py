@@ -7,6 +7,7 @@ from uuid import UUID
 
 # Third-party imports
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi.responses import StreamingResponse
 import pytz
 from sqlalchemy.orm import Session
 
@@ -14,20 +15,30 @@ from sqlalchemy.orm import Session
 from app.core.auth import get_current_user, require_admin
 from app.core.exceptions import InvalidScheduleError
 from app.core.logging_config import logger
+from app.core.pagination import InvalidCursorError, decode_cursor, encode_cursor
 from app.db.session import get_db
 from app.models.delivery_status import DeliveryStatus
 from app.models.notification import Notification
 from app.models.template import NotificationTemplate
 from app.models.user import User
 from app.models.user_preference import UserPreference
-from app.schemas.common import APIResponse
+from app.schemas.common import APIResponse, CursorPage
 from app.schemas.notification import (
     DeliveryStatusResponse,
+    NotificationBatchCreate,
+    NotificationBatchResponse,
     NotificationCreate,
     NotificationDetails,
     NotificationResponse,
     NotificationUpdate,
 )
+from app.services.notification_export import (
+    MEDIA_TYPES,
+    ExportFormat,
+    build_export_query,
+    stream_export,
+)
+from app.services.notification_service import NotificationService
 
 # Router initialization
 router = APIRouter()
@@ -95,25 +106,15 @@ async def create_notification(
 
         # Validate and convert scheduled_for time
         try:
-            if notification.scheduled_for:
-                if notification.scheduled_for.tzinfo is not None:
-                    scheduled_for_utc = notification.scheduled_for.astimezone(pytz.UTC)
-                else:
-                    local_dt = user_tz.localize(notification.scheduled_for)
-                    scheduled_for_utc = local_dt.astimezone(pytz.UTC)
-
-                # Check if scheduled time is in the past
-                if scheduled_for_utc < datetime.now(pytz.UTC):
-                    log.warning("past_schedule_attempted", 
-                        scheduled_for=scheduled_for_utc.isoformat()
-                    )
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail="Cannot schedule notifications in the past. Please provide a future date and time."
-                    )
-            else:
-                scheduled_for_utc = datetime.now(pytz.UTC)
-
+            scheduled_for_utc = NotificationService.resolve_scheduled_for(
+                notification.scheduled_for, user_tz
+            )
+        except InvalidScheduleError as e:
+            log.warning("past_schedule_attempted", **e.details)
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=e.message
+            )
         except ValueError as e:
             log.error("invalid_datetime", error=str(e))
             raise HTTPException(
@@ -121,6 +122,15 @@ async def create_notification(
                 detail=f"Invalid datetime format: {str(e)}"
             )
 
+        # Hold the send until the user's quiet hours are over
+        if user_preferences:
+            scheduled_for_utc = NotificationService.apply_quiet_hours(
+                scheduled_for_utc,
+                user_tz,
+                user_preferences.quiet_hours_start,
+                user_preferences.quiet_hours_end
+            )
+
         # Render template content
         try:
             rendered_content = template.render(notification.variables)
@@ -141,7 +151,8 @@ async def create_notification(
             scheduled_for=scheduled_for_utc,
             timezone=user_timezone,
             content=rendered_content,
-            status="pending"
+            status="pending",
+            **NotificationService.contact_snapshot(notification.channel, target_user, template)
         )
         
         try:
@@ -179,6 +190,75 @@ async def create_notification(
             detail=f"Error creating notification: {str(e)}"
         )
     
+@router.post("/batch", response_model=APIResponse[NotificationBatchResponse], status_code=status.HTTP_201_CREATED)
+async def create_notifications_batch(
+    *,
+    db: Session = Depends(get_db),
+    batch: NotificationBatchCreate,
+    current_user: User = Depends(require_admin)
+):
+    """Create many notifications at once, reporting success or failure per item. Only admins can create notifications."""
+    log = logger.bind(
+        user_id=str(current_user.id),
+        batch_size=len(batch.notifications)
+    )
+    log.info("creating_notification_batch")
+
+    try:
+        results = await NotificationService.create_notifications_batch(db, batch.notifications)
+    except Exception as e:
+        db.rollback()
+        log.error("error_creating_notification_batch", error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to save notification batch"
+        )
+
+    created = sum(1 for result in results if result.success)
+    failed = len(results) - created
+    log.info("notification_batch_created", created=created, failed=failed)
+
+    return APIResponse(
+        status="success",
+        data=NotificationBatchResponse(created=created, failed=failed, results=results),
+        message=f"Created {created} of {len(results)} notifications"
+    )
+
+@router.get("/export")
+async def export_notifications(
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    include_delivery: bool = Query(False, description="Add one row per delivery attempt"),
+    status_filter: Optional[str] = Query(None, alias="status", description="Filter by notification status"),
+    channel: Optional[str] = Query(None, description="Filter by notification channel"),
+    created_from: Optional[datetime] = Query(None, description="Only notifications created at or after this time"),
+    created_to: Optional[datetime] = Query(None, description="Only notifications created before this time"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Stream matching notifications as NDJSON or CSV.
+
+    Rows are read with a server-side cursor and written as they arrive, so
+    exports of any size run in constant memory. Times are exported in UTC.
+    """
+    stmt = build_export_query(
+        current_user,
+        include_delivery=include_delivery,
+        status=status_filter,
+        channel=channel,
+        created_from=created_from,
+        created_to=created_to
+    )
+    filename = f"notifications-{datetime.now(pytz.UTC):%Y%m%dT%H%M%SZ}.{export_format.value}"
+
+    # The request session is closed when this handler returns; stream_export
+    # reopens it for the cursor and closes it once the body is finished.
+    return StreamingResponse(
+        stream_export(db, stmt, export_format),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
 @router.get("/{notification_id}", response_model=APIResponse[NotificationDetails])
 async def get_notification(
     notification_id: UUID = Path(..., title="The ID of the notification to get"),
@@ -279,6 +359,28 @@ async def update_notification(
         for key, value in update_data.items():
             setattr(db_notification, key, value)
 
+        if 'template_id' in update_data or 'channel' in update_data:
+            snapshot = NotificationService.contact_snapshot(
+                db_notification.channel,
+                db_notification.user,
+                template if 'template_id' in update_data else db_notification.template
+            )
+            for key, value in snapshot.items():
+                setattr(db_notification, key, value)
+
+        if 'scheduled_for' in update_data or 'channel' in update_data:
+            preference = db.query(UserPreference).filter(
+                UserPreference.user_id == db_notification.user_id,
+                UserPreference.channel == db_notification.channel
+            ).first()
+            if preference and db_notification.scheduled_for:
+                db_notification.scheduled_for = NotificationService.apply_quiet_hours(
+                    db_notification.scheduled_for,
+                    pytz.timezone(db_notification.timezone or 'UTC'),
+                    preference.quiet_hours_start,
+                    preference.quiet_hours_end
+                )
+
         db.commit()
         db.refresh(db_notification)
 
@@ -347,29 +449,40 @@ async def delete_notification(
         )
     
 
-@router.get("/", response_model=APIResponse[List[NotificationResponse]])
+@router.get("/", response_model=CursorPage[NotificationResponse])
 async def list_notifications(
-    skip: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Opaque cursor returned as next_cursor by the previous page"),
     limit: int = Query(10, ge=1, le=100),
-    status: Optional[str] = Query(None, description="Filter by notification status"),
+    status_filter: Optional[str] = Query(None, alias="status", description="Filter by notification status"),
+    channel: Optional[str] = Query(None, description="Filter by notification channel"),
+    created_from: Optional[datetime] = Query(None, description="Only notifications created at or after this time"),
+    created_to: Optional[datetime] = Query(None, description="Only notifications created before this time"),
+    skip: int = Query(0, ge=0, deprecated=True, description="Offset pagination; use cursor instead"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """List notifications with pagination and optional status filter."""
+    """List notifications newest first with cursor pagination and optional filters."""
     try:
-        query = db.query(Notification)
-        
-        # If not admin, only show user's notifications
-        if not current_user.is_admin:
-            query = query.filter(Notification.user_id == current_user.id)
-            
-        # Apply status filter if provided
-        if status:
-            query = query.filter(Notification.status == status)
-            
-        # Apply pagination
-        query = query.offset(skip).limit(limit)
-        notifications = query.all()
+        after = decode_cursor(cursor) if cursor else None
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    try:
+        query = NotificationService.filter_notifications(
+            db.query(Notification),
+            user=current_user,
+            status=status_filter,
+            channel=channel,
+            created_from=created_from,
+            created_to=created_to
+        )
+        if skip and after is None:
+            query = query.offset(skip)
+
+        notifications, has_more = NotificationService.paginate_notifications(query, limit, after)
         
         # Convert times to user timezones
         response_notifications = []
@@ -383,11 +496,17 @@ async def list_notifications(
                 notification_dict['sent_at'] = notification.sent_at.astimezone(user_tz)
                 
             response_notifications.append(notification_dict)
+
+        next_cursor = None
+        if has_more:
+            last = notifications[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
             
-        return APIResponse(
+        return CursorPage(
             status="success",
             data=response_notifications,
-            message=f"Retrieved {len(notifications)} notifications"
+            message=f"Retrieved {len(notifications)} notifications",
+            next_cursor=next_cursor
         )
         
     except Exception as e:
@@ -6,11 +6,11 @@ from typing import List
 # Third-party imports
 from fastapi import APIRouter, Depends, status
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # Local application imports
 from app.core.auth import get_current_user
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.models.user import User
 from app.schemas.common import APIResponse
 from app.schemas.preference import (
@@ -26,7 +26,7 @@ router = APIRouter()
 @router.post("/", response_model=APIResponse[PreferenceResponse], status_code=status.HTTP_201_CREATED)
 async def create_preference(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     preference: PreferenceCreate,
     current_user: User = Depends(get_current_user)
 ):
@@ -82,7 +82,7 @@ async def create_preference(
 
 @router.get("/", response_model=APIResponse[List[PreferenceResponse]])
 async def get_preferences(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get all notification preferences for the current user."""
@@ -108,7 +108,7 @@ async def get_preferences(
 @router.get("/{channel}", response_model=APIResponse[PreferenceResponse])
 async def get_preference(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     channel: str,
     current_user: User = Depends(get_current_user)
 ):
@@ -143,7 +143,7 @@ async def get_preference(
 @router.put("/{channel}", response_model=APIResponse[PreferenceResponse])
 async def update_preference(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     channel: str,
     preference: PreferenceUpdate,
     current_user: User = Depends(get_current_user)
@@ -186,7 +186,7 @@ async def update_preference(
 @router.delete("/{channel}", response_model=APIResponse[dict])
 async def delete_preference(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     channel: str,
     current_user: User = Depends(get_current_user)
 ):
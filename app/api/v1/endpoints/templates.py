@@ -7,13 +7,12 @@ from uuid import UUID
 
 # Third-party imports
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # Local application imports
 from app.core.auth import get_current_user, require_admin
 from app.core.logging_config import logger
-from app.db.session import get_db
-from app.models.template import NotificationTemplate
+from app.db.session import get_async_db
 from app.models.user import User
 from app.schemas.common import APIResponse
 from app.schemas.template import (
@@ -32,7 +31,7 @@ MAX_CONTENT_LENGTH = 10000
 @router.post("/", response_model=APIResponse[TemplateResponse], status_code=status.HTTP_201_CREATED)
 async def create_template(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     template: TemplateCreate,
     current_user: User = Depends(require_admin)
 ):
@@ -107,7 +106,7 @@ from fastapi import HTTPException
 @router.get("/{template_id}", response_model=APIResponse[TemplateResponse])
 async def get_template(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     template_id: str,
 ):
     """Get a notification template by ID."""
@@ -123,9 +122,7 @@ async def get_template(
             )
 
         # Query template
-        template = db.query(NotificationTemplate).filter(
-            NotificationTemplate.id == template_id
-        ).first()
+        template = await TemplateService.get_template(db, template_id)
 
         if not template:
             raise HTTPException(
@@ -152,7 +149,7 @@ async def get_template(
 @router.put("/{template_id}", response_model=APIResponse[TemplateResponse])
 async def update_template(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     template_id: str,
     template_update: TemplateUpdate,
     current_user: User = Depends(require_admin)
@@ -266,7 +263,7 @@ async def update_template(
 @router.delete("/{template_id}", response_model=APIResponse[dict])
 async def delete_template(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     template_id: str,
     current_user: User = Depends(require_admin)
 ):
@@ -5,16 +5,17 @@ from datetime import timedelta
 from typing import Dict, Optional
 
 # Third-party imports
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # Local application imports
 from app.core.auth import create_access_token, get_current_user
 from app.core.config import settings
 from app.core.logging_config import logger
-from app.db.session import get_db
+from app.core.security import login_limiter
+from app.db.session import get_async_db
 from app.models.user import User
 from app.schemas.common import APIResponse
 from app.schemas.user import (
@@ -35,7 +36,7 @@ from fastapi.responses import JSONResponse
 @router.post("/register", response_model=APIResponse[UserWithToken], status_code=status.HTTP_201_CREATED)
 async def register_user(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_in: UserCreate
 ):
     """Register a new user"""
@@ -113,7 +114,8 @@ async def register_user(
 
 @router.post("/login", response_model=APIResponse[Token])
 async def login(
-    db: Session = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
     form_data: OAuth2PasswordRequestForm = Depends()
 ):
     """Authenticate user and return token"""
@@ -125,6 +127,22 @@ async def login(
                 message="Email and password are required"
             )
 
+        # Throttle repeated failures per account and client address
+        client_host = request.client.host if request.client else "unknown"
+        limiter_key = f"{form_data.username.lower()}|{client_host}"
+        retry_after = login_limiter.retry_after(limiter_key)
+        if retry_after:
+            logger.warning(f"Login throttled for {form_data.username} from {client_host}")
+            return JSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                headers={"Retry-After": str(int(retry_after) + 1)},
+                content=APIResponse(
+                    status="error",
+                    data=None,
+                    message="Too many failed login attempts. Please try again later"
+                ).model_dump()
+            )
+
         user = await UserService.authenticate_user(
             db=db,
             email=form_data.username,
@@ -132,11 +150,14 @@ async def login(
         )
         
         if not user:
+            login_limiter.record_failure(limiter_key)
             return APIResponse(
                 status="error",
                 data=None,
                 message="Invalid email or password"
             )
+
+        login_limiter.reset(limiter_key)
         
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = create_access_token(
@@ -196,7 +217,7 @@ async def get_user_profile(
 @router.put("/me", response_model=APIResponse[UserResponse])
 async def update_user_profile(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_update: UserUpdate,
     current_user: User = Depends(get_current_user)
 ):
@@ -249,7 +270,7 @@ async def update_user_profile(
 @router.delete("/me", response_model=APIResponse[Dict])
 async def delete_user_profile(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """Delete current user account"""
@@ -5,6 +5,7 @@ from fastapi import APIRouter
 
 # Local application imports
 from app.api.v1.endpoints import (
+    admin,
     notifications,
     preferences,
     templates,
@@ -37,4 +38,10 @@ api_router.include_router(
     preferences.router,
     prefix="/preferences",
     tags=["preferences"]
-)
\ No newline at end of file
+)
+
+api_router.include_router(
+    admin.router,
+    prefix="/admin",
+    tags=["admin"]
+)
@@ -9,12 +9,15 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 # Local application imports
 from app.core.config import settings
 from app.core.logging_config import logger
-from app.db.session import get_db
+from app.core.user_cache import user_cache
+from app.db.session import get_async_db
 from app.models.user import User
 
 # Authentication configuration
@@ -44,7 +47,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 async def get_current_user(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     token: str = Depends(oauth2_scheme)
 ) -> User:
     def create_auth_exception(detail: str) -> HTTPException:
@@ -79,8 +82,16 @@ async def get_current_user(
             logger.warning("Token missing user ID")
             raise create_auth_exception("Invalid token: missing user identifier")
 
-        # Check user exists
-        user = db.query(User).filter(User.id == user_id).first()
+        # Check user exists, skipping the query while the user is cached
+        user = await user_cache.get(user_id)
+        if user is not None:
+            user = await db.merge(user, load=False)
+        else:
+            user = await db.scalar(
+                select(User).where(User.id == user_id).options(selectinload(User.preferences))
+            )
+            if user is not None:
+                await user_cache.set(user)
         if user is None:
             logger.warning(f"Token references non-existent user: {user_id}")
             raise create_auth_exception("User no longer exists or has been deactivated")
@@ -1,5 +1,6 @@
 # app/core/celery.py
 from celery import Celery
+from kombu import Queue
 from app.core.config import settings
 
 celery_app = Celery(
@@ -8,6 +9,59 @@ celery_app = Celery(
     backend=settings.REDIS_URL
 )
 
+# Notification priorities run from 1 (lowest) to 5 (highest). Each priority
+# band gets its own queue per channel, so a large low-priority email blast
+# never sits in front of a high-priority SMS.
+PRIORITY_BANDS = (
+    ("high", 4),
+    ("default", 2),
+    ("low", 1),
+)
+MAX_PRIORITY = 5
+NOTIFICATION_CHANNELS = ("email", "sms", "push")
+# Queue family shared by every other channel, e.g. plugin senders
+OTHER_CHANNELS = "other"
+
+def priority_band(priority: int) -> str:
+    """Return the band name for a notification priority."""
+    for band, minimum in PRIORITY_BANDS:
+        if priority >= minimum:
+            return band
+    return PRIORITY_BANDS[-1][0]
+
+def queue_for(channel: str, priority: int) -> str:
+    """
+    Return the queue a notification of this channel and priority is delivered from.
+
+    Channels without queues of their own, such as plugin channels or an
+    unrecognised value, share the notifications.other.* queues, so a worker
+    still picks them up and either delivers them or records the failure.
+    """
+    channel = channel.lower()
+    if channel not in NOTIFICATION_CHANNELS:
+        channel = OTHER_CHANNELS
+    return f"notifications.{channel}.{priority_band(priority)}"
+
+def broker_priority(priority: int) -> int:
+    """Map a notification priority onto the Redis transport, where 0 is consumed first."""
+    return MAX_PRIORITY - min(max(priority, 1), MAX_PRIORITY)
+
+def route_notification_task(name, args, kwargs, options, task=None, **kw):
+    """
+    Route send_notification_batch messages that were sent without an explicit queue.
+
+    Reads the channel from the task arguments and the band from the message
+    priority. Returns None for other tasks, so they keep the default queue.
+    """
+    if name != "send_notification_batch" or options.get("queue"):
+        return None
+    channel = args[0] if args else kwargs.get("channel")
+    if not channel:
+        return None
+    priority = options.get("priority")
+    band_priority = MAX_PRIORITY - priority if priority is not None else 1
+    return {"queue": queue_for(channel, band_priority)}
+
 celery_app.conf.update(
     task_serializer='json',
     accept_content=['json'],
@@ -16,5 +70,20 @@ celery_app.conf.update(
     enable_utc=True,
     task_track_started=True,
     task_time_limit=30 * 60,  # 30 minutes
-    broker_connection_retry_on_startup=True
-)
\ No newline at end of file
+    broker_connection_retry_on_startup=True,
+    task_queues=[Queue("celery")] + [
+        Queue(queue_for(channel, minimum))
+        for channel in NOTIFICATION_CHANNELS + (OTHER_CHANNELS,)
+        for _, minimum in PRIORITY_BANDS
+    ],
+    task_routes=(route_notification_task,),
+    # Order messages within each queue by priority. Across queues, workers
+    # keep the default round-robin, so no queue they consume is starved.
+    broker_transport_options={
+        "priority_steps": list(range(MAX_PRIORITY + 1)),
+        "sep": ":",
+    },
+    # Take one message at a time, so a worker busy with a bulk batch does
+    # not hold urgent messages in its prefetch buffer
+    worker_prefetch_multiplier=1
+)
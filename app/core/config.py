@@ -1,5 +1,8 @@
 # app/core/config.py
 
+# Standard library imports
+from typing import Dict, List, Optional
+
 # Third-party imports
 from pydantic_settings import BaseSettings
 
@@ -13,6 +16,18 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str
     POSTGRES_DB: str
 
+    # Database connection pool
+    DB_POOL_PROFILE: str = "api"  # api or worker; worker processes set this at startup
+    DB_POOL_MODE: str = "queue"  # queue, or null when connecting through pgbouncer
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_WORKER_POOL_SIZE: int = 2
+    DB_WORKER_MAX_OVERFLOW: int = 2
+    DB_POOL_TIMEOUT: float = 30.0  # seconds to wait for a pooled connection
+    DB_POOL_RECYCLE: int = 1800  # seconds before a connection is replaced
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_TIMEOUT_MS: int = 30000  # 0 disables
+
     REDIS_URL: str
 
     SMS_PROVIDER_API_KEY: str
@@ -26,6 +41,18 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # 8 days
 
+    # Password hashing and login throttling
+    PASSWORD_HASH_WORKERS: int = 4  # threads running bcrypt off the event loop
+    LOGIN_MAX_FAILURES: int = 5  # failed attempts per email and client within the window; 0 disables
+    LOGIN_FAILURE_WINDOW: float = 300.0  # seconds
+    LOGIN_NEGATIVE_CACHE_TTL: float = 60.0  # seconds a failed email/password pair skips bcrypt; 0 disables
+    LOGIN_TRACKER_SIZE: int = 100000  # keys kept by the limiter and negative cache
+
+    # Authenticated user cache
+    USER_CACHE_BACKEND: str = "memory"  # memory, redis or none
+    USER_CACHE_TTL: float = 30.0  # seconds; bounds staleness after out-of-band changes
+    USER_CACHE_SIZE: int = 10000  # entries per process for the memory backend
+
     # SMTP Configuration
     SMTP_HOST: str = "smtp.gmail.com"
     SMTP_PORT: int = 587
@@ -34,6 +61,70 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: str
     EMAILS_FROM_EMAIL: str
     EMAILS_FROM_NAME: str
+    SMTP_TIMEOUT: float = 30.0
+    SMTP_POOL_SIZE: int = 4  # open SMTP connections per worker process, single and batched sends together
+    SMTP_POOL_IDLE_TIMEOUT: float = 60.0
+    SMTP_POOL_MAX_MESSAGES: int = 100
+    SMTP_ASYNC_CONCURRENCY: int = 8  # connections per email batch, capped by free SMTP_POOL_SIZE slots
+
+    # Push provider
+    PUSH_PROVIDER_URL: str = ""
+    PUSH_PROVIDER_API_KEY: str = ""
+    PUSH_HTTP_POOL_SIZE: int = 20
+    PUSH_HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    PUSH_HTTP_CONNECT_TIMEOUT: float = 5.0
+    PUSH_HTTP_READ_TIMEOUT: float = 10.0
+    PUSH_HTTP2: bool = True
+    PUSH_MULTICAST_URL: str = ""
+    PUSH_MULTICAST_MAX_RECIPIENTS: int = 500
+
+    # Provider throttling: token-bucket rates in sends per second, keyed by
+    # bucket, e.g. {"sms": 10, "sms:+15550100": 1, "email:gmail.com": 20, "push": 500}
+    SENDER_RATE_LIMITS: Dict[str, float] = {}
+    SENDER_RATE_BURST: float = 1.0  # seconds of sends a bucket can hold
+
+    # Provider circuit breakers shared by all workers
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 5  # consecutive failed sends that open a breaker
+    CIRCUIT_BREAKER_FAILURE_WINDOW: int = 60  # seconds without failures that reset the count
+    CIRCUIT_BREAKER_RESET_TIMEOUT: int = 30  # seconds open before a probe send is allowed
+
+    # Notification batching
+    NOTIFICATION_BATCH_MAX_ITEMS: int = 5000
+    NOTIFICATION_DISPATCH_BATCH_SIZE: int = 100
+    NOTIFICATION_QUEUED_TIMEOUT: int = 300  # seconds before a queued row is re-dispatched
+    # Seconds before a claimed, unfinished row is re-dispatched. Never less
+    # than the Celery task_time_limit plus a margin, so rows of a task that
+    # is still running are not sent twice; None uses that minimum
+    NOTIFICATION_PROCESSING_TIMEOUT: Optional[int] = None
+    NOTIFICATION_EXPORT_CHUNK_SIZE: int = 1000  # rows fetched per server-side cursor round trip
+
+    # Seconds after which a notification's recipient/subject snapshot is
+    # re-read from the user and template at send time; None never refreshes
+    NOTIFICATION_SNAPSHOT_REFRESH_AFTER: Optional[int] = None
+
+    # Per-user frequency limits (UserPreference.frequency_limit)
+    FREQUENCY_LIMIT_WINDOW: int = 3600  # seconds; frequency_limit is per hour
+
+    # Delivery retries: exponential backoff with full jitter, persisted as scheduled_for
+    RETRY_BASE_DELAY: float = 30.0  # seconds; ceiling for the first retry's delay
+    RETRY_MAX_DELAY: float = 3600.0
+    # SendResult.error_code values that are never retried: Twilio invalid,
+    # unreachable or unsubscribed numbers, and push provider request rejections
+    RETRY_PERMANENT_ERROR_CODES: List[str] = [
+        "21211", "21214", "21408", "21610", "21612", "21614",
+        "400", "404", "410", "413", "422",
+        "UNSUPPORTED_CHANNEL",
+    ]
+
+    # Scheduler
+    SCHEDULER_BATCH_SIZE: int = 1000
+    SCHEDULER_MIN_IDLE: float = 0.25
+    SCHEDULER_MAX_IDLE: float = 10.0
+    SCHEDULER_BEAT_DRAIN_SECONDS: float = 50.0
+
+    # Template rendering
+    TEMPLATE_CACHE_SIZE: int = 512
+    TEMPLATE_BYTECODE_CACHE_DIR: Optional[str] = None
 
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "json"
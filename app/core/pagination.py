@@ -0,0 +1,31 @@
+# app/core/pagination.py
+
+# Standard library imports
+import base64
+from datetime import datetime
+import json
+from typing import Tuple
+from uuid import UUID
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+    pass
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """Encode a (created_at, id) keyset position as an opaque URL-safe token."""
+    payload = json.dumps({"c": created_at.isoformat(), "i": str(row_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode a token produced by encode_cursor.
+
+    Raises:
+        InvalidCursorError: If the token is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["c"]), UUID(payload["i"])
+    except Exception as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
@@ -0,0 +1,148 @@
+# app/core/security.py
+
+# Standard library imports
+import asyncio
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import hmac
+from threading import Lock
+import time
+from typing import Deque, Dict
+
+# Local application imports
+from app.core.auth import get_password_hash, verify_password
+from app.core.config import settings
+
+# bcrypt releases the GIL, so a small thread pool runs hashes in parallel
+# while the event loop keeps serving requests. Its size caps concurrent
+# hashes; further calls queue instead of oversubscribing the CPU.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash"
+)
+
+async def hash_password(password: str) -> str:
+    """Hash a password on the bounded hashing pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, get_password_hash, password)
+
+async def check_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the bounded hashing pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, verify_password, plain_password, hashed_password)
+
+class LoginAttemptLimiter:
+    """
+    In-memory sliding-window limit on failed logins per key.
+
+    Once a key reaches max_failures failures within window seconds, further
+    attempts are refused until the oldest failure leaves the window. At most
+    maxsize keys are tracked; the least recently failed are dropped first.
+    """
+
+    def __init__(self, max_failures: int, window: float, maxsize: int):
+        self.max_failures = max_failures
+        self.window = window
+        self.maxsize = maxsize
+        self._failures: "OrderedDict[str, Deque[float]]" = OrderedDict()
+        self._lock = Lock()
+
+    def retry_after(self, key: str) -> float:
+        """Return seconds until the key may try again, or 0 if it is not blocked."""
+        if self.max_failures <= 0:
+            return 0.0
+        now = time.monotonic()
+        with self._lock:
+            failures = self._failures.get(key)
+            if not failures:
+                return 0.0
+            while failures and failures[0] <= now - self.window:
+                failures.popleft()
+            if not failures:
+                del self._failures[key]
+                return 0.0
+            if len(failures) < self.max_failures:
+                return 0.0
+            return failures[0] + self.window - now
+
+    def record_failure(self, key: str) -> None:
+        if self.max_failures <= 0:
+            return
+        with self._lock:
+            failures = self._failures.setdefault(key, deque(maxlen=self.max_failures))
+            failures.append(time.monotonic())
+            self._failures.move_to_end(key)
+            while len(self._failures) > self.maxsize:
+                self._failures.popitem(last=False)
+
+    def reset(self, key: str) -> None:
+        with self._lock:
+            self._failures.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._failures.clear()
+
+class FailedLoginCache:
+    """
+    Short-lived record of email/password pairs that recently failed.
+
+    Repeating a known-bad pair is rejected without running bcrypt. Each
+    pair is stored as an HMAC digest of the password together with the
+    password hash it failed against, so plaintext passwords never stay in
+    memory and entries stop matching as soon as the stored hash changes.
+    A password changed through any API process therefore takes effect in
+    every process at once, without having to evict entries everywhere.
+    """
+
+    def __init__(self, ttl: float, maxsize: int, secret: str):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._secret = secret.encode("utf-8")
+        self._entries: "OrderedDict[str, Dict[str, float]]" = OrderedDict()
+        self._lock = Lock()
+
+    def _digest(self, password: str, hashed_password: str) -> str:
+        message = f"{hashed_password}\0{password}".encode("utf-8")
+        return hmac.new(self._secret, message, hashlib.sha256).hexdigest()
+
+    def contains(self, email: str, password: str, hashed_password: str) -> bool:
+        if self.ttl <= 0:
+            return False
+        key = email.lower()
+        digest = self._digest(password, hashed_password)
+        with self._lock:
+            expires_at = self._entries.get(key, {}).get(digest)
+            return expires_at is not None and expires_at > time.monotonic()
+
+    def add(self, email: str, password: str, hashed_password: str) -> None:
+        if self.ttl <= 0:
+            return
+        key = email.lower()
+        digest = self._digest(password, hashed_password)
+        now = time.monotonic()
+        with self._lock:
+            entries = self._entries.setdefault(key, {})
+            for stale in [d for d, expires_at in entries.items() if expires_at <= now]:
+                del entries[stale]
+            entries[digest] = now + self.ttl
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+# Process-wide login throttling state
+login_limiter = LoginAttemptLimiter(
+    settings.LOGIN_MAX_FAILURES,
+    settings.LOGIN_FAILURE_WINDOW,
+    settings.LOGIN_TRACKER_SIZE
+)
+failed_login_cache = FailedLoginCache(
+    settings.LOGIN_NEGATIVE_CACHE_TTL,
+    settings.LOGIN_TRACKER_SIZE,
+    settings.JWT_SECRET_KEY
+)
@@ -0,0 +1,83 @@
+# app/core/templating.py
+
+# Standard library imports
+from collections import OrderedDict
+import hashlib
+from threading import Lock
+from typing import Any, Hashable, Optional, Tuple
+
+# Third-party imports
+import jinja2
+
+# Local application imports
+from app.core.config import settings
+
+def _build_bytecode_cache() -> jinja2.BytecodeCache:
+    if settings.TEMPLATE_BYTECODE_CACHE_DIR:
+        return jinja2.FileSystemBytecodeCache(settings.TEMPLATE_BYTECODE_CACHE_DIR)
+    return jinja2.FileSystemBytecodeCache()
+
+# Shared environment for every notification template rendered in this process
+environment = jinja2.Environment(bytecode_cache=_build_bytecode_cache())
+
+class CompiledTemplateCache:
+    """
+    Process-wide LRU cache of compiled Jinja templates.
+
+    Entries are keyed by (template id, version, content hash) so an edited
+    template never reuses a stale compiled form. Compilation goes through the
+    environment's bytecode cache, so a fresh worker process skips the parse
+    step for templates another process has already compiled.
+    """
+
+    def __init__(self, env: jinja2.Environment, maxsize: int):
+        self.env = env
+        self.maxsize = maxsize
+        self._templates: "OrderedDict[Tuple[Hashable, ...], jinja2.Template]" = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def make_key(template_id: Any, version: Optional[int], content: str) -> Tuple[Hashable, ...]:
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return (str(template_id) if template_id is not None else None, version, content_hash)
+
+    def get(self, template_id: Any, version: Optional[int], content: str) -> jinja2.Template:
+        """Return the compiled template for the given source, compiling it on a miss."""
+        key = self.make_key(template_id, version, content)
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                return template
+
+        template = self._compile(key, content)
+
+        with self._lock:
+            self._templates[key] = template
+            self._templates.move_to_end(key)
+            while len(self._templates) > self.maxsize:
+                self._templates.popitem(last=False)
+        return template
+
+    def _compile(self, key: Tuple[Hashable, ...], content: str) -> jinja2.Template:
+        name = ":".join(str(part) for part in key)
+        bytecode_cache = self.env.bytecode_cache
+        if bytecode_cache is None:
+            return self.env.from_string(content)
+
+        bucket = bytecode_cache.get_bucket(self.env, name, None, content)
+        code = bucket.code
+        if code is None:
+            code = self.env.compile(content, name)
+            bucket.code = code
+            bytecode_cache.set_bucket(bucket)
+        return self.env.template_class.from_code(self.env, code, self.env.make_globals(None))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._templates.clear()
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+template_cache = CompiledTemplateCache(environment, maxsize=settings.TEMPLATE_CACHE_SIZE)
@@ -0,0 +1,197 @@
+# app/core/user_cache.py
+
+# Standard library imports
+from collections import OrderedDict
+from datetime import date, datetime, time as time_of_day
+import json
+from threading import Lock
+import time
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+# Third-party imports
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+import redis.asyncio as redis
+
+# Local application imports
+from app.core.config import settings
+from app.core.logging_config import logger
+from app.models.user import User
+from app.models.user_preference import UserPreference
+
+Snapshot = Dict[str, Any]
+
+# User columns kept in the cache: what authorization and the endpoints read
+# from current_user. Credentials such as hashed_password are never cached.
+USER_FIELDS = (
+    "id",
+    "email",
+    "phone",
+    "full_name",
+    "default_timezone",
+    "is_verified",
+    "is_admin",
+    "is_active",
+    "created_at",
+    "updated_at",
+)
+
+def _columns(instance, fields=None) -> Snapshot:
+    keys = fields or [attr.key for attr in inspect(type(instance)).column_attrs]
+    return {key: getattr(instance, key) for key in keys}
+
+def snapshot_user(user: User) -> Snapshot:
+    """Capture a user's cacheable columns and preferences as plain data."""
+    return {
+        "user": _columns(user, USER_FIELDS),
+        "preferences": [_columns(preference) for preference in user.preferences],
+    }
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (date, time_of_day)):
+        return value.isoformat()
+    raise TypeError(f"Cannot cache value of type {type(value).__name__}")
+
+def _decode_columns(model, columns: Snapshot) -> Snapshot:
+    mapper_columns = inspect(model).columns
+    decoded = {}
+    for key, value in columns.items():
+        python_type = mapper_columns[key].type.python_type
+        if value is not None and python_type in (UUID, datetime, date, time_of_day):
+            value = UUID(value) if python_type is UUID else python_type.fromisoformat(value)
+        decoded[key] = value
+    return decoded
+
+def dump_snapshot(snapshot: Snapshot) -> str:
+    """Serialize a snapshot as JSON for the shared cache."""
+    return json.dumps(snapshot, default=_encode_value)
+
+def load_snapshot(payload: Any) -> Snapshot:
+    """Parse a JSON snapshot, restoring UUID, date and time column values."""
+    data = json.loads(payload)
+    return {
+        "user": _decode_columns(User, data["user"]),
+        "preferences": [_decode_columns(UserPreference, columns) for columns in data["preferences"]],
+    }
+
+def restore_user(snapshot: Snapshot) -> User:
+    """
+    Rebuild a detached User from a snapshot.
+
+    The result carries its identity key, so Session.merge(load=False) can
+    attach it to a session without a SELECT. Columns left out of the
+    snapshot, such as hashed_password, are expired and load on access.
+    """
+    user = User(**snapshot["user"])
+    user.preferences = [UserPreference(**columns) for columns in snapshot["preferences"]]
+    for preference in user.preferences:
+        make_transient_to_detached(preference)
+    make_transient_to_detached(user)
+    return user
+
+class UserCache:
+    """
+    Short-lived cache of the users that get_current_user loads.
+
+    Users are stored as snapshots, not ORM instances, so every request gets
+    its own object. The memory backend is a per-process LRU bounded by
+    maxsize. The redis backend is shared by all processes, so an
+    invalidation reaches every API worker at once and snapshots are stored
+    as JSON. Either way entries expire after ttl seconds, which bounds
+    staleness after changes made outside UserService and PreferenceService.
+    """
+
+    KEY_PREFIX = "user_cache:"
+
+    def __init__(self, backend: str, ttl: float, maxsize: int, redis_url: Optional[str] = None):
+        self.backend = backend if ttl > 0 else "none"
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[float, Snapshot]]" = OrderedDict()
+        self._lock = Lock()
+        self._redis = redis.Redis.from_url(redis_url) if self.backend == "redis" and redis_url else None
+        if self.backend == "redis" and self._redis is None:
+            self.backend = "none"
+
+    async def get(self, user_id: Any) -> Optional[User]:
+        """Return a detached copy of the cached user, or None on a miss."""
+        snapshot = await self._get_snapshot(str(user_id))
+        return restore_user(snapshot) if snapshot is not None else None
+
+    async def set(self, user: User) -> None:
+        if self.backend == "none":
+            return
+        await self._set_snapshot(str(user.id), snapshot_user(user))
+
+    async def invalidate(self, user_id: Any) -> None:
+        """Drop a user so the next request reloads it from the database."""
+        key = str(user_id)
+        with self._lock:
+            self._entries.pop(key, None)
+        if self._redis is not None:
+            try:
+                await self._redis.delete(self.KEY_PREFIX + key)
+            except redis.RedisError as e:
+                logger.error("user_cache_invalidate_failed", user_id=key, error=str(e))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    async def _get_snapshot(self, key: str) -> Optional[Snapshot]:
+        if self.backend == "memory":
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None:
+                    return None
+                expires_at, snapshot = entry
+                if expires_at <= time.monotonic():
+                    del self._entries[key]
+                    return None
+                self._entries.move_to_end(key)
+                return snapshot
+
+        if self._redis is not None:
+            try:
+                payload = await self._redis.get(self.KEY_PREFIX + key)
+            except redis.RedisError as e:
+                logger.warning("user_cache_unavailable", error=str(e))
+                return None
+            if payload is None:
+                return None
+            try:
+                return load_snapshot(payload)
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning("user_cache_entry_invalid", user_id=key, error=str(e))
+                return None
+
+        return None
+
+    async def _set_snapshot(self, key: str, snapshot: Snapshot) -> None:
+        if self.backend == "memory":
+            with self._lock:
+                self._entries[key] = (time.monotonic() + self.ttl, snapshot)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+            return
+
+        if self._redis is not None:
+            try:
+                await self._redis.set(self.KEY_PREFIX + key, dump_snapshot(snapshot), px=int(self.ttl * 1000))
+            except redis.RedisError as e:
+                logger.warning("user_cache_unavailable", error=str(e))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+# Process-wide cache used by get_current_user
+user_cache = UserCache(
+    settings.USER_CACHE_BACKEND,
+    settings.USER_CACHE_TTL,
+    settings.USER_CACHE_SIZE,
+    redis_url=settings.REDIS_URL
+)
@@ -0,0 +1,77 @@
+# app/db/pool.py
+
+# Standard library imports
+from threading import Lock
+import time
+from typing import Any, Dict
+
+# Third-party imports
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool, QueuePool
+
+class PoolWaitMetricsMixin:
+    """
+    Record how long checkouts wait for a pooled connection.
+
+    Wait time covers queueing for a free connection and, when the pool has
+    overflow headroom, opening a new one. Timeouts count checkouts that gave
+    up after pool_timeout seconds.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._metrics_lock = Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            with self._metrics_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._metrics_lock:
+                self.checkouts += 1
+                self.total_wait += waited
+                self.max_wait = max(self.max_wait, waited)
+
+class InstrumentedQueuePool(PoolWaitMetricsMixin, QueuePool):
+    """QueuePool that records checkout wait times."""
+
+class InstrumentedAsyncQueuePool(PoolWaitMetricsMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout wait times."""
+
+def pool_metrics(pool: Pool) -> Dict[str, Any]:
+    """
+    Snapshot a pool's occupancy and checkout wait statistics.
+
+    NullPool opens a connection per checkout, so only its type is reported;
+    size it on the pgbouncer side instead.
+    """
+    if isinstance(pool, NullPool):
+        return {"pool": "null"}
+
+    metrics: Dict[str, Any] = {
+        "pool": "queue",
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": pool._max_overflow,
+        "timeout": pool.timeout(),
+    }
+    if isinstance(pool, PoolWaitMetricsMixin):
+        with pool._metrics_lock:
+            metrics.update({
+                "checkouts": pool.checkouts,
+                "timeouts": pool.timeouts,
+                "avg_wait_ms": round(pool.total_wait / pool.checkouts * 1000, 3) if pool.checkouts else 0.0,
+                "max_wait_ms": round(pool.max_wait * 1000, 3),
+            })
+    return metrics
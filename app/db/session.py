@@ -1,21 +1,88 @@
 # app/db/session.py
-from typing import Generator
+from typing import Any, AsyncGenerator, Dict, Generator
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import NullPool
 from app.core.config import settings
+from app.db.pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool, pool_metrics
+
+DATABASE_CREDENTIALS = f"{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}@{settings.POSTGRES_SERVER}/{settings.POSTGRES_DB}"
+
+def engine_options(async_driver: bool = False) -> Dict[str, Any]:
+    """
+    Build create_engine keyword arguments for the configured pool mode and profile.
+
+    In null mode every checkout opens a fresh connection to pgbouncer, which
+    does the pooling. Startup options are not sent, as pgbouncer rejects
+    them; set statement_timeout on the database role instead. asyncpg's
+    prepared statement caches are disabled, because in transaction pooling
+    mode consecutive statements may run on different server connections.
+
+    In queue mode the API profile keeps a larger pool for concurrent requests.
+    The worker profile keeps a small one, since each Celery process handles
+    one task at a time.
+    """
+    if settings.DB_POOL_MODE == "null":
+        options: Dict[str, Any] = {"poolclass": NullPool}
+        if async_driver:
+            options["connect_args"] = {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+        return options
+
+    if settings.DB_POOL_PROFILE == "worker":
+        pool_size, max_overflow = settings.DB_WORKER_POOL_SIZE, settings.DB_WORKER_MAX_OVERFLOW
+    else:
+        pool_size, max_overflow = settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW
+
+    options = {
+        "poolclass": InstrumentedAsyncQueuePool if async_driver else InstrumentedQueuePool,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    if settings.DB_STATEMENT_TIMEOUT_MS:
+        if async_driver:
+            options["connect_args"] = {"server_settings": {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"}
+    return options
 
 # Create database engine
-engine = create_engine(
-    f"postgresql://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}@{settings.POSTGRES_SERVER}/{settings.POSTGRES_DB}"
-)
+engine = create_engine(f"postgresql://{DATABASE_CREDENTIALS}", **engine_options())
 
 # Create sessionmaker
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for request handlers, so queries don't block the event loop
+async_engine = create_async_engine(f"postgresql+asyncpg://{DATABASE_CREDENTIALS}", **engine_options(async_driver=True))
+
+# Objects stay readable after commit; lazy loads are not available on AsyncSession
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+def get_pool_metrics() -> Dict[str, Any]:
+    """Report occupancy and wait statistics for this process's connection pools."""
+    return {
+        "profile": settings.DB_POOL_PROFILE,
+        "mode": settings.DB_POOL_MODE,
+        "sync": pool_metrics(engine.pool),
+        "async": pool_metrics(async_engine.pool),
+    }
+
 # Dependency to get DB session
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+# Dependency to get an async DB session
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
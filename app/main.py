@@ -67,7 +67,7 @@ def custom_openapi():
                 continue
 
             # Add JWT security requirement to all protected endpoints
-            if any(protected_path in path for protected_path in ["/notifications", "/templates", "/preferences", "/users"]):
+            if any(protected_path in path for protected_path in ["/notifications", "/templates", "/preferences", "/users", "/admin"]):
                 endpoint["security"] = [{"BearerAuth": []}]
                 
                 # Add security requirement to the endpoint description
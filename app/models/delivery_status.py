@@ -10,7 +10,7 @@ from .base import Base
 
 class DeliveryStatus(Base):
     """Tracks individual delivery attempts and their outcomes"""
-    notification_id = Column(UUID(as_uuid=True), ForeignKey('notification.id'), nullable=False)
+    notification_id = Column(UUID(as_uuid=True), ForeignKey('notification.id'), nullable=False, index=True)
     attempt_number = Column(Integer, nullable=False)
     status = Column(String(20), nullable=False)  # success, failed
     provider_response = Column(JSON)
@@ -1,7 +1,7 @@
 # app/models/notification.py
 
 # Third-party imports
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, JSON, String, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, JSON, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -13,7 +13,7 @@ class Notification(Base):
     Represents a notification to be sent to a user.
     """
     user_id = Column(UUID(as_uuid=True), ForeignKey('user.id'), nullable=False)
-    template_id = Column(UUID(as_uuid=True), ForeignKey('notificationtemplate.id'), nullable=False)
+    template_id = Column(UUID(as_uuid=True), ForeignKey('notificationtemplate.id'), nullable=False, index=True)
     channel = Column(String(20), nullable=False)
     content = Column(Text, nullable=False)
     variables = Column(JSON)
@@ -26,8 +26,33 @@ class Notification(Base):
     max_retries = Column(Integer, default=3)
     error_message = Column(Text)
     notification_metadata = Column(JSON)
+    # Contact snapshot taken at creation so sends need only this row
+    recipient = Column(String(255))
+    subject = Column(String(100))
     
     # Relationships
     user = relationship("User", back_populates="notifications")
     template = relationship("NotificationTemplate", back_populates="notifications")
     delivery_statuses = relationship("DeliveryStatus", back_populates="notification", cascade="all, delete-orphan")
+
+    # Indexes
+    __table_args__ = (
+        # Scheduler polling: due pending rows, oldest first
+        Index(
+            'ix_notification_pending_due',
+            'scheduled_for',
+            'priority',
+            postgresql_where=text("status = 'pending'")
+        ),
+        # Re-dispatch of rows whose broker message was lost
+        Index(
+            'ix_notification_queued_updated_at',
+            'updated_at',
+            postgresql_where=text("status = 'queued'")
+        ),
+        # Keyset pagination for GET /notifications, newest first; the user_id
+        # index also serves plain user_id lookups and the foreign key
+        Index('ix_notification_created_at_id', 'created_at', 'id'),
+        Index('ix_notification_user_created_at_id', 'user_id', 'created_at', 'id'),
+        Index('ix_notification_status_created_at_id', 'status', 'created_at', 'id'),
+    )
@@ -6,6 +6,7 @@ from sqlalchemy import Column, Integer, JSON, String, Text, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 # Local application imports
+from app.core.templating import template_cache
 from .base import Base
 
 class NotificationTemplate(Base):
@@ -23,7 +24,7 @@ class NotificationTemplate(Base):
     def render(self, variables: dict) -> str:
         """Render template with given variables"""
         try:
-            template = jinja2.Template(self.content)
+            template = template_cache.get(self.id, self.version, self.content)
             return template.render(**variables)
         except jinja2.TemplateError as e:
             raise ValueError(f"Template rendering error: {str(e)}")
@@ -22,4 +22,13 @@ class APIResponse(BaseModel, Generic[T]):
     """
     status: str
     data: Optional[T] = None
-    message: str
\ No newline at end of file
+    message: str
+
+class CursorPage(APIResponse[List[T]], Generic[T]):
+    """
+    API response wrapper for keyset-paginated lists.
+
+    Attributes:
+        next_cursor (Optional[str]): Opaque cursor for the next page, or None on the last page
+    """
+    next_cursor: Optional[str] = None
@@ -3,12 +3,15 @@
 # Standard library imports
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 # Third-party imports
 from pydantic import BaseModel, Field
 
+# Local application imports
+from app.core.config import settings
+
 class NotificationBase(BaseModel):
     channel: str = Field(..., description="Notification channel (email, sms, push)")
     variables: Dict[str, Any] = Field(default_factory=dict)
@@ -19,6 +22,24 @@ class NotificationCreate(NotificationBase):
     user_id: UUID
     template_id: UUID
 
+class NotificationBatchCreate(BaseModel):
+    notifications: List[NotificationCreate] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.NOTIFICATION_BATCH_MAX_ITEMS
+    )
+
+class NotificationBatchItemResult(BaseModel):
+    index: int
+    success: bool
+    notification_id: Optional[UUID] = None
+    error: Optional[str] = None
+
+class NotificationBatchResponse(BaseModel):
+    created: int
+    failed: int
+    results: List[NotificationBatchItemResult]
+
 class NotificationUpdate(BaseModel):
     template_id: Optional[UUID] = None
     channel: Optional[str] = None
@@ -62,6 +83,7 @@ class NotificationChannel(str, Enum):
     
 class NotificationStatus(str, Enum):
     PENDING = "pending"
+    QUEUED = "queued"
     PROCESSING = "processing" 
     SENT = "sent"
     FAILED = "failed"
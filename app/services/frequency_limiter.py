@@ -0,0 +1,134 @@
+# app/services/frequency_limiter.py
+
+# Standard library imports
+import time
+from typing import Any, List, Optional, Sequence, Tuple
+
+# Third-party imports
+import redis
+
+# Local application imports
+from app.core.config import settings
+from app.core.logging_config import logger
+
+# Sliding-window log per key, evaluated for every key in one round trip.
+# KEYS: one sorted set per request. ARGV: now_ms, window_ms, then a
+# (limit, member) pair per key. Returns 0 for allowed requests, otherwise
+# the milliseconds until the oldest counted send leaves the window.
+# Keys repeated within a call see each other's increments.
+SLIDING_WINDOW_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local results = {}
+for i, key in ipairs(KEYS) do
+    local limit = tonumber(ARGV[1 + i * 2])
+    local member = ARGV[2 + i * 2]
+    redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+    if redis.call('ZSCORE', key, member) then
+        results[i] = 0
+    elseif redis.call('ZCARD', key) < limit then
+        redis.call('ZADD', key, now, member)
+        redis.call('PEXPIRE', key, window)
+        results[i] = 0
+    else
+        local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+        results[i] = math.max(tonumber(oldest[2]) + window - now, 1)
+    end
+end
+return results
+"""
+
+FrequencyCheck = Tuple[Any, str, Optional[int], Any]
+
+class FrequencyLimiter:
+    """
+    Enforces UserPreference.frequency_limit with a Redis sliding window.
+
+    Each (user, channel) pair keeps a sorted set of the notifications counted
+    in the last window seconds. Checking and counting happen atomically in a
+    Lua script, so concurrent workers cannot both take the last slot. The
+    notification id is the set member, so a retried notification is not
+    counted twice. A counted notification that is then held back for
+    another reason is released again so it does not use up a slot. If Redis
+    is unreachable, notifications are allowed rather than held back.
+    """
+
+    KEY_PREFIX = "frequency:"
+
+    def __init__(self, client: Optional[redis.Redis] = None, window: Optional[int] = None):
+        self._client = client
+        self.window = window or settings.FREQUENCY_LIMIT_WINDOW
+        self._script = None
+
+    @property
+    def client(self) -> redis.Redis:
+        if self._client is None:
+            self._client = redis.Redis.from_url(settings.REDIS_URL)
+        return self._client
+
+    def check(self, user_id: Any, channel: str, limit: Optional[int], member: Any) -> float:
+        """Check and count one notification; see check_many."""
+        return self.check_many([(user_id, channel, limit, member)])[0]
+
+    def check_many(self, checks: Sequence[FrequencyCheck]) -> List[float]:
+        """
+        Check and count a batch of notifications in one Redis round trip.
+
+        Args:
+            checks: (user_id, channel, frequency_limit, notification_id) tuples;
+                a missing or non-positive limit is always allowed
+
+        Returns:
+            List[float]: Per check, 0 if allowed, otherwise seconds until it may be sent
+        """
+        results = [0.0] * len(checks)
+        keys: List[str] = []
+        args: List[Any] = []
+        positions: List[int] = []
+
+        for index, (user_id, channel, limit, member) in enumerate(checks):
+            if not limit or limit <= 0:
+                continue
+            keys.append(f"{self.KEY_PREFIX}{user_id}:{channel}")
+            args.extend([limit, str(member)])
+            positions.append(index)
+
+        if not keys:
+            return results
+
+        if self._script is None:
+            self._script = self.client.register_script(SLIDING_WINDOW_SCRIPT)
+
+        try:
+            waits = self._script(
+                keys=keys,
+                args=[int(time.time() * 1000), self.window * 1000, *args]
+            )
+        except redis.RedisError as e:
+            logger.warning("frequency_limiter_unavailable", error=str(e), checks=len(keys))
+            return results
+
+        for index, wait_ms in zip(positions, waits):
+            results[index] = int(wait_ms) / 1000
+        return results
+
+    def release(self, entries: Sequence[Tuple[Any, str, Any]]) -> None:
+        """
+        Uncount notifications that were checked but are not being sent now.
+
+        Args:
+            entries: (user_id, channel, notification_id) tuples; entries that
+                were never counted are ignored
+        """
+        if not entries:
+            return
+        pipeline = self.client.pipeline(transaction=False)
+        for user_id, channel, member in entries:
+            pipeline.zrem(f"{self.KEY_PREFIX}{user_id}:{channel}", str(member))
+        try:
+            pipeline.execute()
+        except redis.RedisError as e:
+            logger.warning("frequency_limiter_unavailable", error=str(e), releases=len(entries))
+
+# Process-wide limiter used by the delivery tasks
+frequency_limiter = FrequencyLimiter()
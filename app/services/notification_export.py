@@ -0,0 +1,154 @@
+# app/services/notification_export.py
+
+# Standard library imports
+import csv
+from datetime import datetime
+from enum import Enum
+import io
+import json
+from typing import Any, Dict, Iterator, List, Optional
+from uuid import UUID
+
+# Third-party imports
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+# Local application imports
+from app.core.config import settings
+from app.core.logging_config import logger
+from app.models.delivery_status import DeliveryStatus
+from app.models.notification import Notification
+from app.models.user import User
+from app.services.notification_service import NotificationService
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+NOTIFICATION_COLUMNS = [
+    Notification.id,
+    Notification.user_id,
+    Notification.template_id,
+    Notification.channel,
+    Notification.status,
+    Notification.priority,
+    Notification.scheduled_for,
+    Notification.sent_at,
+    Notification.retry_count,
+    Notification.error_message,
+    Notification.created_at,
+    Notification.updated_at,
+]
+
+DELIVERY_COLUMNS = [
+    DeliveryStatus.id.label("delivery_id"),
+    DeliveryStatus.attempt_number.label("delivery_attempt_number"),
+    DeliveryStatus.status.label("delivery_status"),
+    DeliveryStatus.error_code.label("delivery_error_code"),
+    DeliveryStatus.error_message.label("delivery_error_message"),
+    DeliveryStatus.delivered_at.label("delivery_delivered_at"),
+]
+
+def build_export_query(
+    user: User,
+    include_delivery: bool = False,
+    **filters
+):
+    """
+    Build the column-only SELECT used for exports.
+
+    Plain columns are selected instead of ORM entities so streamed rows are
+    never added to the session's identity map. With include_delivery, each
+    notification is outer-joined to its delivery attempts and yields one row
+    per attempt.
+
+    Args:
+        user: Requesting user; non-admins only see their own notifications
+        include_delivery: Join DeliveryStatus columns onto each row
+        **filters: Filters accepted by NotificationService.filter_notifications
+    """
+    columns = list(NOTIFICATION_COLUMNS)
+    if include_delivery:
+        columns += DELIVERY_COLUMNS
+
+    stmt = select(*columns)
+    if include_delivery:
+        stmt = stmt.outerjoin(DeliveryStatus, DeliveryStatus.notification_id == Notification.id)
+
+    stmt = NotificationService.filter_notifications(stmt, user=user, **filters)
+    order_by = [Notification.created_at, Notification.id]
+    if include_delivery:
+        order_by.append(DeliveryStatus.attempt_number)
+    return stmt.order_by(*order_by)
+
+def _serialize(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+def _encode_ndjson(rows: List[Dict[str, Any]]) -> str:
+    return "".join(
+        json.dumps({key: _serialize(value) for key, value in row.items()}) + "\n"
+        for row in rows
+    )
+
+def _encode_csv(rows: List[Dict[str, Any]]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows([_serialize(value) for value in row.values()] for row in rows)
+    return buffer.getvalue()
+
+def _csv_header(columns: List[str]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(columns)
+    return buffer.getvalue()
+
+ENCODERS = {
+    ExportFormat.NDJSON: _encode_ndjson,
+    ExportFormat.CSV: _encode_csv,
+}
+
+# Formats that open with a header built from the query's column names
+HEADERS = {
+    ExportFormat.CSV: _csv_header,
+}
+
+def stream_export(
+    db: Session,
+    stmt,
+    export_format: ExportFormat,
+    chunk_size: Optional[int] = None
+) -> Iterator[str]:
+    """
+    Stream an export query as NDJSON or CSV text chunks.
+
+    Rows are read through a server-side cursor chunk_size rows at a time and
+    each chunk is encoded and yielded as one piece of the response body, so
+    memory use stays flat regardless of how many rows match. A CSV header
+    is written from the statement's columns before any row is fetched, so
+    an export with no rows still carries one. The session is closed when
+    the stream finishes or the client disconnects.
+    """
+    chunk_size = chunk_size or settings.NOTIFICATION_EXPORT_CHUNK_SIZE
+    encode = ENCODERS[export_format]
+    header = HEADERS.get(export_format)
+    exported = 0
+    try:
+        if header is not None:
+            yield header(list(stmt.selected_columns.keys()))
+        result = db.execute(stmt.execution_options(yield_per=chunk_size))
+        for partition in result.mappings().partitions():
+            yield encode(partition)
+            exported += len(partition)
+    except Exception as e:
+        logger.error("notification_export_failed", exported=exported, error=str(e))
+        raise
+    finally:
+        db.close()
+    logger.info("notification_export_completed", format=export_format.value, rows=exported)
@@ -0,0 +1,306 @@
+# app/services/notification_service.py
+
+# Standard library imports
+from datetime import datetime, time, timedelta
+from typing import List, Optional
+
+# Third-party imports
+import pytz
+from sqlalchemy import insert, tuple_
+from sqlalchemy.orm import Session
+
+# Local application imports
+from app.core.config import settings
+from app.core.exceptions import InvalidScheduleError
+from app.models.notification import Notification
+from app.models.template import NotificationTemplate
+from app.models.user import User
+from app.models.user_preference import UserPreference
+from app.schemas.notification import NotificationBatchItemResult, NotificationCreate
+
+# User attribute each channel delivers to; push addresses the user by id
+RECIPIENT_FIELDS = {"email": "email", "sms": "phone"}
+
+def _to_naive_utc(value: datetime) -> datetime:
+    """created_at is stored as naive UTC; normalise aware filter bounds to match."""
+    if value.tzinfo is not None:
+        return value.astimezone(pytz.UTC).replace(tzinfo=None)
+    return value
+
+class NotificationService:
+    @staticmethod
+    def filter_notifications(
+        query,
+        *,
+        user: User,
+        status: Optional[str] = None,
+        channel: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None
+    ):
+        """Apply visibility rules and list filters to a notification query."""
+        # If not admin, only show user's notifications
+        if not user.is_admin:
+            query = query.filter(Notification.user_id == user.id)
+        if status:
+            query = query.filter(Notification.status == status)
+        if channel:
+            query = query.filter(Notification.channel == channel)
+        if created_from:
+            query = query.filter(Notification.created_at >= _to_naive_utc(created_from))
+        if created_to:
+            query = query.filter(Notification.created_at < _to_naive_utc(created_to))
+        return query
+
+    @staticmethod
+    def paginate_notifications(query, limit: int, after: Optional[tuple] = None) -> tuple:
+        """
+        Fetch one keyset page ordered newest first by (created_at, id).
+
+        Args:
+            query: Filtered notification query
+            limit: Page size
+            after: (created_at, id) of the last row of the previous page
+
+        Returns:
+            tuple: (notifications, whether another page exists)
+        """
+        if after is not None:
+            query = query.filter(tuple_(Notification.created_at, Notification.id) < tuple_(*after))
+        rows = (
+            query.order_by(Notification.created_at.desc(), Notification.id.desc())
+            .limit(limit + 1)
+            .all()
+        )
+        return rows[:limit], len(rows) > limit
+
+    @staticmethod
+    def resolve_scheduled_for(scheduled_for: Optional[datetime], user_tz) -> datetime:
+        """
+        Convert a requested send time to UTC.
+
+        Naive datetimes are interpreted in the user's timezone. A missing value
+        means "send now".
+
+        Raises:
+            InvalidScheduleError: If the requested time is in the past
+        """
+        if not scheduled_for:
+            return datetime.now(pytz.UTC)
+
+        if scheduled_for.tzinfo is not None:
+            scheduled_for_utc = scheduled_for.astimezone(pytz.UTC)
+        else:
+            scheduled_for_utc = user_tz.localize(scheduled_for).astimezone(pytz.UTC)
+
+        if scheduled_for_utc < datetime.now(pytz.UTC):
+            raise InvalidScheduleError(
+                "Cannot schedule notifications in the past. Please provide a future date and time.",
+                details={"scheduled_for": scheduled_for_utc.isoformat()}
+            )
+        return scheduled_for_utc
+
+    @staticmethod
+    def apply_quiet_hours(
+        scheduled_for_utc: datetime,
+        user_tz,
+        quiet_hours_start: Optional[time],
+        quiet_hours_end: Optional[time]
+    ) -> datetime:
+        """
+        Move a send time out of the user's quiet hours.
+
+        Quiet hours are wall-clock times in the user's timezone; a start later
+        than the end means the window crosses midnight (e.g. 22:00-07:00). A
+        send time inside the window moves to the window's end, so the
+        scheduler only ever needs to compare scheduled_for with now.
+
+        Args:
+            scheduled_for_utc: Requested send time (timezone aware)
+            user_tz: The user's pytz timezone
+            quiet_hours_start: Start of the quiet window, or None
+            quiet_hours_end: End of the quiet window, or None
+
+        Returns:
+            datetime: The earliest permitted send time at or after the request, in UTC
+        """
+        if quiet_hours_start is None or quiet_hours_end is None or quiet_hours_start == quiet_hours_end:
+            return scheduled_for_utc
+
+        local = scheduled_for_utc.astimezone(user_tz)
+        local_time = local.time().replace(tzinfo=None)
+
+        if quiet_hours_start < quiet_hours_end:
+            if not quiet_hours_start <= local_time < quiet_hours_end:
+                return scheduled_for_utc
+            resume_date = local.date()
+        elif local_time >= quiet_hours_start:
+            resume_date = local.date() + timedelta(days=1)
+        elif local_time < quiet_hours_end:
+            resume_date = local.date()
+        else:
+            return scheduled_for_utc
+
+        # normalize() shifts a wall time that falls in a DST gap to a real instant
+        resume_local = user_tz.normalize(user_tz.localize(datetime.combine(resume_date, quiet_hours_end)))
+        return resume_local.astimezone(pytz.UTC)
+
+    @staticmethod
+    def contact_snapshot(channel: str, user: Optional[User], template: Optional[NotificationTemplate]) -> dict:
+        """Resolve the destination address and subject a notification will be sent with."""
+        field = RECIPIENT_FIELDS.get(channel)
+        return {
+            "recipient": getattr(user, field) if field and user is not None else None,
+            "subject": template.name if template is not None else None,
+        }
+
+    @staticmethod
+    def refresh_contact_snapshots(db: Session, notifications: List[Notification]) -> int:
+        """
+        Re-resolve contact snapshots that are missing or, in refresh mode, stale.
+
+        Refresh mode is enabled by NOTIFICATION_SNAPSHOT_REFRESH_AFTER: snapshots
+        taken longer ago than that many seconds are re-read, so a notification
+        scheduled far ahead goes to the user's current address. Users and
+        templates are loaded with one IN query each, and only when some
+        notification needs them.
+
+        Returns:
+            int: Number of notifications whose snapshot was refreshed
+        """
+        refresh_after = settings.NOTIFICATION_SNAPSHOT_REFRESH_AFTER
+        stale_before = (
+            datetime.now(pytz.UTC).replace(tzinfo=None) - timedelta(seconds=refresh_after)
+            if refresh_after is not None else None
+        )
+        stale = [
+            notification for notification in notifications
+            if notification.subject is None
+            or (notification.recipient is None and notification.channel in RECIPIENT_FIELDS)
+            or (stale_before is not None and _to_naive_utc(notification.created_at) < stale_before)
+        ]
+        if not stale:
+            return 0
+
+        users = {
+            user.id: user
+            for user in db.query(User).filter(User.id.in_({notification.user_id for notification in stale}))
+        }
+        templates = {
+            template.id: template
+            for template in db.query(NotificationTemplate).filter(
+                NotificationTemplate.id.in_({notification.template_id for notification in stale})
+            )
+        }
+        for notification in stale:
+            snapshot = NotificationService.contact_snapshot(
+                notification.channel, users.get(notification.user_id), templates.get(notification.template_id)
+            )
+            for key, value in snapshot.items():
+                setattr(notification, key, value)
+        return len(stale)
+
+    @staticmethod
+    async def create_notifications_batch(
+        db: Session,
+        items: List[NotificationCreate]
+    ) -> List[NotificationBatchItemResult]:
+        """
+        Validate and insert many notifications using set-based queries.
+
+        Templates, users and channel preferences are each loaded with a single
+        IN query, and all valid rows are written with one bulk INSERT. Send
+        times are moved out of each recipient's quiet hours, and each row
+        carries its contact snapshot.
+        Invalid items are reported individually and do not block the rest.
+        """
+        template_ids = {item.template_id for item in items}
+        user_ids = {item.user_id for item in items}
+
+        templates = {
+            template.id: template
+            for template in db.query(NotificationTemplate).filter(
+                NotificationTemplate.id.in_(template_ids)
+            )
+        }
+        users = {
+            user.id: user
+            for user in db.query(User).filter(User.id.in_(user_ids))
+        }
+        preferences = {
+            (preference.user_id, preference.channel): preference
+            for preference in db.query(UserPreference).filter(
+                UserPreference.user_id.in_(user_ids)
+            )
+        }
+
+        results: List[NotificationBatchItemResult] = []
+        rows = []
+        row_indexes = []
+
+        for index, item in enumerate(items):
+            template = templates.get(item.template_id)
+            if not template:
+                results.append(NotificationBatchItemResult(index=index, success=False, error="Template not found"))
+                continue
+
+            target_user = users.get(item.user_id)
+            if not target_user:
+                results.append(NotificationBatchItemResult(index=index, success=False, error="Target user not found"))
+                continue
+
+            preference = preferences.get((item.user_id, item.channel))
+            if preference and not preference.enabled:
+                results.append(NotificationBatchItemResult(
+                    index=index,
+                    success=False,
+                    error=f"User has disabled {item.channel} notifications"
+                ))
+                continue
+
+            user_timezone = target_user.default_timezone or "UTC"
+            try:
+                user_tz = pytz.timezone(user_timezone)
+                scheduled_for_utc = NotificationService.resolve_scheduled_for(item.scheduled_for, user_tz)
+                if preference:
+                    scheduled_for_utc = NotificationService.apply_quiet_hours(
+                        scheduled_for_utc, user_tz, preference.quiet_hours_start, preference.quiet_hours_end
+                    )
+                rendered_content = template.render(item.variables)
+            except pytz.exceptions.UnknownTimeZoneError:
+                results.append(NotificationBatchItemResult(
+                    index=index, success=False, error=f"Invalid timezone: {user_timezone}"
+                ))
+                continue
+            except (InvalidScheduleError, ValueError) as e:
+                results.append(NotificationBatchItemResult(index=index, success=False, error=str(e)))
+                continue
+
+            rows.append({
+                "user_id": item.user_id,
+                "template_id": item.template_id,
+                "channel": item.channel,
+                "variables": item.variables,
+                "priority": item.priority,
+                "scheduled_for": scheduled_for_utc,
+                "timezone": user_timezone,
+                "content": rendered_content,
+                "status": "pending",
+                **NotificationService.contact_snapshot(item.channel, target_user, template),
+            })
+            row_indexes.append(index)
+            results.append(None)
+
+        if rows:
+            stmt = insert(Notification).returning(Notification.id, sort_by_parameter_order=True)
+            notification_ids = db.execute(stmt, rows).scalars().all()
+            db.commit()
+
+            for index, notification_id in zip(row_indexes, notification_ids):
+                results[index] = NotificationBatchItemResult(
+                    index=index,
+                    success=True,
+                    notification_id=notification_id
+                )
+
+        return results
@@ -1,12 +1,14 @@
 from typing import List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.user_cache import user_cache
 from app.models.user_preference import UserPreference
 from app.schemas.preference import PreferenceCreate, PreferenceUpdate
 from app.schemas.notification import NotificationChannel
 
 class PreferenceService:
     @staticmethod
-    async def create_preference(db: Session, user_id: str, preference_data: PreferenceCreate) -> UserPreference:
+    async def create_preference(db: AsyncSession, user_id: str, preference_data: PreferenceCreate) -> UserPreference:
         """Create a new preference."""
         db_preference = UserPreference(
             user_id=user_id,
@@ -18,12 +20,13 @@ class PreferenceService:
             priority_threshold=preference_data.priority_threshold
         )
         db.add(db_preference)
-        db.commit()
-        db.refresh(db_preference)
+        await db.commit()
+        await db.refresh(db_preference)
+        await user_cache.invalidate(user_id)
         return db_preference
 
     @staticmethod
-    async def create_default_preferences(db: Session, user_id: str) -> List[UserPreference]:
+    async def create_default_preferences(db: AsyncSession, user_id: str) -> List[UserPreference]:
         """Create default preferences for all notification channels."""
         preferences = []
         for channel in NotificationChannel:
@@ -37,20 +40,24 @@ class PreferenceService:
         return preferences
 
     @staticmethod
-    async def get_user_preferences(db: Session, user_id: str) -> List[UserPreference]:
+    async def get_user_preferences(db: AsyncSession, user_id: str) -> List[UserPreference]:
         """Get all preferences for a user."""
-        return db.query(UserPreference).filter(UserPreference.user_id == user_id).all()
+        return (await db.scalars(
+            select(UserPreference).where(UserPreference.user_id == user_id)
+        )).all()
 
     @staticmethod
-    async def get_preference(db: Session, user_id: str, channel: str) -> Optional[UserPreference]:
+    async def get_preference(db: AsyncSession, user_id: str, channel: str) -> Optional[UserPreference]:
         """Get a specific preference by channel."""
-        return db.query(UserPreference).filter(
-            UserPreference.user_id == user_id,
-            UserPreference.channel == channel
-        ).first()
+        return await db.scalar(
+            select(UserPreference).where(
+                UserPreference.user_id == user_id,
+                UserPreference.channel == channel
+            )
+        )
 
     @staticmethod
-    async def update_preference(db: Session, user_id: str, channel: str, preference: PreferenceUpdate) -> Optional[UserPreference]:
+    async def update_preference(db: AsyncSession, user_id: str, channel: str, preference: PreferenceUpdate) -> Optional[UserPreference]:
         """Update a specific preference."""
         db_preference = await PreferenceService.get_preference(db, user_id, channel)
         if not db_preference:
@@ -59,17 +66,19 @@ class PreferenceService:
         for key, value in preference.model_dump(exclude_unset=True).items():
             setattr(db_preference, key, value)
             
-        db.commit()
-        db.refresh(db_preference)
+        await db.commit()
+        await db.refresh(db_preference)
+        await user_cache.invalidate(user_id)
         return db_preference
 
     @staticmethod
-    async def delete_preference(db: Session, user_id: str, channel: str) -> bool:
+    async def delete_preference(db: AsyncSession, user_id: str, channel: str) -> bool:
         """Delete a specific preference."""
         db_preference = await PreferenceService.get_preference(db, user_id, channel)
         if not db_preference:
             return False
 
-        db.delete(db_preference)
-        db.commit()
+        await db.delete(db_preference)
+        await db.commit()
+        await user_cache.invalidate(user_id)
         return True
\ No newline at end of file
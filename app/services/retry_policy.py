@@ -0,0 +1,66 @@
+# app/services/retry_policy.py
+
+# Standard library imports
+import random
+from typing import Callable, Iterable, Optional
+
+# Local application imports
+from app.core.config import settings
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed delivery is retried.
+
+    Error codes from SendResult are classified as permanent (the provider
+    rejected the message itself, so retrying cannot help) or transient
+    (anything else). Transient failures are retried with exponential backoff
+    and full jitter: the delay is drawn uniformly from zero up to
+    base_delay * 2^(attempt - 1), capped at max_delay, so workers retrying
+    after a provider outage spread out instead of retrying in lockstep.
+    """
+
+    def __init__(
+        self,
+        base_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
+        permanent_error_codes: Optional[Iterable[str]] = None,
+        rand: Callable[[float, float], float] = random.uniform
+    ):
+        self.base_delay = base_delay if base_delay is not None else settings.RETRY_BASE_DELAY
+        self.max_delay = max_delay if max_delay is not None else settings.RETRY_MAX_DELAY
+        self.permanent_error_codes = frozenset(
+            str(code) for code in (
+                permanent_error_codes if permanent_error_codes is not None
+                else settings.RETRY_PERMANENT_ERROR_CODES
+            )
+        )
+        self.rand = rand
+
+    def is_permanent(self, error_code: Optional[str]) -> bool:
+        """Return True if the error code means the message can never be delivered."""
+        return error_code is not None and str(error_code) in self.permanent_error_codes
+
+    def backoff(self, attempt: int) -> float:
+        """Return a full-jitter delay in seconds before retry number attempt (1-based)."""
+        ceiling = min(self.max_delay, self.base_delay * 2 ** max(attempt - 1, 0))
+        return self.rand(0, ceiling)
+
+    def next_delay(self, retry_count: int, max_retries: int, error_code: Optional[str]) -> Optional[float]:
+        """
+        Decide what happens after a failed attempt.
+
+        Args:
+            retry_count: Failed attempts so far, including this one
+            max_retries: Attempts allowed for the notification
+            error_code: SendResult.error_code of the failed attempt
+
+        Returns:
+            Optional[float]: Seconds until the next attempt, or None if the
+                failure is permanent or the attempts are used up
+        """
+        if self.is_permanent(error_code) or retry_count >= max_retries:
+            return None
+        return self.backoff(retry_count)
+
+# Process-wide policy used by the delivery tasks
+retry_policy = RetryPolicy()
@@ -3,7 +3,19 @@
 # Standard library imports
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+# Local application imports
+from app.services.retry_policy import retry_policy
+from .circuit_breaker import HALF_OPEN, CircuitBreaker, circuit_breaker
+from .throttle import TokenBucketLimiter, token_bucket
+
+# Error codes for sends held back before dialing the provider; not delivery failures
+THROTTLED = "THROTTLED"
+CIRCUIT_OPEN = "CIRCUIT_OPEN"
+
+# Error code for notifications whose channel has no registered sender
+UNSUPPORTED_CHANNEL = "UNSUPPORTED_CHANNEL"
 
 @dataclass
 class SendResult:
@@ -15,17 +27,48 @@ class SendResult:
         response (Optional[Dict[str, Any]]): Optional response data from the sending service
         error_code (Optional[str]): Error code if send operation failed
         error_message (Optional[str]): Human readable error message if send operation failed
+        retry_after (Optional[float]): Seconds to wait before trying again, for throttled sends
     """
     success: bool
     response: Optional[Dict[str, Any]] = None
     error_code: Optional[str] = None 
     error_message: Optional[str] = None
+    retry_after: Optional[float] = None
+
+    @property
+    def throttled(self) -> bool:
+        return self.error_code == THROTTLED
+
+    @property
+    def deferred(self) -> bool:
+        """True if the send was held back before reaching the provider."""
+        return self.error_code in (THROTTLED, CIRCUIT_OPEN)
 
 class NotificationSender(ABC):
     """
     Abstract base class for notification senders.
     All concrete notification senders must implement this interface.
+
+    Sender instances are long-lived: the sender registry builds one per channel
+    per process, calls open() before first use and close() at shutdown.
+
+    Senders that set provider get a shared circuit breaker under that name.
+    relationships names the Notification relationships the sender reads, so
+    the worker can eager-load exactly those before sending; senders that
+    only read the row's recipient and subject snapshot declare none.
     """
+
+    provider: Optional[str] = None
+    relationships: Tuple[str, ...] = ("user", "template")
+    rate_limiter: TokenBucketLimiter = token_bucket
+    circuit_breaker: CircuitBreaker = circuit_breaker
+
+    def open(self) -> None:
+        """Acquire long-lived resources such as connection pools. No-op by default."""
+
+    def close(self) -> None:
+        """Release resources acquired by open() or during sending. No-op by default."""
+
     @abstractmethod
     def send(self, notification) -> SendResult:
         """
@@ -37,4 +80,99 @@ class NotificationSender(ABC):
         Returns:
             SendResult: The result of the send operation
         """
-        pass
\ No newline at end of file
+        pass
+
+    def send_many(self, notifications) -> List[SendResult]:
+        """
+        Send several notifications and return one result per notification.
+
+        Senders that can deliver in bulk override this; the default sends
+        each notification in turn.
+
+        Args:
+            notifications: The notifications to send
+
+        Returns:
+            List[SendResult]: The results, in the same order as the input
+        """
+        return [self.send(notification) for notification in notifications]
+
+    def rate_limit_keys(self, notification) -> List[str]:
+        """
+        Name the token buckets a send must draw from, e.g. the provider and the sending number.
+
+        Only buckets with a rate in SENDER_RATE_LIMITS are enforced. No buckets by default.
+        """
+        return []
+
+    def preflight(self, notifications) -> List[Optional[SendResult]]:
+        """
+        Check the provider's circuit breaker and take rate-limit tokens before sending.
+
+        While the breaker is open nothing is sent; once it half-opens only the
+        first notification goes, as the probe. Notifications that share
+        buckets are checked together in one round trip.
+
+        Args:
+            notifications: The notifications about to be sent
+
+        Returns:
+            List[Optional[SendResult]]: Per notification, None if it may be sent
+                now, otherwise a THROTTLED or CIRCUIT_OPEN result carrying retry_after
+        """
+        results: List[Optional[SendResult]] = [None] * len(notifications)
+        if not notifications:
+            return results
+
+        allowed = len(notifications)
+        if self.provider:
+            wait, state = self.circuit_breaker.allow(self.provider)
+            if wait:
+                allowed = 0
+            elif state == HALF_OPEN:
+                allowed, wait = 1, self.circuit_breaker.reset_timeout
+            for index in range(allowed, len(notifications)):
+                results[index] = SendResult(
+                    success=False,
+                    error_code=CIRCUIT_OPEN,
+                    error_message=f"Circuit breaker open for {self.provider}",
+                    retry_after=wait
+                )
+
+        groups: Dict[Tuple[str, ...], List[int]] = {}
+        for index, notification in enumerate(notifications[:allowed]):
+            keys = self.rate_limiter.configured(self.rate_limit_keys(notification))
+            if keys:
+                groups.setdefault(keys, []).append(index)
+
+        for keys, indexes in groups.items():
+            waits = self.rate_limiter.acquire(keys, len(indexes))
+            for index, wait in zip(indexes, waits):
+                if wait > 0:
+                    results[index] = SendResult(
+                        success=False,
+                        error_code=THROTTLED,
+                        error_message=f"Rate limit reached for {', '.join(keys)}",
+                        retry_after=wait
+                    )
+        return results
+
+    def record_results(self, results: List[SendResult]) -> None:
+        """
+        Feed send outcomes to the provider's circuit breaker.
+
+        Permanent errors such as an invalid number mean the provider answered,
+        so they count as successes; transient errors count as failures.
+        """
+        if not self.provider:
+            return
+        successes = failures = 0
+        for result in results:
+            if result.deferred:
+                continue
+            if result.success or retry_policy.is_permanent(result.error_code):
+                successes += 1
+            else:
+                failures += 1
+        if successes or failures:
+            self.circuit_breaker.record(self.provider, successes, failures)
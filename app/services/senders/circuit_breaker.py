@@ -0,0 +1,198 @@
+# app/services/senders/circuit_breaker.py
+
+# Standard library imports
+import time
+from typing import Any, Dict, Optional, Tuple
+
+# Third-party imports
+import redis
+
+# Local application imports
+from app.core.config import settings
+from app.core.logging_config import logger
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Ask to dial a provider. KEYS[1] is the breaker hash, ARGV now_ms and
+# reset_ms. Returns {ms to wait, state}. Once an open breaker's cool-down
+# ends, the first caller is let through as the half-open probe and the
+# others wait for its outcome; a probe that never reports expires after
+# reset_ms and the next caller probes instead.
+ALLOW_SCRIPT = """
+local state = redis.call('HGET', KEYS[1], 'state')
+if state ~= 'open' and state ~= 'half_open' then
+    return {0, 'closed'}
+end
+local now = tonumber(ARGV[1])
+local retry_at = tonumber(redis.call('HGET', KEYS[1], 'retry_at')) or 0
+if now < retry_at then
+    return {retry_at - now, state}
+end
+redis.call('HSET', KEYS[1], 'state', 'half_open', 'retry_at', now + tonumber(ARGV[2]))
+return {0, 'half_open'}
+"""
+
+# Record send outcomes. ARGV: now_ms, successes, failures, threshold,
+# reset_ms, failure_window_ms. While closed, each failure adds one to the
+# failure count and each success takes one off, so a provider failing most
+# sends still opens even if some get through; the count is dropped when it
+# reaches zero or after a window with no failures, and opens the breaker
+# at the threshold. While open or half-open, outcomes with more successes
+# than failures close the breaker and any other failure restarts the
+# cool-down. Returns the new state.
+RECORD_SCRIPT = """
+local now = tonumber(ARGV[1])
+local successes = tonumber(ARGV[2])
+local failures = tonumber(ARGV[3])
+local state = redis.call('HGET', KEYS[1], 'state') or 'closed'
+local count = 0
+if state == 'closed' then
+    if successes == 0 and failures == 0 then
+        return state
+    end
+    count = redis.call('HINCRBY', KEYS[1], 'failures', failures - successes)
+    if count <= 0 then
+        redis.call('DEL', KEYS[1])
+        return 'closed'
+    end
+elseif successes > failures then
+    redis.call('DEL', KEYS[1])
+    return 'closed'
+elseif failures == 0 then
+    return state
+end
+if state ~= 'closed' or count >= tonumber(ARGV[4]) then
+    redis.call('HSET', KEYS[1], 'state', 'open', 'opened_at', now, 'retry_at', now + tonumber(ARGV[5]))
+    redis.call('PERSIST', KEYS[1])
+    return 'open'
+end
+redis.call('HSET', KEYS[1], 'state', 'closed')
+if failures > 0 then
+    redis.call('PEXPIRE', KEYS[1], tonumber(ARGV[6]))
+end
+return 'closed'
+"""
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open circuit breakers per provider, shared through Redis.
+
+    A provider's breaker opens once its failed sends outnumber its
+    successful ones by CIRCUIT_BREAKER_FAILURE_THRESHOLD; the count is
+    dropped after CIRCUIT_BREAKER_FAILURE_WINDOW seconds without a
+    failure. While
+    open, workers defer sends instead of dialing the provider. After
+    CIRCUIT_BREAKER_RESET_TIMEOUT seconds one send probes the provider: a
+    success closes the breaker and a failure reopens it. If Redis is
+    unreachable the breaker stays closed.
+    """
+
+    KEY_PREFIX = "circuit:"
+
+    def __init__(
+        self,
+        failure_threshold: Optional[int] = None,
+        failure_window: Optional[float] = None,
+        reset_timeout: Optional[float] = None,
+        client: Optional[redis.Redis] = None
+    ):
+        self.failure_threshold = failure_threshold or settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD
+        self.failure_window = failure_window or settings.CIRCUIT_BREAKER_FAILURE_WINDOW
+        self.reset_timeout = reset_timeout or settings.CIRCUIT_BREAKER_RESET_TIMEOUT
+        self._client = client
+        self._allow_script = None
+        self._record_script = None
+
+    @property
+    def client(self) -> redis.Redis:
+        if self._client is None:
+            self._client = redis.Redis.from_url(settings.REDIS_URL)
+        return self._client
+
+    @staticmethod
+    def _now_ms() -> int:
+        return int(time.time() * 1000)
+
+    def allow(self, provider: str) -> Tuple[float, str]:
+        """
+        Ask whether a provider may be dialed now.
+
+        Returns:
+            Tuple[float, str]: (seconds to wait, 0 if allowed; breaker state).
+                An allowed half-open state means this caller holds the probe.
+        """
+        if self._allow_script is None:
+            self._allow_script = self.client.register_script(ALLOW_SCRIPT)
+        try:
+            wait_ms, state = self._allow_script(
+                keys=[self.KEY_PREFIX + provider],
+                args=[self._now_ms(), int(self.reset_timeout * 1000)]
+            )
+        except redis.RedisError as e:
+            logger.warning("circuit_breaker_unavailable", provider=provider, error=str(e))
+            return 0.0, CLOSED
+        return int(wait_ms) / 1000, state.decode() if isinstance(state, bytes) else state
+
+    def record(self, provider: str, successes: int, failures: int) -> str:
+        """Record send outcomes for a provider and return the breaker's new state."""
+        if self._record_script is None:
+            self._record_script = self.client.register_script(RECORD_SCRIPT)
+        try:
+            state = self._record_script(
+                keys=[self.KEY_PREFIX + provider],
+                args=[
+                    self._now_ms(),
+                    successes,
+                    failures,
+                    self.failure_threshold,
+                    int(self.reset_timeout * 1000),
+                    int(self.failure_window * 1000),
+                ]
+            )
+        except redis.RedisError as e:
+            logger.warning("circuit_breaker_unavailable", provider=provider, error=str(e))
+            return CLOSED
+        state = state.decode() if isinstance(state, bytes) else state
+        if state == OPEN:
+            logger.warning("circuit_breaker_open", provider=provider, failures=failures)
+        return state
+
+    def states(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Return the state of every provider breaker with recorded failures.
+
+        Returns:
+            Optional[Dict[str, Dict[str, Any]]]: Breaker state per provider,
+                or None if Redis is unreachable
+        """
+        now = self._now_ms()
+        states = {}
+        try:
+            breakers = {}
+            for key in self.client.scan_iter(match=f"{self.KEY_PREFIX}*"):
+                key = key.decode() if isinstance(key, bytes) else key
+                breakers[key] = self.client.hgetall(key)
+        except redis.RedisError as e:
+            logger.warning("circuit_breaker_unavailable", error=str(e))
+            return None
+
+        for key, raw_fields in breakers.items():
+            fields = {
+                (name.decode() if isinstance(name, bytes) else name): (
+                    value.decode() if isinstance(value, bytes) else value
+                )
+                for name, value in raw_fields.items()
+            }
+            retry_at = int(fields.get("retry_at") or 0)
+            states[key[len(self.KEY_PREFIX):]] = {
+                "state": fields.get("state", CLOSED),
+                "failures": int(fields.get("failures") or 0),
+                "opened_at": int(fields["opened_at"]) / 1000 if fields.get("opened_at") else None,
+                "retry_in": max(retry_at - now, 0) / 1000 if retry_at else None,
+            }
+        return states
+
+# Process-wide breaker consulted by the channel senders
+circuit_breaker = CircuitBreaker()
@@ -1,10 +1,11 @@
 # app/services/senders/email_sender.py
 
 # Standard library imports
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-import smtplib
-from typing import Dict, Any
+from typing import Awaitable, Dict, Any, List, Optional, TypeVar
 
 # Third-party imports
 import aiosmtplib
@@ -12,37 +13,84 @@ import aiosmtplib
 # Local application imports
 from app.core.config import settings
 from .base import NotificationSender, SendResult
+from .smtp_pool import SMTPConnectionPool, get_default_pool
+
+T = TypeVar("T")
+
+def run_coroutine(coroutine: Awaitable[T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    asyncio.run refuses to start inside a thread whose event loop is already
+    running, so in that case the coroutine runs on a loop in a helper thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+def build_email_message(notification) -> MIMEMultipart:
+    """Compose the MIME message for an email notification."""
+    message = MIMEMultipart('alternative')
+    message['Subject'] = notification.subject
+    message['From'] = f"{settings.EMAILS_FROM_NAME} <{settings.EMAILS_FROM_EMAIL}>"
+    message['To'] = notification.recipient
+
+    html_content = MIMEText(notification.content, 'html')
+    message.attach(html_content)
+    return message
+
+
+def email_rate_limit_keys(notification) -> List[str]:
+    """Throttle email per SMTP relay and per recipient domain."""
+    domain = (notification.recipient or "").rpartition("@")[2].lower()
+    return ["email", f"email:{domain}"] if domain else ["email"]
 
 
 class EmailSender(NotificationSender):
     """
     Email notification sender implementation using SMTP.
-    Handles email composition and sending via SMTP server.
+    Handles email composition and sending via pooled SMTP connections;
+    batches are handed to an AsyncEmailSender and sent concurrently over
+    connection slots reserved from the same pool, so single and batched
+    sends share one SMTP_POOL_SIZE connection budget.
     """
 
+    provider = "smtp"
+    relationships = ()
+
+    def __init__(
+        self,
+        pool: Optional[SMTPConnectionPool] = None,
+        batch_sender: Optional["AsyncEmailSender"] = None
+    ):
+        """Use the given SMTP pool and batch sender, or the process-wide defaults."""
+        self.pool = pool or get_default_pool()
+        self.batch_sender = batch_sender or AsyncEmailSender()
+
+    def close(self) -> None:
+        """Close the idle SMTP sessions held by the pool."""
+        self.pool.close()
+
+    def rate_limit_keys(self, notification) -> List[str]:
+        return email_rate_limit_keys(notification)
+
     def send(self, notification) -> SendResult:
         """
         Send an email notification.
 
         Args:
-            notification: Notification object containing template, user and content
+            notification: Notification object containing subject, recipient and content
 
         Returns:
             SendResult: Result of the email sending operation
         """
         try:
-            message = MIMEMultipart('alternative')
-            message['Subject'] = notification.template.name
-            message['From'] = f"{settings.EMAILS_FROM_NAME} <{settings.EMAILS_FROM_EMAIL}>"
-            message['To'] = notification.user.email
-
-            html_content = MIMEText(notification.content, 'html')
-            message.attach(html_content)
-
-            with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT) as server:
-                server.starttls()
-                server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
-                server.send_message(message)
+            message = build_email_message(notification)
+            self.pool.send_message(message)
 
             return SendResult(
                 success=True,
@@ -53,4 +101,177 @@ class EmailSender(NotificationSender):
                 success=False,
                 error_code="SMTP_ERROR",
                 error_message=str(e)
-            )
\ No newline at end of file
+            )
+
+    def send_many(self, notifications) -> List[SendResult]:
+        """
+        Send a batch of email notifications concurrently.
+
+        Args:
+            notifications: Notification objects containing subject, recipient and content
+
+        Returns:
+            List[SendResult]: One result per notification, in input order
+        """
+        if len(notifications) <= 1:
+            return [self.send(notification) for notification in notifications]
+
+        slots = self.pool.reserve(min(self.batch_sender.concurrency, len(notifications)))
+        if not slots:
+            return [
+                SendResult(
+                    success=False,
+                    error_code="SMTP_ERROR",
+                    error_message=f"SMTP pool exhausted: no connection free for {self.pool.timeout}s"
+                )
+                for _ in notifications
+            ]
+        try:
+            return self.batch_sender.send_many(notifications, concurrency=slots)
+        finally:
+            self.pool.release(slots)
+
+
+class AsyncEmailSender(NotificationSender):
+    """
+    Email notification sender that delivers many messages concurrently.
+    Messages are spread over a bounded set of aiosmtplib connections, each
+    reused for many messages, so a batch costs a handful of SMTP handshakes.
+    """
+
+    provider = "smtp"
+    relationships = ()
+
+    def __init__(
+        self,
+        concurrency: Optional[int] = None,
+        hostname: Optional[str] = None,
+        port: Optional[int] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        start_tls: Optional[bool] = None,
+        timeout: Optional[float] = None,
+        max_messages_per_connection: Optional[int] = None,
+    ):
+        self.concurrency = concurrency or settings.SMTP_ASYNC_CONCURRENCY
+        self.hostname = hostname if hostname is not None else settings.SMTP_HOST
+        self.port = port if port is not None else settings.SMTP_PORT
+        self.username = username if username is not None else settings.SMTP_USER
+        self.password = password if password is not None else settings.SMTP_PASSWORD
+        self.start_tls = start_tls if start_tls is not None else settings.SMTP_TLS
+        self.timeout = timeout if timeout is not None else settings.SMTP_TIMEOUT
+        self.max_messages_per_connection = max_messages_per_connection or settings.SMTP_POOL_MAX_MESSAGES
+
+    def rate_limit_keys(self, notification) -> List[str]:
+        return email_rate_limit_keys(notification)
+
+    def send(self, notification) -> SendResult:
+        """
+        Send a single email notification.
+
+        Args:
+            notification: Notification object containing subject, recipient and content
+
+        Returns:
+            SendResult: Result of the email sending operation
+        """
+        return self.send_many([notification])[0]
+
+    def send_many(self, notifications, concurrency: Optional[int] = None) -> List[SendResult]:
+        """
+        Send many email notifications from synchronous code, such as a Celery task.
+
+        Args:
+            notifications: Notification objects containing subject, recipient and content
+            concurrency: Connections to use, at most; defaults to self.concurrency
+
+        Returns:
+            List[SendResult]: One result per notification, in input order
+        """
+        return run_coroutine(self.send_many_async(notifications, concurrency))
+
+    async def send_many_async(self, notifications, concurrency: Optional[int] = None) -> List[SendResult]:
+        """
+        Send many email notifications concurrently.
+
+        Args:
+            notifications: Notification objects containing subject, recipient and content
+            concurrency: Connections to use, at most; defaults to self.concurrency
+
+        Returns:
+            List[SendResult]: One result per notification, in input order
+        """
+        results: List[Optional[SendResult]] = [None] * len(notifications)
+        queue: asyncio.Queue = asyncio.Queue()
+
+        for index, notification in enumerate(notifications):
+            try:
+                queue.put_nowait((index, build_email_message(notification)))
+            except Exception as e:
+                results[index] = SendResult(
+                    success=False,
+                    error_code="SMTP_ERROR",
+                    error_message=str(e)
+                )
+
+        workers = min(concurrency or self.concurrency, queue.qsize())
+        await asyncio.gather(*(self._drain(queue, results) for _ in range(workers)))
+        return results
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        client = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username or None,
+            password=self.password or None,
+            start_tls=self.start_tls,
+            timeout=self.timeout
+        )
+        await client.connect()
+        return client
+
+    @staticmethod
+    async def _disconnect(client: Optional[aiosmtplib.SMTP]) -> None:
+        if client is None:
+            return
+        try:
+            await client.quit()
+        except Exception:
+            client.close()
+
+    async def _drain(self, queue: asyncio.Queue, results: List[Optional[SendResult]]) -> None:
+        """Send queued messages over one connection until the queue is empty."""
+        client = None
+        sent_on_connection = 0
+        try:
+            while not queue.empty():
+                index, message = queue.get_nowait()
+                try:
+                    if client is None or sent_on_connection >= self.max_messages_per_connection:
+                        await self._disconnect(client)
+                        client = await self._connect()
+                        sent_on_connection = 0
+                    try:
+                        await client.send_message(message)
+                    except aiosmtplib.SMTPServerDisconnected:
+                        await self._disconnect(client)
+                        client = None
+                        client = await self._connect()
+                        sent_on_connection = 0
+                        await client.send_message(message)
+
+                    sent_on_connection += 1
+                    results[index] = SendResult(
+                        success=True,
+                        response={"message": "Email sent successfully"}
+                    )
+                except Exception as e:
+                    await self._disconnect(client)
+                    client = None
+                    results[index] = SendResult(
+                        success=False,
+                        error_code="SMTP_ERROR",
+                        error_message=str(e)
+                    )
+        finally:
+            await self._disconnect(client)
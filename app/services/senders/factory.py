@@ -1,40 +1,171 @@
 # app/services/senders/factory.py
 
+# Standard library imports
+from importlib.metadata import entry_points
+from threading import Lock
+from typing import Callable, Dict, List, Tuple
+
 # Local application imports
+from app.core.logging_config import logger
 from app.services.senders.base import NotificationSender
 from app.services.senders.email_sender import EmailSender
 from app.services.senders.push_sender import PushSender
 from app.services.senders.sms_sender import SMSSender
 
+# Entry point group third-party packages use to contribute channel senders
+SENDER_ENTRY_POINT_GROUP = "notification_service.senders"
+
+
+class UnsupportedChannelError(ValueError):
+    """Raised when no sender is registered for a channel."""
+
+
+class SenderRegistry:
+    """
+    Registry of notification senders keyed by channel.
+
+    Each channel's sender is built lazily on first use and then kept for the
+    life of the process, so pooled clients (SMTP sessions, HTTP connections,
+    provider SDK clients) are shared by every notification the worker sends.
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], NotificationSender]] = {}
+        self._senders: Dict[str, NotificationSender] = {}
+        self._lock = Lock()
+        self._entry_points_loaded = False
+
+    def register(self, channel: str, factory: Callable[[], NotificationSender]) -> None:
+        """
+        Register a sender factory for a channel.
+
+        Args:
+            channel (str): The notification channel the sender handles
+            factory (Callable[[], NotificationSender]): Sender class or zero-argument callable
+        """
+        with self._lock:
+            self._factories[channel.lower()] = factory
+
+    def load_entry_points(self) -> None:
+        """Register senders advertised under the SENDER_ENTRY_POINT_GROUP entry point group."""
+        if self._entry_points_loaded:
+            return
+
+        discovered = entry_points()
+        if hasattr(discovered, "select"):
+            discovered = discovered.select(group=SENDER_ENTRY_POINT_GROUP)
+        else:
+            discovered = discovered.get(SENDER_ENTRY_POINT_GROUP, [])
+
+        for entry_point in discovered:
+            try:
+                self.register(entry_point.name, entry_point.load())
+                logger.info("sender_entry_point_registered", channel=entry_point.name, target=entry_point.value)
+            except Exception as e:
+                logger.error("sender_entry_point_failed", channel=entry_point.name, error=str(e))
+
+        self._entry_points_loaded = True
+
+    def get(self, channel: str) -> NotificationSender:
+        """
+        Return the process-wide sender for a channel, building and opening it on first use.
+
+        Raises:
+            UnsupportedChannelError: If no sender is registered for the channel
+        """
+        channel = channel.lower()
+        sender = self._senders.get(channel)
+        if sender is not None:
+            return sender
+
+        self.load_entry_points()
+        with self._lock:
+            sender = self._senders.get(channel)
+            if sender is None:
+                factory = self._factories.get(channel)
+                if factory is None:
+                    raise UnsupportedChannelError(f"Unsupported channel: {channel}")
+                sender = factory()
+                sender.open()
+                self._senders[channel] = sender
+        return sender
+
+    def relationships(self, channel: str) -> Tuple[str, ...]:
+        """
+        Return the Notification relationships a channel's sender reads, without building it.
+
+        Read from the sender if it is already built, otherwise from its
+        registered class. Unknown channels and factories that do not declare
+        relationships read none.
+        """
+        channel = channel.lower()
+        sender = self._senders.get(channel)
+        if sender is None:
+            self.load_entry_points()
+            sender = self._factories.get(channel)
+        return tuple(getattr(sender, "relationships", ()))
+
+    @property
+    def channels(self) -> List[str]:
+        return sorted(self._factories)
+
+    def open(self) -> None:
+        """Build and open every registered sender, e.g. when a worker process starts."""
+        self.load_entry_points()
+        for channel in self.channels:
+            try:
+                self.get(channel)
+            except Exception as e:
+                logger.error("sender_open_failed", channel=channel, error=str(e))
+
+    def close(self) -> None:
+        """Close and forget every sender built so far, e.g. when a worker process shuts down."""
+        with self._lock:
+            senders, self._senders = self._senders, {}
+        for channel, sender in senders.items():
+            try:
+                sender.close()
+            except Exception as e:
+                logger.error("sender_close_failed", channel=channel, error=str(e))
+
+
+sender_registry = SenderRegistry()
+sender_registry.register('email', EmailSender)
+sender_registry.register('sms', SMSSender)
+sender_registry.register('push', PushSender)
+
 
 class NotificationSenderFactory:
     """
-    Factory class for creating notification sender instances based on channel type.
-    Implements the Factory Pattern for notification sender creation.
+    Factory class for obtaining notification sender instances based on channel type.
+    Delegates to the process-wide sender registry so senders are reused between calls.
     """
 
     @staticmethod
     def get_sender(channel: str) -> NotificationSender:
         """
-        Create and return a notification sender instance for the specified channel.
+        Return the notification sender for the specified channel.
 
         Args:
-            channel (str): The notification channel type ('email', 'sms', or 'push')
+            channel (str): The notification channel type ('email', 'sms', 'push' or a registered plugin channel)
 
         Returns:
-            NotificationSender: An instance of the appropriate sender class
+            NotificationSender: The shared sender instance for the channel
 
         Raises:
-            ValueError: If the specified channel is not supported
-        """
-        senders = {
-            'email': EmailSender(),
-            'sms': SMSSender(),
-            'push': PushSender()
-        }
-        
-        sender = senders.get(channel.lower())
-        if not sender:
-            raise ValueError(f"Unsupported channel: {channel}")
-            
-        return sender
\ No newline at end of file
+            UnsupportedChannelError: If the specified channel is not supported
+        """
+        return sender_registry.get(channel)
+
+    @staticmethod
+    def get_relationships(channel: str) -> Tuple[str, ...]:
+        """
+        Return the Notification relationships the channel's sender reads.
+
+        Args:
+            channel (str): The notification channel type
+
+        Returns:
+            Tuple[str, ...]: Relationship names, empty for unsupported channels
+        """
+        return sender_registry.relationships(channel)
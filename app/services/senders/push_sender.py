@@ -1,50 +1,117 @@
 # app/services/senders/push_sender.py
 
 # Standard library imports
-from typing import Dict, Any
+from importlib.util import find_spec
+import json
+from typing import Dict, Any, List, Optional, Tuple
 
-# Third-party imports 
-import aiohttp
-import requests
+# Third-party imports
+import httpx
 
 # Local application imports
 from app.core.config import settings
+from app.core.logging_config import logger
 from .base import NotificationSender, SendResult
 
+MALFORMED_RESPONSE = "Push provider returned a malformed response"
+
+
+def build_http_client() -> httpx.Client:
+    """
+    Build the pooled HTTP client used to reach the push provider.
+
+    Connections are kept alive between requests so the TCP and TLS handshake
+    is paid once per pooled connection. HTTP/2 is negotiated when enabled and
+    the optional h2 package is installed.
+    """
+    http2 = settings.PUSH_HTTP2 and find_spec("h2") is not None
+    if settings.PUSH_HTTP2 and not http2:
+        logger.warning("push_http2_unavailable", reason="h2 package not installed")
+
+    return httpx.Client(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=settings.PUSH_HTTP_POOL_SIZE,
+            max_keepalive_connections=settings.PUSH_HTTP_POOL_SIZE,
+            keepalive_expiry=settings.PUSH_HTTP_KEEPALIVE_EXPIRY
+        ),
+        timeout=httpx.Timeout(
+            settings.PUSH_HTTP_READ_TIMEOUT,
+            connect=settings.PUSH_HTTP_CONNECT_TIMEOUT
+        ),
+        headers={
+            "Authorization": f"Bearer {settings.PUSH_PROVIDER_API_KEY}",
+            "Content-Type": "application/json"
+        }
+    )
+
 
 class PushSender(NotificationSender):
     """
     Push notification sender implementation.
-    Handles sending push notifications via external provider API.
+    Handles sending push notifications via external provider API over a pooled HTTP client.
     """
 
+    provider = "push"
+    relationships = ()
+
+    def __init__(self, client: Optional[httpx.Client] = None):
+        """Use the given HTTP client, or build a pooled one on first use."""
+        self._client = client
+
+    @property
+    def client(self) -> httpx.Client:
+        if self._client is None:
+            self._client = build_http_client()
+        return self._client
+
+    def open(self) -> None:
+        """Create the pooled HTTP client ahead of the first send."""
+        self.client
+
+    def close(self) -> None:
+        """Close pooled provider connections."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def rate_limit_keys(self, notification) -> List[str]:
+        return ["push"]
+
     def send(self, notification) -> SendResult:
         """
         Send a push notification.
 
         Args:
-            notification: Notification object containing user_id, template and content
+            notification: Notification object containing user_id, subject and content
 
         Returns:
             SendResult: Result of the push notification sending operation
         """
         try:
-            response = requests.post(
+            response = self.client.post(
                 settings.PUSH_PROVIDER_URL,
-                headers={
-                    "Authorization": f"Bearer {settings.PUSH_PROVIDER_API_KEY}",
-                    "Content-Type": "application/json"
-                },
                 json={
                     "user_id": str(notification.user_id),
-                    "title": notification.template.name,
+                    "title": notification.subject,
                     "body": notification.content,
-                    "metadata": notification.metadata
+                    "metadata": notification.notification_metadata
                 }
             )
-            
-            response_data = response.json()
-            
+
+            try:
+                response_data = response.json()
+            except ValueError:
+                response_data = {"body": response.text}
+
+            if not isinstance(response_data, dict):
+                return SendResult(
+                    success=False,
+                    response={"body": response_data},
+                    error_code="PROVIDER_ERROR",
+                    error_message=MALFORMED_RESPONSE
+                )
+
             if response.status_code == 200:
                 return SendResult(
                     success=True,
@@ -57,10 +124,136 @@ class PushSender(NotificationSender):
                     error_code=str(response.status_code),
                     error_message=response_data.get("message", "Unknown error")
                 )
-                    
+
+        except httpx.TimeoutException as e:
+            return SendResult(
+                success=False,
+                error_code="TIMEOUT",
+                error_message=str(e) or "Push provider request timed out"
+            )
         except Exception as e:
             return SendResult(
                 success=False,
                 error_code="INTERNAL_ERROR",
                 error_message=str(e)
-            )
\ No newline at end of file
+            )
+
+    def send_many(self, notifications) -> List[SendResult]:
+        """Send several push notifications, using multicast requests where possible."""
+        return self.send_batch(notifications)
+
+    def send_batch(self, notifications) -> List[SendResult]:
+        """
+        Send push notifications in multicast requests.
+
+        Notifications sharing the same template, subject, rendered content and metadata
+        are grouped and sent to the provider's multicast endpoint in chunks of
+        at most PUSH_MULTICAST_MAX_RECIPIENTS recipients. Falls back to one
+        request per notification when no multicast endpoint is configured.
+
+        Args:
+            notifications: Notification objects containing user_id, subject and content
+
+        Returns:
+            List[SendResult]: One result per notification, in input order
+        """
+        if not settings.PUSH_MULTICAST_URL:
+            return [self.send(notification) for notification in notifications]
+
+        results: List[Optional[SendResult]] = [None] * len(notifications)
+        groups: Dict[Tuple[str, str, str, str], List[int]] = {}
+
+        for index, notification in enumerate(notifications):
+            try:
+                key = (
+                    str(notification.template_id),
+                    notification.subject,
+                    notification.content,
+                    json.dumps(notification.notification_metadata, sort_keys=True, default=str)
+                )
+            except Exception as e:
+                results[index] = SendResult(
+                    success=False,
+                    error_code="INTERNAL_ERROR",
+                    error_message=str(e)
+                )
+                continue
+            groups.setdefault(key, []).append(index)
+
+        chunk_size = settings.PUSH_MULTICAST_MAX_RECIPIENTS
+        for (_, title, body, _), indexes in groups.items():
+            metadata = notifications[indexes[0]].notification_metadata
+            for start in range(0, len(indexes), chunk_size):
+                chunk = indexes[start:start + chunk_size]
+                chunk_results = self._send_multicast(
+                    title, body, metadata, [notifications[index] for index in chunk]
+                )
+                for index, result in zip(chunk, chunk_results):
+                    results[index] = result
+
+        return results
+
+    def _send_multicast(self, title: str, body: str, metadata, notifications) -> List[SendResult]:
+        """Send one multicast request and map the provider's per-recipient results back."""
+        def fail_all(error_code: str, error_message: str, response: Optional[Dict[str, Any]] = None) -> List[SendResult]:
+            return [
+                SendResult(success=False, response=response, error_code=error_code, error_message=error_message)
+                for _ in notifications
+            ]
+
+        try:
+            response = self.client.post(
+                settings.PUSH_MULTICAST_URL,
+                json={
+                    "user_ids": [str(notification.user_id) for notification in notifications],
+                    "title": title,
+                    "body": body,
+                    "metadata": metadata
+                }
+            )
+            try:
+                response_data = response.json()
+            except ValueError:
+                response_data = {"body": response.text}
+        except httpx.TimeoutException as e:
+            return fail_all("TIMEOUT", str(e) or "Push provider request timed out")
+        except Exception as e:
+            return fail_all("INTERNAL_ERROR", str(e))
+
+        if not isinstance(response_data, dict):
+            return fail_all("PROVIDER_ERROR", MALFORMED_RESPONSE, {"body": response_data})
+
+        if response.status_code != 200:
+            return fail_all(
+                str(response.status_code),
+                response_data.get("message", "Unknown error"),
+                response_data
+            )
+
+        recipient_results = response_data.get("results")
+        if not isinstance(recipient_results, list) or len(recipient_results) != len(notifications):
+            return fail_all(
+                "INVALID_RESPONSE",
+                "Push provider returned results that do not match the recipients",
+                response_data
+            )
+
+        results = []
+        for recipient_result in recipient_results:
+            if not isinstance(recipient_result, dict):
+                results.append(SendResult(
+                    success=False,
+                    response={"body": recipient_result},
+                    error_code="PROVIDER_ERROR",
+                    error_message=MALFORMED_RESPONSE
+                ))
+            elif recipient_result.get("success"):
+                results.append(SendResult(success=True, response=recipient_result))
+            else:
+                results.append(SendResult(
+                    success=False,
+                    response=recipient_result,
+                    error_code=str(recipient_result.get("error_code", "PROVIDER_ERROR")),
+                    error_message=recipient_result.get("message", "Unknown error")
+                ))
+        return results
@@ -1,7 +1,7 @@
 # app/services/senders/sms_sender.py
 
 # Standard library imports
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 # Third-party imports
 from twilio.rest import Client
@@ -18,16 +18,23 @@ class SMSSender(NotificationSender):
     Handles sending SMS messages via Twilio API.
     """
 
+    provider = "twilio"
+    relationships = ()
+
     def __init__(self):
         """Initialize Twilio client with credentials from settings."""
         self.client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
 
+    def rate_limit_keys(self, notification) -> List[str]:
+        """Throttle per provider account and per sending number."""
+        return ["sms", f"sms:{settings.TWILIO_FROM_NUMBER}"]
+
     def send(self, notification) -> SendResult:
         """
         Send an SMS notification.
 
         Args:
-            notification: Notification object containing user phone and content
+            notification: Notification object containing the recipient phone number and content
 
         Returns:
             SendResult: Result of the SMS sending operation with Twilio response details
@@ -36,7 +43,7 @@ class SMSSender(NotificationSender):
             message = self.client.messages.create(
                 body=notification.content,
                 from_=settings.TWILIO_FROM_NUMBER,
-                to=notification.user.phone
+                to=notification.recipient
             )
 
             return SendResult(
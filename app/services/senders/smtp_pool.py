@@ -0,0 +1,224 @@
+# app/services/senders/smtp_pool.py
+
+# Standard library imports
+from email.message import Message
+import smtplib
+from threading import BoundedSemaphore, Lock
+import time
+from typing import List, Optional, Tuple
+
+# Local application imports
+from app.core.config import settings
+from app.core.logging_config import logger
+
+
+class _PooledConnection:
+    """An authenticated SMTP session together with its usage bookkeeping."""
+
+    def __init__(self, server: smtplib.SMTP):
+        self.server = server
+        self.messages_sent = 0
+        self.last_used = time.monotonic()
+
+    def close(self) -> None:
+        try:
+            self.server.quit()
+        except Exception:
+            try:
+                self.server.close()
+            except Exception:
+                pass
+
+
+class SMTPConnectionPool:
+    """
+    Per-process pool of authenticated SMTP sessions.
+
+    Connections are reused across sends so TCP connect, STARTTLS and AUTH are
+    paid once per connection instead of once per email. Before reuse a session
+    is checked against the idle timeout and message budget and probed with
+    NOOP; dead or exhausted sessions are closed and replaced transparently.
+
+    At most max_size sessions are open at once, idle ones included: a send
+    that finds every session checked out waits up to the SMTP timeout for
+    one to be returned and then fails, rather than opening another
+    connection to the relay. Senders that open their own connections, such
+    as AsyncEmailSender, reserve slots from the same budget.
+    """
+
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: Optional[bool] = None,
+        max_size: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+        max_messages_per_connection: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.host = host if host is not None else settings.SMTP_HOST
+        self.port = port if port is not None else settings.SMTP_PORT
+        self.username = username if username is not None else settings.SMTP_USER
+        self.password = password if password is not None else settings.SMTP_PASSWORD
+        self.use_tls = use_tls if use_tls is not None else settings.SMTP_TLS
+        self.max_size = max_size if max_size is not None else settings.SMTP_POOL_SIZE
+        self.idle_timeout = idle_timeout if idle_timeout is not None else settings.SMTP_POOL_IDLE_TIMEOUT
+        self.max_messages_per_connection = (
+            max_messages_per_connection
+            if max_messages_per_connection is not None
+            else settings.SMTP_POOL_MAX_MESSAGES
+        )
+        self.timeout = timeout if timeout is not None else settings.SMTP_TIMEOUT
+
+        self._idle: List[_PooledConnection] = []
+        self._lock = Lock()
+        self._slots = BoundedSemaphore(self.max_size)
+        self._checked_out = 0
+        self._reserved = 0
+
+    def _connect(self) -> _PooledConnection:
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_tls:
+                server.starttls()
+            if self.username:
+                server.login(self.username, self.password)
+        except Exception:
+            server.close()
+            raise
+        return _PooledConnection(server)
+
+    def _is_reusable(self, connection: _PooledConnection) -> bool:
+        if time.monotonic() - connection.last_used > self.idle_timeout:
+            return False
+        if connection.messages_sent >= self.max_messages_per_connection:
+            return False
+        try:
+            code, _ = connection.server.noop()
+        except Exception:
+            return False
+        return code == 250
+
+    def _checkout(self) -> Tuple[_PooledConnection, bool]:
+        while True:
+            with self._lock:
+                connection = self._idle.pop() if self._idle else None
+            if connection is None:
+                connection, reused = self._connect(), False
+                break
+            if self._is_reusable(connection):
+                reused = True
+                break
+            connection.close()
+        with self._lock:
+            self._checked_out += 1
+        return connection, reused
+
+    def _checkin(self, connection: _PooledConnection, keep: bool = True) -> None:
+        connection.last_used = time.monotonic()
+        keep = keep and connection.messages_sent < self.max_messages_per_connection
+        with self._lock:
+            # Keep the session idle only while it fits the budget next to the
+            # sessions checked out and the slots reserved by other senders
+            keep = keep and len(self._idle) + self._checked_out + self._reserved <= self.max_size
+            self._checked_out -= 1
+            if keep:
+                self._idle.append(connection)
+                return
+        connection.close()
+
+    def send_message(self, message: Message) -> None:
+        """
+        Send a message over a pooled session.
+
+        If a reused session turns out to have been dropped by the server, the
+        send is retried once on a freshly opened connection.
+        """
+        if not self._slots.acquire(timeout=self.timeout):
+            raise smtplib.SMTPException(
+                f"SMTP pool exhausted: all {self.max_size} connections busy for {self.timeout}s"
+            )
+        try:
+            self._send(message)
+        finally:
+            self._slots.release()
+
+    def reserve(self, count: int) -> int:
+        """
+        Take up to count connection slots from the pool's budget.
+
+        For senders that open their own connections. Waits up to the SMTP
+        timeout for the first slot and takes the rest only if they are free.
+        Idle sessions that no longer fit the budget are closed.
+
+        Returns:
+            int: Number of slots taken, 0 if none became free in time
+        """
+        if count <= 0 or not self._slots.acquire(timeout=self.timeout):
+            return 0
+        taken = 1
+        while taken < count and self._slots.acquire(blocking=False):
+            taken += 1
+
+        with self._lock:
+            self._reserved += taken
+            surplus = max(len(self._idle) + self._checked_out + self._reserved - self.max_size, 0)
+            closing, self._idle = self._idle[:surplus], self._idle[surplus:]
+        for connection in closing:
+            connection.close()
+        return taken
+
+    def release(self, count: int) -> None:
+        """Return slots taken with reserve()."""
+        with self._lock:
+            self._reserved -= count
+        for _ in range(count):
+            self._slots.release()
+
+    def _send(self, message: Message) -> None:
+        connection, reused = self._checkout()
+        try:
+            connection.server.send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            connection.close()
+            if not reused:
+                self._checkin(connection, keep=False)
+                raise
+            logger.info("smtp_pool_reconnecting", host=self.host)
+            try:
+                connection = self._connect()
+                connection.server.send_message(message)
+            except Exception:
+                self._checkin(connection, keep=False)
+                raise
+        except Exception:
+            self._checkin(connection, keep=False)
+            raise
+
+        connection.messages_sent += 1
+        self._checkin(connection)
+
+    def close(self) -> None:
+        """Close every idle connection held by the pool."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+
+_default_pool: Optional[SMTPConnectionPool] = None
+_default_pool_lock = Lock()
+
+def get_default_pool() -> SMTPConnectionPool:
+    """Return the SMTP pool shared by every EmailSender in this process."""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = SMTPConnectionPool()
+        return _default_pool
@@ -0,0 +1,119 @@
+# app/services/senders/throttle.py
+
+# Standard library imports
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Third-party imports
+import redis
+
+# Local application imports
+from app.core.config import settings
+from app.core.logging_config import logger
+
+# Atomically take up to ARGV[2] tokens from every bucket in KEYS. All
+# buckets grant the same count: the most any of them can give. ARGV[1] is
+# now in ms, followed by a (rate per second, capacity) pair per key.
+# Returns {granted, ms until each bucket has one more token}.
+TOKEN_BUCKET_SCRIPT = """
+local now = tonumber(ARGV[1])
+local requested = tonumber(ARGV[2])
+local rates, capacities, available = {}, {}, {}
+local granted = requested
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[1 + i * 2])
+    local capacity = tonumber(ARGV[2 + i * 2])
+    local state = redis.call('HMGET', key, 'tokens', 'ts')
+    local tokens = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    tokens = math.min(capacity, tokens + math.max(now - ts, 0) / 1000 * rate)
+    rates[i], capacities[i], available[i] = rate, capacity, tokens
+    granted = math.min(granted, math.floor(tokens))
+end
+granted = math.max(granted, 0)
+local wait = 0
+for i, key in ipairs(KEYS) do
+    local remaining = available[i] - granted
+    redis.call('HSET', key, 'tokens', tostring(remaining), 'ts', now)
+    redis.call('PEXPIRE', key, math.ceil(capacities[i] / rates[i] * 1000) + 1000)
+    if remaining < 1 then
+        wait = math.max(wait, (1 - remaining) / rates[i] * 1000)
+    end
+end
+return {granted, math.ceil(wait)}
+"""
+
+class TokenBucketLimiter:
+    """
+    Distributed token buckets shared by every worker, stored in Redis.
+
+    A bucket refills at its configured rate (SENDER_RATE_LIMITS) up to
+    SENDER_RATE_BURST seconds' worth of tokens. A send may need tokens from
+    several buckets, e.g. the SMS provider and the sending number. Buckets
+    with no configured rate are ignored. If Redis is unreachable, sends are
+    allowed and the provider's own limits apply.
+    """
+
+    KEY_PREFIX = "throttle:"
+
+    def __init__(
+        self,
+        rates: Optional[Dict[str, float]] = None,
+        burst: Optional[float] = None,
+        client: Optional[redis.Redis] = None
+    ):
+        self.rates = rates if rates is not None else settings.SENDER_RATE_LIMITS
+        self.burst = burst if burst is not None else settings.SENDER_RATE_BURST
+        self._client = client
+        self._script = None
+
+    @property
+    def client(self) -> redis.Redis:
+        if self._client is None:
+            self._client = redis.Redis.from_url(settings.REDIS_URL)
+        return self._client
+
+    def configured(self, keys: Sequence[str]) -> Tuple[str, ...]:
+        """Return the keys that have a positive rate configured."""
+        return tuple(key for key in keys if self.rates.get(key, 0) > 0)
+
+    def acquire(self, keys: Sequence[str], count: int = 1) -> List[float]:
+        """
+        Take tokens for count sends that share the same buckets.
+
+        Args:
+            keys: Bucket names, all of which must grant a token
+            count: Number of sends
+
+        Returns:
+            List[float]: Per send, 0 if it may go now, otherwise the seconds
+                until its token will be available
+        """
+        keys = self.configured(keys)
+        if not keys or count <= 0:
+            return [0.0] * count
+
+        if self._script is None:
+            self._script = self.client.register_script(TOKEN_BUCKET_SCRIPT)
+
+        args = [int(time.time() * 1000), count]
+        for key in keys:
+            rate = self.rates[key]
+            args.extend([rate, max(rate * self.burst, 1)])
+
+        try:
+            granted, wait_ms = self._script(keys=[self.KEY_PREFIX + key for key in keys], args=args)
+        except redis.RedisError as e:
+            logger.warning("sender_throttle_unavailable", error=str(e), buckets=list(keys))
+            return [0.0] * count
+
+        # Later sends queue behind each other at the slowest bucket's rate
+        granted = int(granted)
+        slowest_rate = min(self.rates[key] for key in keys)
+        return [0.0] * granted + [
+            int(wait_ms) / 1000 + position / slowest_rate
+            for position in range(count - granted)
+        ]
+
+# Process-wide limiter consulted by the channel senders
+token_bucket = TokenBucketLimiter()
@@ -1,33 +1,38 @@
 # app/services/template_service.py
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.template import NotificationTemplate
 from app.schemas.template import TemplateCreate, TemplateUpdate
 
 class TemplateService:
     @staticmethod
-    async def create_template(db: Session, template: TemplateCreate):
+    async def create_template(db: AsyncSession, template: TemplateCreate):
         new_template = NotificationTemplate(**template.model_dump())
         db.add(new_template)
-        db.commit()
-        db.refresh(new_template)
+        await db.commit()
+        await db.refresh(new_template)
         return new_template
 
     @staticmethod
-    async def get_templates(db: Session):
-        return db.query(NotificationTemplate).all()
+    async def get_templates(db: AsyncSession):
+        return (await db.scalars(select(NotificationTemplate))).all()
     
     @staticmethod
-    async def get_template_by_name(db: Session, name: str):
-        return db.query(NotificationTemplate).filter(NotificationTemplate.name == name).first()
+    async def get_template_by_name(db: AsyncSession, name: str):
+        return await db.scalar(
+            select(NotificationTemplate).where(NotificationTemplate.name == name).limit(1)
+        )
     
     @staticmethod
-    async def get_template(db: Session, template_id: str):
-        return db.query(NotificationTemplate).filter(NotificationTemplate.id == template_id).first()
+    async def get_template(db: AsyncSession, template_id: str):
+        return await db.scalar(
+            select(NotificationTemplate).where(NotificationTemplate.id == template_id)
+        )
 
     @staticmethod
-    async def update_template(db: Session, template_id: str, template_update: TemplateUpdate):
-        db_template = db.query(NotificationTemplate).filter(NotificationTemplate.id == template_id).first()
+    async def update_template(db: AsyncSession, template_id: str, template_update: TemplateUpdate):
+        db_template = await TemplateService.get_template(db, template_id)
         
         if not db_template:
             raise ValueError("Template not found")
@@ -35,17 +40,17 @@ class TemplateService:
         for key, value in template_update.model_dump(exclude_unset=True).items():
             setattr(db_template, key, value)
 
-        db.commit()
-        db.refresh(db_template)
+        await db.commit()
+        await db.refresh(db_template)
         return db_template
 
     @staticmethod
-    async def delete_template(db: Session, template_id: str):
-        db_template = db.query(NotificationTemplate).filter(NotificationTemplate.id == template_id).first()
+    async def delete_template(db: AsyncSession, template_id: str):
+        db_template = await TemplateService.get_template(db, template_id)
         
         if not db_template:
             return False
 
-        db.delete(db_template)
-        db.commit()
-        return True
\ No newline at end of file
+        await db.delete(db_template)
+        await db.commit()
+        return True
@@ -1,22 +1,25 @@
 from typing import Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, status
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 from app.models.user_preference import UserPreference
-from app.core.auth import get_password_hash, verify_password
+from app.core.security import check_password, failed_login_cache, hash_password
 from app.core.logging_config import logger
+from app.core.user_cache import user_cache
 
 class UserService:
     @staticmethod
     async def validate_unique_fields(
-        db: Session, 
+        db: AsyncSession, 
         email: Optional[str] = None, 
         phone: Optional[str] = None
     ) -> None:
         """Validate email and phone uniqueness"""
         if email:
-            existing_email = db.query(User).filter(User.email == email).first()
+            existing_email = await db.scalar(select(User.id).where(User.email == email).limit(1))
             if existing_email:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -24,7 +27,7 @@ class UserService:
                 )
         
         if phone:
-            existing_phone = db.query(User).filter(User.phone == phone).first()
+            existing_phone = await db.scalar(select(User.id).where(User.phone == phone).limit(1))
             if existing_phone:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -32,9 +35,9 @@ class UserService:
                 )
             
     @staticmethod
-    async def create_user(db: Session, user_create: UserCreate) -> User:
+    async def create_user(db: AsyncSession, user_create: UserCreate) -> User:
         # Check if user exists
-        if db.query(User).filter(User.email == user_create.email).first():
+        if await db.scalar(select(User.id).where(User.email == user_create.email).limit(1)):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered"
@@ -45,31 +48,43 @@ class UserService:
             email=user_create.email,
             phone=user_create.phone,
             full_name=user_create.full_name,
-            hashed_password=get_password_hash(user_create.password),
+            hashed_password=await hash_password(user_create.password),
             is_admin=user_create.is_admin
         )
         db.add(user)
-        db.commit()
-        db.refresh(user)
+        await db.commit()
+        await db.refresh(user)
         return user
 
     @staticmethod
-    async def get_user(db: Session, user_id: str) -> Optional[User]:
-        return db.query(User).filter(User.id == user_id).first()
+    async def get_user(db: AsyncSession, user_id: str) -> Optional[User]:
+        """Get a user with preferences eagerly loaded, as lazy loads are unavailable on AsyncSession."""
+        return await db.scalar(
+            select(User)
+            .where(User.id == user_id)
+            .options(selectinload(User.preferences))
+            .execution_options(populate_existing=True)
+        )
     
     @staticmethod
     async def authenticate_user(
-        db: Session, 
+        db: AsyncSession, 
         email: str, 
         password: str
     ) -> Optional[User]:
         """Authenticate user with email and password"""
         try:
-            user = db.query(User).filter(User.email == email).first()
+            user = await db.scalar(select(User).where(User.email == email))
             if not user:
                 return None
-            
-            if not verify_password(password, user.hashed_password):
+
+            # A pair that just failed against this password hash is rejected
+            # without another bcrypt round
+            if failed_login_cache.contains(email, password, user.hashed_password):
+                return None
+
+            if not await check_password(password, user.hashed_password):
+                failed_login_cache.add(email, password, user.hashed_password)
                 return None
                 
             return user
@@ -78,15 +93,15 @@ class UserService:
             return None
 
     @staticmethod
-    async def update_user(db: Session, user_id: str, user_update: UserUpdate) -> Optional[User]:
-        user = db.query(User).filter(User.id == user_id).first()
+    async def update_user(db: AsyncSession, user_id: str, user_update: UserUpdate) -> Optional[User]:
+        user = await db.scalar(select(User).where(User.id == user_id))
         if not user:
             return None
 
         # Handle basic user fields
         update_data = user_update.model_dump(exclude={'preferences'}, exclude_unset=True)
         if "password" in update_data:
-            update_data["hashed_password"] = get_password_hash(update_data.pop("password"))
+            update_data["hashed_password"] = await hash_password(update_data.pop("password"))
 
         # Only allow admin updates from admin users
         if "is_admin" in update_data and not user.is_admin:
@@ -100,11 +115,14 @@ class UserService:
 
         # Handle preferences if provided
         if user_update.preferences:
+            existing_preferences = {
+                preference.channel: preference
+                for preference in await db.scalars(
+                    select(UserPreference).where(UserPreference.user_id == user_id)
+                )
+            }
             for pref_update in user_update.preferences:
-                db_preference = db.query(UserPreference).filter(
-                    UserPreference.user_id == user_id,
-                    UserPreference.channel == pref_update.channel
-                ).first()
+                db_preference = existing_preferences.get(pref_update.channel)
 
                 if not db_preference:
                     # Create new preference if doesn't exist
@@ -113,22 +131,24 @@ class UserService:
                         channel=pref_update.channel
                     )
                     db.add(db_preference)
+                    existing_preferences[pref_update.channel] = db_preference
 
                 # Update preference fields
                 pref_data = pref_update.model_dump(exclude={'channel'}, exclude_unset=True)
                 for key, value in pref_data.items():
                     setattr(db_preference, key, value)
 
-        db.commit()
-        db.refresh(user)
-        return user
+        await db.commit()
+        await user_cache.invalidate(user_id)
+        return await UserService.get_user(db, user_id)
 
     @staticmethod
-    async def delete_user(db: Session, user_id: str) -> bool:
-        user = db.query(User).filter(User.id == user_id).first()
+    async def delete_user(db: AsyncSession, user_id: str) -> bool:
+        user = await db.scalar(select(User).where(User.id == user_id))
         if not user:
             return False
         
-        db.delete(user)
-        db.commit()
-        return True
\ No newline at end of file
+        await db.delete(user)
+        await db.commit()
+        await user_cache.invalidate(user_id)
+        return True
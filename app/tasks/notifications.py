@@ -1,58 +1,63 @@
 # app/tasks/notifications.py
 
 # Standard library imports
-from datetime import datetime
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import List, Optional
 
 # Third-party imports
 from celery import Task
-from celery.exceptions import MaxRetriesExceededError
 import pytz
+from sqlalchemy import and_, func, insert, or_, select, update
+from sqlalchemy.orm import joinedload, selectinload
 
 # Local application imports
-from app.core.celery import celery_app
-from app.core.exceptions import DeliveryError
+from app.core.celery import broker_priority, celery_app, queue_for
+from app.core.config import settings
 from app.core.logging_config import logger
 from app.db.session import SessionLocal
-from app.models import Notification, DeliveryStatus
+from app.models import Notification, DeliveryStatus, UserPreference
 from app.schemas.notification import NotificationStatus
-from app.services.senders.factory import NotificationSenderFactory
+from app.services.frequency_limiter import frequency_limiter
+from app.services.retry_policy import retry_policy
+from app.services.notification_service import NotificationService
+from app.services.senders.base import UNSUPPORTED_CHANNEL, SendResult
+from app.services.senders.factory import NotificationSenderFactory, UnsupportedChannelError
 
 # app/tasks/notifications.py
 class BaseNotificationTask(Task):
+    """
+    Base for single-notification tasks.
+
+    Delivery failures are handled inside the task and retried by
+    rescheduling the notification in the database, never by broker
+    countdowns. on_failure only covers tasks that crashed outside the
+    sender, e.g. on a database error.
+    """
     abstract = True
-    max_retries = 3
-    autoretry_for = (DeliveryError,)
-    retry_backoff = False  # Disable exponential backoff
-    retry_jitter = False   # Disable jitter
 
     def on_failure(self, exc, task_id, args, kwargs, einfo):
+        notification_id = args[0]
         with SessionLocal() as db:
-            notification_id = args[0]
             notification = db.query(Notification).filter(Notification.id == notification_id).first()
-            
-            if notification:
+
+            if notification and notification.status not in [
+                NotificationStatus.SENT,
+                NotificationStatus.FAILED_PERMANENT
+            ]:
+                error_code = getattr(exc, 'details', {}).get('error_code') or "INTERNAL_ERROR"
                 delivery_status = DeliveryStatus(
                     notification_id=notification_id,
                     attempt_number=notification.retry_count + 1,
                     status="failed",
                     error_message=str(exc),
-                    error_code=getattr(exc, 'error_code', None),
+                    error_code=error_code,
                     provider_response=getattr(exc, 'details', {})
                 )
                 db.add(delivery_status)
-                
-                notification.retry_count += 1
-                notification.error_message = str(exc)
-                
-                if isinstance(exc, MaxRetriesExceededError) or notification.retry_count >= self.max_retries:
-                    notification.status = NotificationStatus.FAILED_PERMANENT
-                else:
-                    notification.status = NotificationStatus.FAILED
-                    # Retry with fixed 10 second delay
-                    self.retry(exc=exc, countdown=10)
-                    
+                _apply_values(notification, _failure_values(notification, error_code, str(exc), datetime.now(pytz.UTC)))
                 db.commit()
-                
+
         logger.error("notification_task_failed",
             notification_id=notification_id,
             error=str(exc),
@@ -60,123 +65,519 @@ class BaseNotificationTask(Task):
         )
 
 @celery_app.task(base=BaseNotificationTask, name="send_notification")
-def send_notification(notification_id: str):
-    """Send a single notification"""
+def send_notification(notification_id: str, channel: Optional[str] = None):
+    """
+    Send a single notification.
+
+    Kept for sending one notification by hand or from outside this
+    service; the scheduler itself only enqueues send_notification_batch.
+
+    The notification is claimed by committing it as 'processing', loaded
+    with anything its sender reads beyond the row's contact snapshot, sent,
+    and finished with one write of its final state and delivery attempt
+    and a single commit. A failed attempt is rescheduled with backoff via
+    scheduled_for unless the failure is permanent or the notification is
+    out of attempts.
+
+    Delivery is at least once: if the worker dies after the provider
+    accepted the message but before the final commit, the notification
+    stays 'processing' until requeue_stale_notifications returns it to
+    'pending' and it is sent again.
+
+    Args:
+        notification_id: The notification to send
+        channel: The notification's channel, if known, so the claim joins only
+            the relationships that channel's sender reads
+    """
     log = logger.bind(task="send_notification", notification_id=notification_id)
     
     with SessionLocal() as db:
+        notification = None
         try:
-            notification = (db.query(Notification)
-                          .filter(Notification.id == notification_id)
-                          .with_for_update(skip_locked=True)
-                          .first())
-
-            if not notification or notification.status in [
-                NotificationStatus.SENT,
-                NotificationStatus.FAILED_PERMANENT
-            ]:
+            notification = _claim_notification(db, notification_id, channel)
+            if notification is None:
                 return False
+            NotificationService.refresh_contact_snapshots(db, [notification])
 
-            notification.status = NotificationStatus.PROCESSING
-            db.commit()
-
-            delivery_status = DeliveryStatus(
-                notification_id=notification_id,
-                attempt_number=notification.retry_count + 1,
-                status="processing"
-            )
-            db.add(delivery_status)
-            db.commit()
+            reason = "frequency_limit"
+            wait = _frequency_limit_waits(db, notification.channel, [notification])[0]
+            if not wait:
+                reason = "provider_preflight"
+                wait = _preflight_waits(notification.channel, [notification])[0]
+                _release_frequency_slots(notification.channel, [notification], [wait])
+            if wait:
+                notification.status = NotificationStatus.PENDING
+                notification.scheduled_for = datetime.now(pytz.UTC) + timedelta(seconds=wait)
+                db.commit()
+                log.info("notification_deferred", reason=reason, retry_after=wait)
+                return False
 
             try:
                 sender = NotificationSenderFactory.get_sender(notification.channel)
                 result = sender.send(notification)
+                sender.record_results([result])
+            except Exception as e:
+                result = SendResult(success=False, error_code=_sender_error_code(e), error_message=str(e))
 
-                if result.success:
-                    notification.status = NotificationStatus.SENT
-                    notification.sent_at = datetime.now(pytz.UTC)
-                    delivery_status.status = "delivered"
-                    delivery_status.delivered_at = notification.sent_at
-                    delivery_status.provider_response = result.response
-                    log.info("notification_delivered_successfully")
-                else:
-                    raise DeliveryError(
-                        message=result.error_message,
-                        details={
-                            "error_code": result.error_code,
-                            "channel": notification.channel,
-                            "provider_response": result.response
-                        }
-                    )
+            _record_send_results(db, [notification], [result])
+            db.commit()
 
-            except Exception as e:
-                notification.retry_count += 1
-                delivery_status.status = "failed"
-                delivery_status.error_message = str(e)
-                
-                if isinstance(e, MaxRetriesExceededError) or notification.retry_count >= notification.max_retries:
-                    notification.status = NotificationStatus.FAILED_PERMANENT
-                else:
-                    notification.status = NotificationStatus.FAILED
-                    
-                raise
-
-            finally:
-                db.commit()
+            if result.success:
+                log.info("notification_delivered_successfully")
+            else:
+                log.warning("notification_delivery_failed",
+                    error=result.error_message,
+                    error_code=result.error_code,
+                    attempt=notification.retry_count + 1,
+                    channel=notification.channel
+                )
+            return result.success
 
         except Exception as e:
             db.rollback()
-            log.error("notification_delivery_failed",
+            log.error("notification_task_error",
                 error=str(e),
                 retry_count=notification.retry_count if notification else 0,
                 channel=notification.channel if notification else None
             )
             raise
 
-@celery_app.task(name="schedule_pending_notifications")
-def schedule_pending_notifications():
-    """Periodic task to check and schedule pending notifications"""
-    log = logger.bind(task="schedule_pending_notifications")
-    log.info("checking_pending_notifications")
-    
+def _claim_notification(db, notification_id: str, channel: Optional[str] = None):
+    """
+    Claim a notification as 'processing' and load what its sender reads.
+
+    The claim is a conditional UPDATE committed before anything is sent, so
+    concurrent tasks for the same notification find nothing to claim and no
+    row lock or transaction stays open while the provider is called.
+    """
+    load_options = _sender_load_options(channel, batch=False)
+    claimed_id = db.execute(
+        update(Notification)
+        .where(
+            Notification.id == notification_id,
+            Notification.status.in_([NotificationStatus.PENDING, NotificationStatus.QUEUED]),
+            Notification.scheduled_for <= datetime.now(pytz.UTC),
+            Notification.retry_count < Notification.max_retries
+        )
+        .values(status=NotificationStatus.PROCESSING)
+        .returning(Notification.id)
+        .execution_options(synchronize_session=False)
+    ).scalar_one_or_none()
+    db.commit()
+    if claimed_id is None:
+        return None
+
+    return (
+        db.query(Notification)
+        .options(*load_options)
+        .filter(Notification.id == claimed_id)
+        .first()
+    )
+
+@celery_app.task(name="send_notification_batch")
+def send_notification_batch(channel: str, notification_ids: List[str]):
+    """
+    Send a chunk of same-channel notifications.
+
+    The chunk is claimed with a single UPDATE ... RETURNING that is
+    committed before sending, delivered through the channel sender's
+    send_many, and finished with one bulk status update, one bulk
+    DeliveryStatus insert and a single commit. As with send_notification,
+    delivery is at least once: rows left 'processing' by a worker that died
+    mid-batch are returned to 'pending' by requeue_stale_notifications.
+    """
+    log = logger.bind(task="send_notification_batch", channel=channel, batch_size=len(notification_ids))
+
+    load_options = _sender_load_options(channel, batch=True)
+
     with SessionLocal() as db:
-        now = datetime.now(pytz.UTC)
-        
         try:
-            pending_notifications = (
-                db.query(Notification)
-                .filter(
-                    Notification.status == NotificationStatus.PENDING,
-                    Notification.scheduled_for <= now,
+            claimed_ids = db.execute(
+                update(Notification)
+                .where(
+                    Notification.id.in_(notification_ids),
+                    Notification.channel == channel,
+                    Notification.status.in_([NotificationStatus.PENDING, NotificationStatus.QUEUED]),
+                    Notification.scheduled_for <= datetime.now(pytz.UTC),
                     Notification.retry_count < Notification.max_retries
                 )
-                .with_for_update(skip_locked=True)
-                .limit(100)  # Process in batches
+                .values(status=NotificationStatus.PROCESSING)
+                .returning(Notification.id)
+                .execution_options(synchronize_session=False)
+            ).scalars().all()
+            db.commit()
+
+            if not claimed_ids:
+                log.info("notification_batch_nothing_to_claim")
+                return 0
+
+            notifications = (
+                db.query(Notification)
+                .options(*load_options)
+                .filter(Notification.id.in_(claimed_ids))
                 .all()
             )
 
-            scheduled_count = 0
-            for notification in pending_notifications:
+            claimed_count = len(notifications)
+            NotificationService.refresh_contact_snapshots(db, notifications)
+            notifications = _defer_over_frequency_limit(db, channel, notifications)
+            waits = _preflight_waits(channel, notifications)
+            _release_frequency_slots(channel, notifications, waits)
+            notifications = _defer_notifications(db, notifications, waits)
+
+            results = []
+            if notifications:
                 try:
-                    send_notification.apply_async(
-                        args=[str(notification.id)],
-                        priority=notification.priority
-                    )
-                    scheduled_count += 1
+                    sender = NotificationSenderFactory.get_sender(channel)
+                    results = sender.send_many(notifications)
+                    sender.record_results(results)
                 except Exception as e:
-                    log.error("notification_scheduling_failed",
-                        notification_id=notification.id,
-                        error=str(e)
-                    )
-
-            log.info("notifications_scheduled",
-                count=scheduled_count,
-                total_pending=len(pending_notifications)
+                    log.error("notification_batch_sender_error", error=str(e))
+                    results = [
+                        SendResult(success=False, error_code=_sender_error_code(e), error_message=str(e))
+                        for _ in notifications
+                    ]
+
+            sent_count = _record_send_results(db, notifications, results)
+            db.commit()
+
+            log.info("notification_batch_processed",
+                claimed=claimed_count,
+                deferred=claimed_count - len(notifications),
+                sent=sent_count,
+                failed=len(notifications) - sent_count
             )
+            return sent_count
 
         except Exception as e:
             db.rollback()
-            log.error("notification_scheduling_failed",
-                error=str(e)
+            log.error("notification_batch_failed", error=str(e))
+            raise
+
+def _sender_error_code(error: Exception) -> str:
+    """Error code for a send that raised; channels without a sender fail permanently."""
+    return UNSUPPORTED_CHANNEL if isinstance(error, UnsupportedChannelError) else "INTERNAL_ERROR"
+
+def _sender_load_options(channel: Optional[str], batch: bool) -> list:
+    """
+    Eager-load the relationships the channel's sender reads, and only those.
+
+    A single send joins them into its claim query. A batch loads each one
+    with a single IN query over the whole batch, filling the identity map,
+    so the query count does not grow with the batch size. Built-in senders
+    read only the contact snapshot and need nothing loaded. With no channel,
+    or if the sender's relationships cannot be read, nothing is eager-loaded
+    and plugin senders fall back to lazy loads. The sender itself is not
+    built here; failures to build it are reported at send time.
+    """
+    if not channel:
+        return []
+    try:
+        relationships = NotificationSenderFactory.get_relationships(channel)
+        if batch:
+            return [selectinload(getattr(Notification, name)) for name in relationships]
+        return [joinedload(getattr(Notification, name), innerjoin=True) for name in relationships]
+    except Exception as e:
+        logger.warning("sender_relationships_unavailable", channel=channel, error=str(e))
+        return []
+
+def _frequency_limit_waits(db, channel: str, notifications) -> List[float]:
+    """
+    Check and count notifications against their recipients' frequency_limit.
+
+    Limits come from one preference query and are checked with a single Redis
+    round trip for the whole list.
+
+    Returns:
+        List[float]: Per notification, 0 if it may be sent now, otherwise seconds to wait
+    """
+    user_ids = {notification.user_id for notification in notifications}
+    limits = dict(
+        db.query(UserPreference.user_id, UserPreference.frequency_limit)
+        .filter(
+            UserPreference.user_id.in_(user_ids),
+            UserPreference.channel == channel,
+            UserPreference.frequency_limit.isnot(None)
+        )
+        .all()
+    )
+    if not limits:
+        return [0.0] * len(notifications)
+
+    return frequency_limiter.check_many([
+        (notification.user_id, channel, limits.get(notification.user_id), notification.id)
+        for notification in notifications
+    ])
+
+def _preflight_waits(channel: str, notifications) -> List[float]:
+    """
+    Check the provider's circuit breaker and rate limits for notifications about to be sent.
+
+    Returns:
+        List[float]: Per notification, 0 if it may be sent now, otherwise seconds to wait
+    """
+    if not notifications:
+        return []
+    try:
+        sender = NotificationSenderFactory.get_sender(channel)
+    except ValueError:
+        # Unsupported channels are reported as delivery failures at send time
+        return [0.0] * len(notifications)
+    return [
+        (result.retry_after or 0.0) if result is not None else 0.0
+        for result in sender.preflight(notifications)
+    ]
+
+def _release_frequency_slots(channel: str, notifications, waits) -> None:
+    """
+    Give back the frequency slots of notifications deferred after the frequency check.
+
+    The frequency check counts a notification as it allows it; one that the
+    throttle or circuit breaker then holds back has not been sent and must
+    not count against its recipient's limit until it is.
+    """
+    deferred = [
+        (notification.user_id, channel, notification.id)
+        for notification, wait in zip(notifications, waits)
+        if wait
+    ]
+    frequency_limiter.release(deferred)
+
+def _defer_over_frequency_limit(db, channel: str, notifications) -> list:
+    """
+    Push over-limit notifications back to 'pending' until their window frees up.
+
+    Returns:
+        list: The notifications that may be sent now
+    """
+    return _defer_notifications(db, notifications, _frequency_limit_waits(db, channel, notifications))
+
+def _defer_notifications(db, notifications, waits) -> list:
+    """
+    Push notifications with a non-zero wait back to 'pending', scheduled after the wait.
+
+    Deferral does not count as a delivery attempt, so retry_count is left
+    alone and no DeliveryStatus row is written.
+
+    Returns:
+        list: The notifications that may be sent now
+    """
+    now = datetime.now(pytz.UTC)
+    allowed = []
+    deferred_updates = []
+
+    for notification, wait in zip(notifications, waits):
+        if wait:
+            deferred_updates.append({
+                "id": notification.id,
+                "status": NotificationStatus.PENDING,
+                "scheduled_for": now + timedelta(seconds=wait)
+            })
+        else:
+            allowed.append(notification)
+
+    if deferred_updates:
+        db.execute(update(Notification), deferred_updates)
+    return allowed
+
+def _failure_values(notification, error_code, error_message, now: datetime) -> dict:
+    """
+    Column values for a notification after a failed attempt.
+
+    Retryable failures go back to 'pending' with scheduled_for pushed out by
+    the retry policy's jittered backoff; the rest become 'failed_permanent'.
+    """
+    retry_count = notification.retry_count + 1
+    delay = retry_policy.next_delay(retry_count, notification.max_retries, error_code)
+    values = {"retry_count": retry_count, "error_message": error_message}
+    if delay is None:
+        values["status"] = NotificationStatus.FAILED_PERMANENT
+    else:
+        values["status"] = NotificationStatus.PENDING
+        values["scheduled_for"] = now + timedelta(seconds=delay)
+    return values
+
+def _apply_values(notification, values: dict) -> None:
+    for key, value in values.items():
+        setattr(notification, key, value)
+
+def _record_send_results(db, notifications, results) -> int:
+    """Write final notification states and delivery attempts with two bulk statements."""
+    now = datetime.now(pytz.UTC)
+    notification_updates = []
+    delivery_rows = []
+    sent_count = 0
+
+    for notification, result in zip(notifications, results):
+        attempt_number = notification.retry_count + 1
+        if result.success:
+            sent_count += 1
+            notification_updates.append({
+                "id": notification.id,
+                "status": NotificationStatus.SENT,
+                "sent_at": now,
+                "error_message": None
+            })
+            delivery_rows.append({
+                "notification_id": notification.id,
+                "attempt_number": attempt_number,
+                "status": "delivered",
+                "delivered_at": now,
+                "provider_response": result.response
+            })
+        else:
+            notification_updates.append({
+                "id": notification.id,
+                **_failure_values(notification, result.error_code, result.error_message, now)
+            })
+            delivery_rows.append({
+                "notification_id": notification.id,
+                "attempt_number": attempt_number,
+                "status": "failed",
+                "error_code": result.error_code,
+                "error_message": result.error_message,
+                "provider_response": result.response
+            })
+
+    if notification_updates:
+        db.execute(update(Notification), notification_updates)
+    if delivery_rows:
+        db.execute(insert(DeliveryStatus), delivery_rows)
+    return sent_count
+
+def dispatch_due_notifications(db, batch_size: int) -> int:
+    """
+    Queue up to batch_size due notifications for delivery.
+
+    Due rows are selected oldest first with SKIP LOCKED and flipped to
+    'queued' in a single UPDATE ... RETURNING, then enqueued as
+    send_notification_batch messages grouped by channel and priority, on
+    the queue for that channel and priority band. The
+    transaction commits after enqueueing; a worker that picks a message up
+    early blocks on the row locks until then.
+
+    Returns:
+        int: Number of notifications enqueued
+    """
+    log = logger.bind(task="dispatch_due_notifications")
+    now = datetime.now(pytz.UTC)
+
+    due_ids = (
+        select(Notification.id)
+        .where(
+            Notification.status == NotificationStatus.PENDING,
+            Notification.scheduled_for <= now,
+            Notification.retry_count < Notification.max_retries
+        )
+        .order_by(Notification.scheduled_for, Notification.priority.desc())
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+
+    try:
+        due_notifications = db.execute(
+            update(Notification)
+            .where(Notification.id.in_(due_ids))
+            .values(status=NotificationStatus.QUEUED)
+            .returning(Notification.id, Notification.channel, Notification.priority)
+            .execution_options(synchronize_session=False)
+        ).all()
+
+        # Group by channel and priority so each batch keeps its priority
+        groups = defaultdict(list)
+        for notification_id, channel, priority in due_notifications:
+            groups[(channel, priority or 1)].append(str(notification_id))
+
+        scheduled_count = 0
+        chunk_size = settings.NOTIFICATION_DISPATCH_BATCH_SIZE
+        for (channel, priority), notification_ids in groups.items():
+            for start in range(0, len(notification_ids), chunk_size):
+                chunk = notification_ids[start:start + chunk_size]
+                send_notification_batch.apply_async(
+                    args=[channel, chunk],
+                    queue=queue_for(channel, priority),
+                    priority=broker_priority(priority)
+                )
+                scheduled_count += len(chunk)
+
+        db.commit()
+        return scheduled_count
+
+    except Exception as e:
+        db.rollback()
+        log.error("notification_scheduling_failed", error=str(e))
+        raise
+
+# Seconds past the task hard time limit before a 'processing' row counts as abandoned
+PROCESSING_TIMEOUT_MARGIN = 300
+
+def processing_timeout() -> int:
+    """
+    Seconds after which a 'processing' notification is treated as abandoned.
+
+    Celery kills a task after task_time_limit, so only a row older than
+    that can belong to a worker that is gone rather than one still sending.
+    """
+    minimum = celery_app.conf.task_time_limit + PROCESSING_TIMEOUT_MARGIN
+    return max(settings.NOTIFICATION_PROCESSING_TIMEOUT or 0, minimum)
+
+def requeue_stale_notifications(db) -> int:
+    """
+    Return notifications stuck in 'queued' or 'processing' to 'pending'.
+
+    Covers broker messages lost between dispatch and claim, and workers
+    that died between claiming a notification and recording its result.
+    Claims are idempotent, so a notification that is merely slow to be
+    picked up is at worst enqueued twice and sent once; one whose worker
+    died after the provider accepted it is sent again.
+    """
+    now = datetime.now(pytz.UTC)
+    queued_cutoff = now - timedelta(seconds=settings.NOTIFICATION_QUEUED_TIMEOUT)
+    processing_cutoff = now - timedelta(seconds=processing_timeout())
+    requeued = db.execute(
+        update(Notification)
+        .where(
+            or_(
+                and_(
+                    Notification.status == NotificationStatus.QUEUED,
+                    Notification.updated_at < queued_cutoff
+                ),
+                and_(
+                    Notification.status == NotificationStatus.PROCESSING,
+                    Notification.updated_at < processing_cutoff
+                )
             )
-            raise
\ No newline at end of file
+        )
+        .values(status=NotificationStatus.PENDING)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    return requeued
+
+def oldest_pending_scheduled_for(db):
+    """Return the earliest scheduled_for among notifications still waiting to be dispatched."""
+    return db.execute(
+        select(func.min(Notification.scheduled_for)).where(
+            Notification.status == NotificationStatus.PENDING,
+            Notification.retry_count < Notification.max_retries
+        )
+    ).scalar()
+
+@celery_app.task(name="schedule_pending_notifications")
+def schedule_pending_notifications():
+    """
+    Periodic fallback that drains due notifications for a bounded time.
+
+    Deployments running the continuous scheduler (notification_scheduler.py)
+    do not need this task in their beat schedule.
+    """
+    # Imported here to avoid a circular import with the scheduler module
+    from app.tasks.scheduler import NotificationScheduler
+
+    log = logger.bind(task="schedule_pending_notifications")
+    log.info("checking_pending_notifications")
+
+    scheduled_count = NotificationScheduler().drain(max_seconds=settings.SCHEDULER_BEAT_DRAIN_SECONDS)
+    log.info("notifications_scheduled", count=scheduled_count)
+    return scheduled_count
\ No newline at end of file
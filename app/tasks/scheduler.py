@@ -0,0 +1,126 @@
+# app/tasks/scheduler.py
+
+# Standard library imports
+from datetime import datetime
+import threading
+import time
+from typing import Optional
+
+# Third-party imports
+import pytz
+
+# Local application imports
+from app.core.config import settings
+from app.core.logging_config import logger
+from app.db.session import SessionLocal
+from app.tasks.notifications import (
+    dispatch_due_notifications,
+    oldest_pending_scheduled_for,
+    requeue_stale_notifications,
+)
+
+
+class NotificationScheduler:
+    """
+    Continuous dispatcher for due notifications.
+
+    Keeps draining while full batches of due rows remain, backs off
+    exponentially between SCHEDULER_MIN_IDLE and SCHEDULER_MAX_IDLE while the
+    queue is empty, and wakes early when the next scheduled_for falls inside
+    the back-off window. Each pass reports scheduler lag: now minus the
+    oldest due scheduled_for.
+    """
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        min_idle: Optional[float] = None,
+        max_idle: Optional[float] = None,
+    ):
+        self.batch_size = batch_size or settings.SCHEDULER_BATCH_SIZE
+        self.min_idle = min_idle if min_idle is not None else settings.SCHEDULER_MIN_IDLE
+        self.max_idle = max_idle if max_idle is not None else settings.SCHEDULER_MAX_IDLE
+        self.idle = self.min_idle
+        self.stop_event = threading.Event()
+        self._last_requeue = 0.0
+        self.log = logger.bind(component="notification_scheduler")
+
+    def run_once(self):
+        """
+        Dispatch one batch of due notifications.
+
+        Returns:
+            tuple: (number dispatched, earliest pending scheduled_for or None)
+        """
+        with SessionLocal() as db:
+            if time.monotonic() - self._last_requeue >= settings.NOTIFICATION_QUEUED_TIMEOUT / 2:
+                requeued = requeue_stale_notifications(db)
+                self._last_requeue = time.monotonic()
+                if requeued:
+                    self.log.warning("stale_notifications_requeued", count=requeued)
+
+            dispatched = dispatch_due_notifications(db, self.batch_size)
+            oldest = oldest_pending_scheduled_for(db)
+
+        now = datetime.now(pytz.UTC)
+        lag = max(0.0, (now - oldest).total_seconds()) if oldest and oldest <= now else 0.0
+        self.log.info("scheduler_lag", lag_seconds=lag, dispatched=dispatched)
+        return dispatched, oldest
+
+    def next_sleep(self, dispatched: int, oldest: Optional[datetime], now: datetime) -> float:
+        """
+        Decide how long to wait before the next pass.
+
+        A full batch means more rows are probably due, so the next pass runs
+        immediately. Otherwise the idle interval resets after useful work and
+        doubles after an empty pass, capped at max_idle, and is shortened to
+        wake for the earliest pending scheduled_for.
+        """
+        if dispatched >= self.batch_size:
+            self.idle = self.min_idle
+            return 0.0
+
+        if dispatched > 0:
+            self.idle = self.min_idle
+        else:
+            self.idle = min(self.idle * 2, self.max_idle)
+
+        sleep_for = self.idle
+        if oldest is not None and oldest > now:
+            sleep_for = min(sleep_for, (oldest - now).total_seconds())
+        return max(sleep_for, 0.0)
+
+    def drain(self, max_seconds: Optional[float] = None) -> int:
+        """
+        Dispatch full batches until the backlog is cleared or max_seconds elapses.
+
+        Returns:
+            int: Total number of notifications dispatched
+        """
+        deadline = time.monotonic() + max_seconds if max_seconds else None
+        total = 0
+        while not self.stop_event.is_set():
+            dispatched, _ = self.run_once()
+            total += dispatched
+            if dispatched < self.batch_size:
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+        return total
+
+    def run_forever(self) -> None:
+        """Run the scheduler loop until stop() is called."""
+        self.log.info("scheduler_started", batch_size=self.batch_size)
+        while not self.stop_event.is_set():
+            try:
+                dispatched, oldest = self.run_once()
+                sleep_for = self.next_sleep(dispatched, oldest, datetime.now(pytz.UTC))
+            except Exception as e:
+                self.log.error("scheduler_pass_failed", error=str(e))
+                sleep_for = self.max_idle
+            if sleep_for:
+                self.stop_event.wait(sleep_for)
+        self.log.info("scheduler_stopped")
+
+    def stop(self) -> None:
+        self.stop_event.set()
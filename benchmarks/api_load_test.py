@@ -0,0 +1,94 @@
+# benchmarks/api_load_test.py
+"""
+Load-test authenticated API endpoints under concurrency.
+
+Logs in once, then keeps --concurrency requests in flight against each
+--path for --duration seconds and reports requests/sec and latency
+percentiles. Run it against a build on the synchronous sessions and one on
+the async engine, with the same uvicorn worker count, to compare throughput.
+
+Usage:
+    python -m benchmarks.api_load_test \
+        --base-url http://localhost:8000/api/v1 \
+        --email admin@example.com --password secret \
+        --path /users/me --path /preferences/ --path /templates/{template_id} \
+        --concurrency 200 --duration 30
+"""
+
+# Standard library imports
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List, Optional
+
+# Third-party imports
+import httpx
+
+async def login(client: httpx.AsyncClient, email: str, password: str) -> str:
+    response = await client.post("/users/login", data={"username": email, "password": password})
+    response.raise_for_status()
+    body = response.json()
+    if body.get("status") != "success":
+        raise SystemExit(f"login failed: {body.get('message')}")
+    return body["data"]["access_token"]
+
+async def run_path(client: httpx.AsyncClient, path: str, concurrency: int, duration: float, report: bool = True) -> None:
+    latencies: List[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker() -> None:
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                response = await client.get(path)
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    if not report:
+        return
+    if not latencies:
+        print(f"{path}: no requests completed")
+        return
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{path}: {len(latencies) / elapsed:,.0f} req/s over {len(latencies):,} requests, "
+        f"{errors} errors, p50 {quantiles[49]:.1f} ms, p95 {quantiles[94]:.1f} ms, "
+        f"p99 {quantiles[98]:.1f} ms"
+    )
+
+async def main(args: argparse.Namespace) -> None:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        token: Optional[str] = args.token or await login(client, args.email, args.password)
+        client.headers["Authorization"] = f"Bearer {token}"
+
+        for path in args.path:
+            # Warm up connections and caches before measuring
+            await run_path(client, path, args.concurrency, min(2.0, args.duration), report=False)
+            await run_path(client, path, args.concurrency, args.duration)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000/api/v1")
+    parser.add_argument("--token", help="Bearer token; skips the login step")
+    parser.add_argument("--email")
+    parser.add_argument("--password")
+    parser.add_argument("--path", action="append", help="Endpoint to load, relative to --base-url; repeatable")
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+    if not args.token and not (args.email and args.password):
+        parser.error("either --token or --email and --password is required")
+    args.path = args.path or ["/users/me"]
+    asyncio.run(main(args))
@@ -1,12 +1,28 @@
 # celery_worker.py (create in root directory)
 import os
+
+# Worker processes run one task at a time and need far fewer DB connections than the API
+os.environ.setdefault("DB_POOL_PROFILE", "worker")
+
+from celery.signals import worker_process_init, worker_process_shutdown
 from app.core.celery import celery_app
+from app.services.senders.factory import sender_registry
 from app.tasks.notifications import send_notification, schedule_pending_notifications
 
-# Add periodic task to check pending notifications
+# Periodic fallback for deployments not running notification_scheduler.py
 celery_app.conf.beat_schedule = {
     'check-pending-notifications': {
         'task': 'schedule_pending_notifications',
         'schedule': 60.0,  # Run every minute
     },
-}
\ No newline at end of file
+}
+
+@worker_process_init.connect
+def open_senders(**kwargs):
+    """Set up pooled sender clients once per worker process."""
+    sender_registry.open()
+
+@worker_process_shutdown.connect
+def close_senders(**kwargs):
+    """Release pooled sender clients when the worker process exits."""
+    sender_registry.close()
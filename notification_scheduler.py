@@ -0,0 +1,18 @@
+# notification_scheduler.py (run from the root directory)
+import os
+import signal
+
+# The scheduler holds at most one DB connection at a time
+os.environ.setdefault("DB_POOL_PROFILE", "worker")
+
+from app.tasks.scheduler import NotificationScheduler
+
+def main():
+    """Run the continuous notification scheduler until SIGINT or SIGTERM."""
+    scheduler = NotificationScheduler()
+    signal.signal(signal.SIGTERM, lambda signum, frame: scheduler.stop())
+    signal.signal(signal.SIGINT, lambda signum, frame: scheduler.stop())
+    scheduler.run_forever()
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,9 @@ setup(
         # Web Server
         "aiohttp",
 
+        # Push Provider HTTP Client
+        "httpx",
+
         # CORS
         "aiosmtplib",
 
@@ -22,6 +25,7 @@ setup(
         "sqlalchemy",
         "alembic",
         "psycopg2-binary",
+        "asyncpg",
         
         # Data Validation
         "pydantic",
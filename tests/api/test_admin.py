@@ -0,0 +1,29 @@
+# tests/api/test_admin.py
+
+# Standard library imports
+from unittest.mock import patch
+
+# Third-party imports
+import pytest
+
+# Local application imports
+from app.services.senders.circuit_breaker import circuit_breaker
+
+@pytest.mark.asyncio
+async def test_get_circuit_breakers(client, admin_auth_headers):
+    """Test listing provider circuit breakers"""
+    states = {"twilio": {"state": "open", "failures": 6, "opened_at": 4.0, "retry_in": 24.0}}
+    with patch.object(circuit_breaker, "states", return_value=states):
+        response = client.get("/api/v1/admin/circuit-breakers", headers=admin_auth_headers)
+
+    assert response.status_code == 200
+    assert response.json()["data"] == states
+
+@pytest.mark.asyncio
+async def test_get_circuit_breakers_without_redis(client, admin_auth_headers):
+    """Test the breaker listing answers 503 instead of failing when Redis is down"""
+    with patch.object(circuit_breaker, "states", return_value=None):
+        response = client.get("/api/v1/admin/circuit-breakers", headers=admin_auth_headers)
+
+    assert response.status_code == 503
+    assert response.json()["status"] == "error"
@@ -1,7 +1,10 @@
 # tests/api/test_notifications.py
 
 # Standard library imports
+import csv
 from datetime import datetime, timedelta
+import io
+import json
 from unittest.mock import Mock, patch
 from uuid import uuid4
 
@@ -9,6 +12,9 @@ from uuid import uuid4
 import pytest
 import pytz
 
+# Local application imports
+from app.models.notification import Notification
+
 @pytest.mark.asyncio
 async def test_create_notification_without_db(client, mock_notification):
     """Test notification creation without database"""
@@ -107,6 +113,77 @@ async def test_list_notifications(client, admin_auth_headers, test_notification)
     assert isinstance(data, list)
     assert len(data) > 0
 
+@pytest.mark.asyncio
+async def test_list_notifications_cursor_pagination(client, admin_auth_headers, test_db, test_admin_user, test_template):
+    """Test walking notifications page by page with next_cursor"""
+    for i in range(5):
+        test_db.add(Notification(
+            user_id=test_admin_user.id,
+            template_id=test_template.id,
+            channel="email",
+            content=f"Test content {i}",
+            status="pending",
+            scheduled_for=datetime.now(pytz.UTC) + timedelta(hours=1)
+        ))
+    test_db.commit()
+
+    seen = []
+    cursor = None
+    while True:
+        url = "/api/v1/notifications/?limit=2&status=pending"
+        if cursor:
+            url += f"&cursor={cursor}"
+        response = client.get(url, headers=admin_auth_headers)
+        assert response.status_code == 200
+        body = response.json()
+        assert len(body["data"]) <= 2
+        seen.extend(item["id"] for item in body["data"])
+        cursor = body["next_cursor"]
+        if not cursor:
+            break
+
+    assert len(seen) == 5
+    assert len(set(seen)) == 5
+
+@pytest.mark.asyncio
+async def test_list_notifications_invalid_cursor(client, admin_auth_headers):
+    """Test that a malformed cursor is rejected"""
+    response = client.get(
+        "/api/v1/notifications/?cursor=not-a-cursor",
+        headers=admin_auth_headers
+    )
+
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_export_notifications_ndjson(client, admin_auth_headers, test_notification, test_delivery_status):
+    """Test streaming an NDJSON export with delivery history joined"""
+    response = client.get(
+        "/api/v1/notifications/export?format=ndjson&include_delivery=true",
+        headers=admin_auth_headers
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) == 1
+    assert rows[0]["id"] == str(test_notification.id)
+    assert rows[0]["delivery_id"] == str(test_delivery_status.id)
+
+@pytest.mark.asyncio
+async def test_export_notifications_csv(client, admin_auth_headers, test_notification):
+    """Test streaming a CSV export with a header row"""
+    response = client.get(
+        "/api/v1/notifications/export?format=csv&status=pending",
+        headers=admin_auth_headers
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 1
+    assert rows[0]["id"] == str(test_notification.id)
+
 @pytest.mark.asyncio
 async def test_get_delivery_status(client, admin_auth_headers, test_notification, test_delivery_status):
     """Test getting delivery status for a notification"""
@@ -155,4 +232,30 @@ async def test_update_sent_notification(client, admin_auth_headers, test_notific
     )
 
     assert response.status_code == 400
-    assert "already been sent" in response.json()["detail"]
\ No newline at end of file
+    assert "already been sent" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_create_notification_batch(client, admin_auth_headers, test_admin_user, test_template):
+    """Test batch creation reports per-item success and failure"""
+    valid_item = {
+        "user_id": str(test_admin_user.id),
+        "template_id": str(test_template.id),
+        "channel": "email",
+        "variables": {"name": "Test User"}
+    }
+    invalid_item = {**valid_item, "template_id": str(uuid4())}
+
+    response = client.post(
+        "/api/v1/notifications/batch",
+        json={"notifications": [valid_item, invalid_item, valid_item]},
+        headers=admin_auth_headers
+    )
+
+    assert response.status_code == 201
+    data = response.json()["data"]
+    assert data["created"] == 2
+    assert data["failed"] == 1
+    assert [result["success"] for result in data["results"]] == [True, False, True]
+    assert data["results"][1]["error"] == "Template not found"
+    assert data["results"][0]["notification_id"] is not None
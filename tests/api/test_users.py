@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 
 # Local application imports
 from app.core.auth import create_access_token
+from app.core.config import settings
 from app.main import app
 from app.models.user import User
 from app.schemas.user import UserCreate
@@ -148,6 +149,24 @@ def test_login_correct_email_wrong_password(client, test_db, valid_user_data):
     assert data["status"] == "error"
     assert data["message"] == "Invalid email or password"
 
+def test_login_throttled_after_repeated_failures(client, test_db, valid_user_data):
+    """Test login is refused with 429 once failures reach the limit"""
+    client.post("/api/v1/users/register", json=valid_user_data)
+    login_data = {
+        "username": valid_user_data["email"],
+        "password": "wrongpassword123"
+    }
+
+    for _ in range(settings.LOGIN_MAX_FAILURES):
+        response = client.post("/api/v1/users/login", data=login_data)
+        assert response.status_code == 200
+
+    response = client.post("/api/v1/users/login", data={**login_data, "password": valid_user_data["password"]})
+
+    assert response.status_code == 429
+    assert "Retry-After" in response.headers
+    assert response.json()["status"] == "error"
+
 def test_get_user_profile_no_auth():
     response = client.get("/api/v1/users/me")
     assert response.status_code == 401
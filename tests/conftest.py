@@ -11,19 +11,25 @@ import pytest_asyncio
 import pytz
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
 # Local application imports
 from app.core.auth import create_access_token
 from app.core.config import settings
-from app.db.session import get_db
+from app.core.security import failed_login_cache, login_limiter
+from app.core.user_cache import user_cache
+from app.db.session import get_async_db, get_db
 from app.main import app
 from app.models.base import Base
 from app.models.delivery_status import DeliveryStatus
 from app.models.notification import Notification
 from app.models.template import NotificationTemplate
+from app.models.user import User
 from app.schemas.user import UserCreate
 from app.services.senders.email_sender import EmailSender
+from app.services.senders.smtp_pool import SMTPConnectionPool
 from app.services.user_service import UserService
 
 # Test database URL  
@@ -35,6 +41,14 @@ test_engine = create_engine(TEST_DATABASE_URL)
 # Create test session factory
 TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
 
+# Async engine for endpoints using get_async_db; NullPool because the test
+# client and async fixtures run on different event loops
+test_async_engine = create_async_engine(
+    TEST_DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://"),
+    poolclass=NullPool
+)
+TestAsyncSessionLocal = async_sessionmaker(bind=test_async_engine, autoflush=False, expire_on_commit=False)
+
 @pytest.fixture(scope="session")
 def engine():
     """Create test database engine"""
@@ -60,7 +74,15 @@ def client(test_db):
         finally:
             test_db.close()
             
+    async def override_get_async_db():
+        async with TestAsyncSessionLocal() as db:
+            yield db
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    user_cache.clear()
+    login_limiter.clear()
+    failed_login_cache.clear()
     return TestClient(app)
 
 @pytest_asyncio.fixture
@@ -72,8 +94,9 @@ async def test_user(test_db: Session):
         phone="+1234567890",
         full_name="Test User"
     )
-    user = await UserService.create_user(db=test_db, user_create=user_data)
-    return user
+    async with TestAsyncSessionLocal() as db:
+        user = await UserService.create_user(db=db, user_create=user_data)
+    return test_db.get(User, user.id)
 
 @pytest_asyncio.fixture
 async def test_admin_user(test_db: Session):
@@ -85,7 +108,9 @@ async def test_admin_user(test_db: Session):
         full_name="Test Admin",
         is_admin=True
     )
-    user = await UserService.create_user(db=test_db, user_create=user_data)
+    async with TestAsyncSessionLocal() as db:
+        created = await UserService.create_user(db=db, user_create=user_data)
+    user = test_db.get(User, created.id)
     test_db.commit()  # Commit the transaction
     test_db.refresh(user)  # Refresh the user
     return user
@@ -136,6 +161,8 @@ def test_notification(test_db, test_admin_user, test_template):
         channel="email",
         content="Test content",
         variables={"name": "Test User"},
+        recipient=test_admin_user.email,
+        subject=test_template.name,
         status="pending",
         scheduled_for=datetime.now(pytz.UTC) + timedelta(hours=1)
     )
@@ -161,15 +188,9 @@ def mock_notification():
 def mock_notification_for_service():
     """Create a mock notification object with required attributes"""
     notification = Mock()
-    # Configure the template mock with a name property
-    template_mock = Mock()
-    template_mock.name = "Test Template"  # Set as property instead of Mock
-    notification.template = template_mock
-    
-    # Configure user mock
-    user_mock = Mock()
-    user_mock.email = "test@example.com"
-    notification.user = user_mock
+    # Contact snapshot the senders read instead of the user and template
+    notification.subject = "Test Template"
+    notification.recipient = "test@example.com"
     
     notification.content = "<p>Test email content</p>"
     return notification
@@ -206,5 +227,5 @@ def test_delivery_status(test_db, test_notification):
 
 @pytest.fixture
 def email_sender():
-    """Create email sender instance"""
-    return EmailSender()
\ No newline at end of file
+    """Create email sender instance with its own SMTP connection pool"""
+    return EmailSender(pool=SMTPConnectionPool())
\ No newline at end of file
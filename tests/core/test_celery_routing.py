@@ -0,0 +1,46 @@
+# tests/core/test_celery_routing.py
+
+# Third-party imports
+import pytest
+
+# Local application imports
+from app.core.celery import broker_priority, celery_app, queue_for, route_notification_task
+
+@pytest.mark.parametrize("channel, priority, queue", [
+    ("sms", 5, "notifications.sms.high"),
+    ("sms", 4, "notifications.sms.high"),
+    ("email", 3, "notifications.email.default"),
+    ("email", 2, "notifications.email.default"),
+    ("EMAIL", 1, "notifications.email.low"),
+    ("pager", 5, "notifications.other.high"),
+    ("carrier-pigeon", 1, "notifications.other.low"),
+])
+def test_queue_for_channel_and_priority(channel, priority, queue):
+    """Test notifications land on their channel's priority-band queue"""
+    assert queue_for(channel, priority) == queue
+
+def test_broker_priority_puts_urgent_first():
+    """Test higher notification priorities map to lower Redis priority numbers"""
+    assert broker_priority(5) == 0
+    assert broker_priority(1) == 4
+    assert broker_priority(9) == 0
+
+def test_router_uses_channel_and_message_priority():
+    """Test batch messages without an explicit queue are routed by channel and band"""
+    route = route_notification_task(
+        "send_notification_batch", ["push", ["id-1"]], {}, {"priority": broker_priority(5)}
+    )
+
+    assert route == {"queue": "notifications.push.high"}
+    assert route_notification_task("schedule_pending_notifications", [], {}, {}) is None
+    assert route_notification_task(
+        "send_notification_batch", ["push", []], {}, {"queue": "custom"}
+    ) is None
+
+def test_all_band_queues_declared():
+    """Test workers consume every channel and band queue by default"""
+    queue_names = {queue.name for queue in celery_app.conf.task_queues}
+
+    assert {"notifications.sms.high", "notifications.email.low", "celery"} <= queue_names
+    assert {"notifications.other.high", "notifications.other.default", "notifications.other.low"} <= queue_names
+    assert celery_app.conf.worker_prefetch_multiplier == 1
@@ -0,0 +1,79 @@
+# tests/core/test_security.py
+
+# Standard library imports
+import asyncio
+import threading
+from unittest.mock import patch
+
+# Third-party imports
+import pytest
+
+# Local application imports
+from app.core.security import (
+    FailedLoginCache,
+    LoginAttemptLimiter,
+    check_password,
+    hash_password,
+)
+
+@pytest.mark.asyncio
+async def test_hashing_runs_off_the_event_loop():
+    """Test bcrypt runs on the hashing pool, not the event loop thread"""
+    loop_thread = threading.get_ident()
+    hashing_threads = []
+
+    def fake_hash(password):
+        hashing_threads.append(threading.get_ident())
+        return f"hashed:{password}"
+
+    with patch("app.core.security.get_password_hash", side_effect=fake_hash):
+        hashed = await hash_password("secret")
+
+    assert hashed == "hashed:secret"
+    assert hashing_threads and hashing_threads[0] != loop_thread
+
+@pytest.mark.asyncio
+async def test_hash_and_check_password():
+    """Test a real bcrypt round trip through the hashing pool"""
+    hashed = await hash_password("correct horse")
+
+    results = await asyncio.gather(
+        check_password("correct horse", hashed),
+        check_password("wrong horse", hashed)
+    )
+
+    assert results == [True, False]
+
+def test_limiter_blocks_after_max_failures():
+    """Test a key is refused once it reaches the failure limit"""
+    limiter = LoginAttemptLimiter(max_failures=3, window=60.0, maxsize=100)
+
+    for _ in range(2):
+        limiter.record_failure("user@example.com|127.0.0.1")
+    assert limiter.retry_after("user@example.com|127.0.0.1") == 0
+
+    limiter.record_failure("user@example.com|127.0.0.1")
+    assert 0 < limiter.retry_after("user@example.com|127.0.0.1") <= 60.0
+    assert limiter.retry_after("user@example.com|10.0.0.1") == 0
+
+    limiter.reset("user@example.com|127.0.0.1")
+    assert limiter.retry_after("user@example.com|127.0.0.1") == 0
+
+def test_limiter_window_expires():
+    """Test failures older than the window no longer count"""
+    limiter = LoginAttemptLimiter(max_failures=1, window=60.0, maxsize=100)
+    limiter.record_failure("key")
+
+    with patch("app.core.security.time.monotonic", return_value=float("inf")):
+        assert limiter.retry_after("key") == 0
+
+def test_failed_login_cache():
+    """Test a failed pair is remembered only against the password hash it failed on"""
+    cache = FailedLoginCache(ttl=60.0, maxsize=100, secret="test-secret")
+    cache.add("User@Example.com", "wrong", "old-hash")
+
+    assert cache.contains("user@example.com", "wrong", "old-hash")
+    assert not cache.contains("user@example.com", "right", "old-hash")
+
+    # A password change made by any process replaces the stored hash
+    assert not cache.contains("user@example.com", "wrong", "new-hash")
@@ -0,0 +1,85 @@
+# tests/core/test_templating.py
+
+# Standard library imports
+from unittest.mock import patch
+from uuid import uuid4
+
+# Third-party imports
+import jinja2
+import pytest
+
+# Local application imports
+from app.core.templating import CompiledTemplateCache, environment, template_cache as shared_cache
+from app.models.template import NotificationTemplate
+
+@pytest.fixture
+def template_cache():
+    """Create an isolated compiled template cache"""
+    return CompiledTemplateCache(environment, maxsize=2)
+
+@pytest.fixture
+def compile_spy(template_cache):
+    """Count the compilations the isolated cache performs"""
+    with patch.object(template_cache, "_compile", wraps=template_cache._compile) as spy:
+        yield spy
+
+def test_cache_reuses_compiled_template(template_cache, compile_spy):
+    """Test the same template source is compiled only once"""
+    template_id = uuid4()
+    first = template_cache.get(template_id, 1, "Hello {{ name }}")
+    second = template_cache.get(template_id, 1, "Hello {{ name }}")
+
+    assert first is second
+    assert compile_spy.call_count == 1
+    assert second.render(name="World") == "Hello World"
+    assert len(template_cache) == 1
+
+def test_cache_key_includes_version_and_content(template_cache):
+    """Test edited or re-versioned templates are compiled again"""
+    template_id = uuid4()
+    original = template_cache.get(template_id, 1, "Hello {{ name }}")
+    edited = template_cache.get(template_id, 1, "Hi {{ name }}")
+    bumped = template_cache.get(template_id, 2, "Hi {{ name }}")
+
+    assert original is not edited
+    assert edited is not bumped
+    assert edited.render(name="Bob") == "Hi Bob"
+
+def test_cache_evicts_least_recently_used(template_cache, compile_spy):
+    """Test the cache stays bounded and evicts the oldest entry"""
+    first = template_cache.get("a", 1, "A")
+    evicted = template_cache.get("b", 1, "B")
+    template_cache.get("a", 1, "A")
+    template_cache.get("c", 1, "C")
+
+    assert len(template_cache) == 2
+    assert compile_spy.call_count == 3
+    assert template_cache.make_key("b", 1, "B") not in template_cache._templates
+
+    assert template_cache.get("a", 1, "A") is first
+    assert compile_spy.call_count == 3
+
+    recompiled = template_cache.get("b", 1, "B")
+    assert recompiled is not evicted
+    assert compile_spy.call_count == 4
+    assert template_cache.make_key("c", 1, "C") not in template_cache._templates
+    assert len(template_cache) == 2
+
+def test_cache_propagates_syntax_errors(template_cache):
+    """Test invalid templates raise Jinja errors instead of being cached"""
+    with pytest.raises(jinja2.TemplateError):
+        template_cache.get("broken", 1, "Hello {{ name")
+    assert len(template_cache) == 0
+
+def test_model_render_uses_cache():
+    """Test NotificationTemplate.render renders through the shared cache"""
+    template = NotificationTemplate(id=uuid4(), version=1, content="Hello {{ name }}")
+
+    with patch.object(shared_cache, "_compile", wraps=shared_cache._compile) as compile_spy:
+        assert template.render({"name": "Test User"}) == "Hello Test User"
+        assert template.render({"name": "Other User"}) == "Hello Other User"
+    assert compile_spy.call_count == 1
+
+    template.content = "Hello {{ name"
+    with pytest.raises(ValueError):
+        template.render({"name": "Test User"})
@@ -0,0 +1,129 @@
+# tests/core/test_user_cache.py
+
+# Standard library imports
+from datetime import datetime, time
+import json
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+# Third-party imports
+import pytest
+from sqlalchemy.orm import Session
+
+# Local application imports
+from app.core.user_cache import UserCache
+from app.models.user import User
+from app.models.user_preference import UserPreference
+
+def make_user(email: str = "cached@example.com") -> User:
+    user_id = uuid4()
+    user = User(
+        id=user_id,
+        email=email,
+        hashed_password="hashed",
+        is_admin=False,
+        is_active=True,
+        created_at=datetime(2024, 1, 1),
+        updated_at=datetime(2024, 1, 1)
+    )
+    user.preferences = [
+        UserPreference(
+            id=uuid4(),
+            user_id=user_id,
+            channel="email",
+            enabled=True,
+            quiet_hours_start=time(22, 0),
+            quiet_hours_end=time(7, 0)
+        )
+    ]
+    return user
+
+@pytest.fixture
+def user_cache():
+    """Create an isolated in-memory user cache"""
+    return UserCache("memory", ttl=30.0, maxsize=2)
+
+@pytest.mark.asyncio
+async def test_cached_user_round_trip(user_cache):
+    """Test a cached user comes back as a fresh detached copy with preferences"""
+    user = make_user()
+    await user_cache.set(user)
+
+    cached = await user_cache.get(user.id)
+
+    assert cached is not user
+    assert cached.id == user.id
+    assert cached.email == user.email
+    assert cached.preferences[0].quiet_hours_start == time(22, 0)
+
+@pytest.mark.asyncio
+async def test_cached_user_merges_without_query(user_cache):
+    """Test the restored user can be attached to a session without loading it"""
+    user = make_user()
+    await user_cache.set(user)
+
+    session = Session()
+    merged = session.merge(await user_cache.get(user.id), load=False)
+
+    assert merged in session
+    assert merged.preferences[0].channel == "email"
+
+@pytest.mark.asyncio
+async def test_invalidate_removes_user(user_cache):
+    """Test invalidation forces the next lookup to miss"""
+    user = make_user()
+    await user_cache.set(user)
+    await user_cache.invalidate(user.id)
+
+    assert await user_cache.get(user.id) is None
+
+@pytest.mark.asyncio
+async def test_entries_expire_and_evict(user_cache):
+    """Test TTL expiry and LRU eviction bound the cache"""
+    users = [make_user(email=f"user{i}@example.com") for i in range(3)]
+    for user in users:
+        await user_cache.set(user)
+
+    assert len(user_cache) == 2
+    assert await user_cache.get(users[0].id) is None
+
+    with patch("app.core.user_cache.time.monotonic", return_value=float("inf")):
+        assert await user_cache.get(users[2].id) is None
+
+@pytest.mark.asyncio
+async def test_disabled_cache_never_stores():
+    """Test a zero TTL disables caching"""
+    user_cache = UserCache("memory", ttl=0, maxsize=10)
+    user = make_user()
+    await user_cache.set(user)
+
+    assert await user_cache.get(user.id) is None
+
+@pytest.mark.asyncio
+async def test_redis_backend_stores_json_without_password():
+    """Test the shared cache holds JSON without credentials and round-trips through Redis"""
+    user_cache = UserCache("redis", ttl=30.0, maxsize=10, redis_url="redis://localhost:6379/0")
+    stored = {}
+
+    async def fake_set(key, value, px=None):
+        stored[key] = value.encode()
+
+    user_cache._redis = AsyncMock()
+    user_cache._redis.set.side_effect = fake_set
+    user_cache._redis.get.side_effect = lambda key: stored.get(key)
+
+    user = make_user()
+    await user_cache.set(user)
+    payload = json.loads(stored[f"user_cache:{user.id}"])
+    cached = await user_cache.get(user.id)
+
+    assert "hashed_password" not in payload["user"]
+    assert cached.id == user.id
+    assert cached.created_at == user.created_at
+    assert cached.preferences[0].id == user.preferences[0].id
+    assert cached.preferences[0].quiet_hours_end == time(7, 0)
+    assert "hashed_password" not in cached.__dict__
+
+    session = Session()
+    merged = session.merge(cached, load=False)
+    assert merged.email == user.email
@@ -0,0 +1,80 @@
+# tests/db/test_pool.py
+
+# Standard library imports
+from unittest.mock import patch
+
+# Third-party imports
+import pytest
+from sqlalchemy import create_engine, exc, text
+from sqlalchemy.pool import NullPool
+
+# Local application imports
+from app.db.pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool, pool_metrics
+from app.db.session import engine_options
+
+@pytest.fixture
+def sqlite_engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.1
+    )
+    yield engine
+    engine.dispose()
+
+def test_pool_metrics_track_checkouts(sqlite_engine):
+    """Test that checkouts and overflow connections are reported"""
+    with sqlite_engine.connect() as first, sqlite_engine.connect() as second:
+        first.execute(text("SELECT 1"))
+        second.execute(text("SELECT 1"))
+        metrics = pool_metrics(sqlite_engine.pool)
+        assert metrics["checked_out"] == 2
+        assert metrics["overflow"] == 1
+
+    metrics = pool_metrics(sqlite_engine.pool)
+    assert metrics["checked_out"] == 0
+    assert metrics["checkouts"] == 2
+    assert metrics["timeouts"] == 0
+    assert metrics["max_wait_ms"] >= 0
+
+def test_pool_metrics_count_timeouts(sqlite_engine):
+    """Test that an exhausted pool records the checkout timeout"""
+    with sqlite_engine.connect(), sqlite_engine.connect():
+        with pytest.raises(exc.TimeoutError):
+            sqlite_engine.connect()
+
+    metrics = pool_metrics(sqlite_engine.pool)
+    assert metrics["timeouts"] == 1
+    assert metrics["max_wait_ms"] >= 100
+
+def test_engine_options_worker_profile():
+    """Test that worker processes get the smaller pool and a statement timeout"""
+    with patch("app.db.session.settings") as mock_settings:
+        mock_settings.DB_POOL_MODE = "queue"
+        mock_settings.DB_POOL_PROFILE = "worker"
+        mock_settings.DB_WORKER_POOL_SIZE = 2
+        mock_settings.DB_WORKER_MAX_OVERFLOW = 1
+        mock_settings.DB_STATEMENT_TIMEOUT_MS = 5000
+
+        options = engine_options()
+        async_options = engine_options(async_driver=True)
+
+    assert options["poolclass"] is InstrumentedQueuePool
+    assert options["pool_size"] == 2
+    assert options["max_overflow"] == 1
+    assert options["connect_args"] == {"options": "-c statement_timeout=5000"}
+    assert async_options["poolclass"] is InstrumentedAsyncQueuePool
+    assert async_options["connect_args"] == {"server_settings": {"statement_timeout": "5000"}}
+
+def test_engine_options_pgbouncer_mode():
+    """Test that null mode leaves pooling to pgbouncer"""
+    with patch("app.db.session.settings") as mock_settings:
+        mock_settings.DB_POOL_MODE = "null"
+
+        options = engine_options()
+        async_options = engine_options(async_driver=True)
+
+    assert options == {"poolclass": NullPool}
+    assert async_options["connect_args"]["statement_cache_size"] == 0
@@ -0,0 +1,74 @@
+# tests/services/test_frequency_limiter.py
+
+# Standard library imports
+from unittest.mock import Mock
+
+# Third-party imports
+import pytest
+import redis
+
+# Local application imports
+from app.services.frequency_limiter import FrequencyLimiter, SLIDING_WINDOW_SCRIPT
+
+@pytest.fixture
+def redis_client():
+    client = Mock()
+    client.register_script.return_value = Mock(return_value=[])
+    return client
+
+def test_unlimited_checks_skip_redis(redis_client):
+    """Test notifications without a frequency limit never reach Redis"""
+    limiter = FrequencyLimiter(client=redis_client, window=3600)
+
+    assert limiter.check_many([("user-1", "email", None, "n-1"), ("user-2", "email", 0, "n-2")]) == [0.0, 0.0]
+    redis_client.register_script.assert_not_called()
+
+def test_batch_checked_in_one_script_call(redis_client):
+    """Test every limited check goes to Redis in a single script call"""
+    script = redis_client.register_script.return_value
+    script.return_value = [0, 90000]
+    limiter = FrequencyLimiter(client=redis_client, window=3600)
+
+    waits = limiter.check_many([
+        ("user-1", "email", 10, "n-1"),
+        ("user-2", "email", None, "n-2"),
+        ("user-3", "email", 1, "n-3"),
+    ])
+
+    assert waits == [0.0, 0.0, 90.0]
+    redis_client.register_script.assert_called_once_with(SLIDING_WINDOW_SCRIPT)
+    script.assert_called_once()
+    kwargs = script.call_args.kwargs
+    assert kwargs["keys"] == ["frequency:user-1:email", "frequency:user-3:email"]
+    assert kwargs["args"][1] == 3600 * 1000
+    assert kwargs["args"][2:] == [10, "n-1", 1, "n-3"]
+
+def test_redis_errors_fail_open(redis_client):
+    """Test notifications are allowed when Redis is unavailable"""
+    redis_client.register_script.return_value.side_effect = redis.ConnectionError("down")
+    limiter = FrequencyLimiter(client=redis_client, window=3600)
+
+    assert limiter.check("user-1", "sms", 5, "n-1") == 0.0
+
+def test_release_removes_counted_members(redis_client):
+    """Test released notifications are dropped from their windows in one round trip"""
+    pipeline = redis_client.pipeline.return_value
+    limiter = FrequencyLimiter(client=redis_client, window=3600)
+
+    limiter.release([("user-1", "email", "n-1"), ("user-2", "sms", "n-2")])
+
+    assert [c.args for c in pipeline.zrem.call_args_list] == [
+        ("frequency:user-1:email", "n-1"),
+        ("frequency:user-2:sms", "n-2"),
+    ]
+    pipeline.execute.assert_called_once()
+
+def test_release_fails_open(redis_client):
+    """Test a release with Redis down is logged, not raised"""
+    redis_client.pipeline.return_value.execute.side_effect = redis.ConnectionError("down")
+    limiter = FrequencyLimiter(client=redis_client, window=3600)
+
+    limiter.release([("user-1", "email", "n-1")])
+    limiter.release([])
+
+    redis_client.pipeline.assert_called_once()
@@ -0,0 +1,50 @@
+# tests/services/test_notification_export.py
+
+# Standard library imports
+import csv
+import io
+from unittest.mock import MagicMock
+
+# Third-party imports
+from sqlalchemy import select
+
+# Local application imports
+from app.services.notification_export import (
+    DELIVERY_COLUMNS,
+    NOTIFICATION_COLUMNS,
+    ExportFormat,
+    stream_export,
+)
+
+def make_db(*partitions) -> MagicMock:
+    db = MagicMock()
+    db.execute.return_value.mappings.return_value.partitions.return_value = iter(partitions)
+    return db
+
+def test_empty_csv_export_has_header():
+    """Test a CSV export with no matching rows still starts with the header row"""
+    db = make_db()
+    stmt = select(*NOTIFICATION_COLUMNS, *DELIVERY_COLUMNS)
+
+    body = "".join(stream_export(db, stmt, ExportFormat.CSV, chunk_size=10))
+
+    rows = list(csv.reader(io.StringIO(body)))
+    assert len(rows) == 1
+    assert rows[0][:2] == ["id", "user_id"]
+    assert rows[0][-1] == "delivery_delivered_at"
+    db.close.assert_called_once()
+
+def test_csv_header_written_once_before_rows():
+    """Test the header is emitted once, ahead of every streamed chunk"""
+    stmt = select(*NOTIFICATION_COLUMNS[:2])
+    db = make_db([{"id": 1, "user_id": 2}], [{"id": 3, "user_id": 4}])
+
+    chunks = list(stream_export(db, stmt, ExportFormat.CSV, chunk_size=1))
+
+    assert chunks == ["id,user_id\r\n", "1,2\r\n", "3,4\r\n"]
+
+def test_empty_ndjson_export_is_empty():
+    """Test an NDJSON export with no matching rows has an empty body"""
+    body = "".join(stream_export(make_db(), select(*NOTIFICATION_COLUMNS), ExportFormat.NDJSON))
+
+    assert body == ""
@@ -0,0 +1,117 @@
+# tests/services/test_notification_service.py
+
+# Standard library imports
+from datetime import datetime, time, timedelta
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+# Third-party imports
+import pytest
+import pytz
+
+# Local application imports
+from app.core.config import settings
+from app.services.notification_service import NotificationService
+
+NEW_YORK = pytz.timezone("America/New_York")
+
+def local(year, month, day, hour, minute=0, tz=NEW_YORK):
+    return tz.localize(datetime(year, month, day, hour, minute)).astimezone(pytz.UTC)
+
+@pytest.mark.parametrize("requested, expected", [
+    # Before the overnight window: unchanged
+    (local(2024, 3, 1, 21, 30), local(2024, 3, 1, 21, 30)),
+    # Late evening: moves to the end of the window the next morning
+    (local(2024, 3, 1, 23, 0), local(2024, 3, 2, 7, 0)),
+    # Early morning: moves to the end of the window the same day
+    (local(2024, 3, 2, 3, 15), local(2024, 3, 2, 7, 0)),
+    # Exactly at the end of the window: allowed
+    (local(2024, 3, 2, 7, 0), local(2024, 3, 2, 7, 0)),
+])
+def test_quiet_hours_crossing_midnight(requested, expected):
+    """Test an overnight quiet window defers sends to its end"""
+    result = NotificationService.apply_quiet_hours(requested, NEW_YORK, time(22, 0), time(7, 0))
+
+    assert result == expected
+
+@pytest.mark.parametrize("requested, expected", [
+    (local(2024, 3, 1, 12, 30), local(2024, 3, 1, 14, 0)),
+    (local(2024, 3, 1, 14, 0), local(2024, 3, 1, 14, 0)),
+    (local(2024, 3, 1, 11, 59), local(2024, 3, 1, 11, 59)),
+])
+def test_quiet_hours_within_a_day(requested, expected):
+    """Test a daytime quiet window defers sends to its end"""
+    result = NotificationService.apply_quiet_hours(requested, NEW_YORK, time(12, 0), time(14, 0))
+
+    assert result == expected
+
+def test_quiet_hours_end_across_dst_change():
+    """Test the window end is the local wall time on the day clocks change"""
+    # US clocks spring forward on 2024-03-10
+    result = NotificationService.apply_quiet_hours(local(2024, 3, 9, 23, 0), NEW_YORK, time(22, 0), time(7, 0))
+
+    assert result.astimezone(NEW_YORK).hour == 7
+    assert result == local(2024, 3, 10, 7, 0)
+
+def test_no_quiet_hours_leaves_time_unchanged():
+    """Test missing or empty quiet windows are ignored"""
+    requested = local(2024, 3, 1, 23, 0)
+
+    assert NotificationService.apply_quiet_hours(requested, NEW_YORK, None, time(7, 0)) == requested
+    assert NotificationService.apply_quiet_hours(requested, NEW_YORK, time(7, 0), time(7, 0)) == requested
+
+USER = SimpleNamespace(id="user-1", email="new@example.com", phone="+15550100")
+TEMPLATE = SimpleNamespace(id="template-1", name="Welcome")
+
+def snapshot_db():
+    """Session stand-in answering the user and template IN queries"""
+    db = Mock()
+    db.query.side_effect = lambda model: Mock(
+        filter=Mock(return_value=[USER] if model.__name__ == "User" else [TEMPLATE])
+    )
+    return db
+
+def make_notification(channel="email", recipient="old@example.com", subject="Welcome", age=timedelta(0)):
+    return SimpleNamespace(
+        channel=channel,
+        user_id=USER.id,
+        template_id=TEMPLATE.id,
+        recipient=recipient,
+        subject=subject,
+        created_at=datetime.utcnow() - age,
+    )
+
+def test_contact_snapshot_per_channel():
+    """Test each channel snapshots its own address and the template name"""
+    assert NotificationService.contact_snapshot("email", USER, TEMPLATE) == {
+        "recipient": "new@example.com", "subject": "Welcome"
+    }
+    assert NotificationService.contact_snapshot("sms", USER, TEMPLATE)["recipient"] == "+15550100"
+    assert NotificationService.contact_snapshot("push", USER, TEMPLATE)["recipient"] is None
+
+def test_complete_snapshots_need_no_queries(monkeypatch):
+    """Test sends with a full snapshot never touch the user or template tables"""
+    monkeypatch.setattr(settings, "NOTIFICATION_SNAPSHOT_REFRESH_AFTER", None)
+    db = snapshot_db()
+    notifications = [make_notification(), make_notification("push", recipient=None, age=timedelta(days=30))]
+
+    assert NotificationService.refresh_contact_snapshots(db, notifications) == 0
+    db.query.assert_not_called()
+
+def test_missing_snapshots_are_filled_in(monkeypatch):
+    """Test rows created before snapshots existed are resolved at send time"""
+    monkeypatch.setattr(settings, "NOTIFICATION_SNAPSHOT_REFRESH_AFTER", None)
+    notification = make_notification("sms", recipient=None, subject=None)
+
+    assert NotificationService.refresh_contact_snapshots(snapshot_db(), [notification]) == 1
+    assert (notification.recipient, notification.subject) == ("+15550100", "Welcome")
+
+def test_refresh_mode_rereads_old_snapshots(monkeypatch):
+    """Test snapshots older than the refresh threshold pick up the current address"""
+    monkeypatch.setattr(settings, "NOTIFICATION_SNAPSHOT_REFRESH_AFTER", 3600)
+    fresh = make_notification()
+    stale = make_notification(age=timedelta(days=2))
+
+    assert NotificationService.refresh_contact_snapshots(snapshot_db(), [fresh, stale]) == 1
+    assert fresh.recipient == "old@example.com"
+    assert stale.recipient == "new@example.com"
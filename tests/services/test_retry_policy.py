@@ -0,0 +1,69 @@
+# tests/services/test_retry_policy.py
+
+# Standard library imports
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+# Third-party imports
+import pytest
+import pytz
+
+# Local application imports
+from app.schemas.notification import NotificationStatus
+from app.services.retry_policy import RetryPolicy
+from app.tasks import notifications as tasks
+
+def upper_bound(low, high):
+    return high
+
+@pytest.fixture
+def policy():
+    return RetryPolicy(base_delay=10, max_delay=300, permanent_error_codes=["21211", "410"], rand=upper_bound)
+
+def test_backoff_doubles_up_to_cap(policy):
+    """Test the jitter ceiling doubles per attempt and stops at max_delay"""
+    assert [policy.backoff(attempt) for attempt in range(1, 8)] == [10, 20, 40, 80, 160, 300, 300]
+
+def test_backoff_uses_full_jitter():
+    """Test delays are spread between zero and the ceiling"""
+    policy = RetryPolicy(base_delay=10, max_delay=300, permanent_error_codes=[])
+    delays = [policy.backoff(3) for _ in range(200)]
+
+    assert all(0 <= delay <= 40 for delay in delays)
+    assert len(set(delays)) > 1
+
+def test_permanent_codes_are_not_retried(policy):
+    """Test permanent provider errors give up on the first failure"""
+    assert policy.next_delay(1, 3, "21211") is None
+    assert policy.next_delay(1, 3, 410) is None
+
+def test_transient_codes_retry_until_attempts_run_out(policy):
+    """Test transient and unknown errors are retried until max_retries"""
+    assert policy.next_delay(1, 3, "TIMEOUT") == 10
+    assert policy.next_delay(2, 3, None) == 20
+    assert policy.next_delay(3, 3, "TIMEOUT") is None
+
+def test_failure_values_reschedule_transient_failures(monkeypatch, policy):
+    """Test a retryable failure returns to pending with a later scheduled_for"""
+    monkeypatch.setattr(tasks, "retry_policy", policy)
+    now = datetime.now(pytz.UTC)
+    notification = SimpleNamespace(retry_count=1, max_retries=3)
+
+    values = tasks._failure_values(notification, "503", "Service unavailable", now)
+
+    assert values == {
+        "retry_count": 2,
+        "error_message": "Service unavailable",
+        "status": NotificationStatus.PENDING,
+        "scheduled_for": now + timedelta(seconds=20),
+    }
+
+def test_failure_values_mark_permanent_failures(monkeypatch, policy):
+    """Test a permanent failure is not rescheduled"""
+    monkeypatch.setattr(tasks, "retry_policy", policy)
+    notification = SimpleNamespace(retry_count=0, max_retries=3)
+
+    values = tasks._failure_values(notification, "21211", "Invalid 'To' number", datetime.now(pytz.UTC))
+
+    assert values["status"] == NotificationStatus.FAILED_PERMANENT
+    assert "scheduled_for" not in values
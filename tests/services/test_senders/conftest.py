@@ -0,0 +1,177 @@
+# tests/services/test_senders/conftest.py
+
+# Standard library imports
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import socket
+import socketserver
+import threading
+
+# Third-party imports
+import pytest
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Speaks just enough ESMTP for smtplib and aiosmtplib clients."""
+
+    def reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode())
+        self.wfile.flush()
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+            server.open_sockets.append(self.connection)
+
+        self.reply("220 localhost stand-in ESMTP")
+        data_lines = None
+        while True:
+            try:
+                line = self.rfile.readline()
+            except OSError:
+                break
+            if not line:
+                break
+
+            if data_lines is not None:
+                if line in (b".\r\n", b".\n"):
+                    with server.lock:
+                        server.messages.append(b"".join(data_lines))
+                    data_lines = None
+                    self.reply("250 OK: queued")
+                else:
+                    data_lines.append(line[1:] if line.startswith(b"..") else line)
+                continue
+
+            verb = line.decode().strip().split(" ", 1)[0].upper()
+            if verb == "EHLO":
+                self.reply("250-localhost")
+                self.reply("250-PIPELINING")
+                self.reply("250 AUTH PLAIN LOGIN")
+            elif verb == "HELO":
+                self.reply("250 localhost")
+            elif verb == "AUTH":
+                with server.lock:
+                    server.logins += 1
+                self.reply("235 2.7.0 Authentication successful")
+            elif verb == "NOOP":
+                with server.lock:
+                    server.noops += 1
+                self.reply("250 OK")
+            elif verb in ("MAIL", "RCPT", "RSET"):
+                self.reply("250 OK")
+            elif verb == "DATA":
+                data_lines = []
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+            elif verb == "QUIT":
+                self.reply("221 Bye")
+                break
+            else:
+                self.reply("502 Command not implemented")
+
+
+class StandInSMTPServer(socketserver.ThreadingTCPServer):
+    """Local SMTP stand-in that records connections, logins and messages."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _SMTPHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.logins = 0
+        self.noops = 0
+        self.messages = []
+        self.open_sockets = []
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def drop_connections(self) -> None:
+        """Close every client connection, as an SMTP relay does on idle timeout."""
+        with self.lock:
+            sockets, self.open_sockets = self.open_sockets, []
+        for sock in sockets:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+@pytest.fixture
+def smtp_server():
+    """Run a stand-in SMTP server on a local ephemeral port"""
+    server = StandInSMTPServer()
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class _PushHandler(BaseHTTPRequestHandler):
+    """Answers provider requests with the server's canned status and payload."""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        with self.server.lock:
+            self.server.requests.append({"path": self.path, "headers": dict(self.headers), "json": payload})
+        if self.server.delay:
+            self.server.delay_event.wait(self.server.delay)
+
+        status, body = self.server.respond(payload)
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubPushServer(ThreadingHTTPServer):
+    """Local stand-in for the push provider HTTP API."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _PushHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = []
+        self.delay = 0
+        self.delay_event = threading.Event()
+        self.respond = lambda payload: (200, {"id": "msg-1"})
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/send"
+
+
+@pytest.fixture
+def push_server():
+    """Run a stand-in push provider on a local ephemeral port"""
+    server = StubPushServer()
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.delay_event.set()
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,133 @@
+# tests/services/test_senders/test_async_email_sender.py
+
+# Standard library imports
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+# Third-party imports
+import aiosmtplib
+import pytest
+
+# Local application imports
+from app.services.senders.email_sender import AsyncEmailSender, EmailSender, build_email_message
+from app.services.senders.smtp_pool import SMTPConnectionPool
+
+def make_notification(index: int) -> Mock:
+    notification = Mock()
+    notification.subject = f"Template {index}"
+    notification.recipient = f"user{index}@example.com"
+    notification.content = f"<p>Message {index}</p>"
+    return notification
+
+@pytest.fixture
+def async_email_sender(smtp_server):
+    """Create an async email sender pointed at the stand-in SMTP server"""
+    return AsyncEmailSender(
+        concurrency=3,
+        hostname="127.0.0.1",
+        port=smtp_server.port,
+        username="user",
+        password="secret",
+        start_tls=False,
+        timeout=5
+    )
+
+def test_send_many_over_bounded_connections(async_email_sender, smtp_server):
+    """Test a batch is delivered over at most `concurrency` connections"""
+    notifications = [make_notification(index) for index in range(20)]
+
+    results = async_email_sender.send_many(notifications)
+
+    assert len(results) == 20
+    assert all(result.success for result in results)
+    assert len(smtp_server.messages) == 20
+    assert smtp_server.connections == 3
+
+def test_send_many_reports_per_notification_failures(async_email_sender, smtp_server):
+    """Test a notification that cannot be composed fails without affecting others"""
+    broken = Mock(spec=[])
+    notifications = [make_notification(0), broken, make_notification(2)]
+
+    results = async_email_sender.send_many(notifications)
+
+    assert [result.success for result in results] == [True, False, True]
+    assert results[1].error_code == "SMTP_ERROR"
+    assert len(smtp_server.messages) == 2
+
+def test_send_single_notification(async_email_sender, smtp_server):
+    """Test send() delivers one email through the async path"""
+    result = async_email_sender.send(make_notification(0))
+
+    assert result.success is True
+    assert b"user0@example.com" in smtp_server.messages[0]
+
+def test_send_many_connection_error():
+    """Test connection failures are reported as SMTP errors"""
+    sender = AsyncEmailSender(hostname="127.0.0.1", port=1, start_tls=False, timeout=1)
+
+    results = sender.send_many([make_notification(0), make_notification(1)])
+
+    assert all(not result.success for result in results)
+    assert all(result.error_code == "SMTP_ERROR" for result in results)
+
+def test_dropped_connection_is_closed_before_reconnecting(async_email_sender):
+    """Test a client the server dropped is closed before its replacement is opened"""
+    dropped = AsyncMock()
+    dropped.send_message.side_effect = aiosmtplib.SMTPServerDisconnected("gone")
+    replacement = AsyncMock()
+
+    with patch.object(async_email_sender, "_connect", AsyncMock(side_effect=[dropped, replacement])):
+        results = async_email_sender.send_many([make_notification(0)])
+
+    assert results[0].success is True
+    dropped.quit.assert_awaited_once()
+    replacement.send_message.assert_awaited_once()
+
+def test_email_sender_batches_through_async_sender():
+    """Test EmailSender sends batches concurrently and single emails through its pool"""
+    batch_sender = Mock(concurrency=8)
+    batch_sender.send_many.return_value = ["first", "second"]
+    pool = Mock()
+    pool.reserve.return_value = 2
+    sender = EmailSender(pool=pool, batch_sender=batch_sender)
+    notifications = [make_notification(0), make_notification(1)]
+
+    assert sender.send_many(notifications) == ["first", "second"]
+    pool.reserve.assert_called_once_with(2)
+    batch_sender.send_many.assert_called_once_with(notifications, concurrency=2)
+    pool.release.assert_called_once_with(2)
+
+    assert sender.send_many([make_notification(2)])[0].success is True
+    pool.send_message.assert_called_once()
+
+def test_batches_share_the_pool_connection_budget(async_email_sender, smtp_server):
+    """Test a batch only opens as many connections as the SMTP pool has free"""
+    pool = SMTPConnectionPool(
+        host="127.0.0.1",
+        port=smtp_server.port,
+        username="user",
+        password="secret",
+        use_tls=False,
+        max_size=2,
+        timeout=5
+    )
+    pool.send_message(build_email_message(make_notification(0)))
+    sender = EmailSender(pool=pool, batch_sender=async_email_sender)
+
+    results = sender.send_many([make_notification(index) for index in range(1, 11)])
+    pool.close()
+
+    assert all(result.success for result in results)
+    assert len(smtp_server.messages) == 11
+    assert smtp_server.connections == 3
+    assert pool.idle_count == 0
+
+def test_send_many_inside_running_event_loop(async_email_sender, smtp_server):
+    """Test send_many works when called from a thread that already runs an event loop"""
+    async def send_from_loop():
+        return async_email_sender.send_many([make_notification(0), make_notification(1)])
+
+    results = asyncio.run(send_from_loop())
+
+    assert all(result.success for result in results)
+    assert len(smtp_server.messages) == 2
@@ -0,0 +1,114 @@
+# tests/services/test_senders/test_circuit_breaker.py
+
+# Standard library imports
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+# Third-party imports
+import pytest
+import redis
+
+# Local application imports
+from app.services.senders.base import CIRCUIT_OPEN, NotificationSender, SendResult
+from app.services.senders.circuit_breaker import ALLOW_SCRIPT, RECORD_SCRIPT, CircuitBreaker
+from app.services.senders.throttle import TokenBucketLimiter
+
+
+class _ProviderSender(NotificationSender):
+    provider = "twilio"
+
+    def send(self, notification) -> SendResult:
+        return SendResult(success=True)
+
+
+def make_breaker(allow=None, record=b"closed"):
+    client = Mock()
+    scripts = {ALLOW_SCRIPT: Mock(return_value=allow or [0, b"closed"]), RECORD_SCRIPT: Mock(return_value=record)}
+    client.register_script.side_effect = scripts.get
+    breaker = CircuitBreaker(failure_threshold=5, failure_window=60, reset_timeout=30, client=client)
+    return breaker, scripts
+
+
+@pytest.fixture
+def sender():
+    sender = _ProviderSender()
+    sender.rate_limiter = TokenBucketLimiter(rates={}, client=Mock())
+    return sender
+
+
+def test_allow_reports_wait_and_state():
+    """Test the breaker's wait is converted to seconds and its state decoded"""
+    breaker, scripts = make_breaker(allow=[12500, b"open"])
+
+    assert breaker.allow("twilio") == (12.5, "open")
+    assert scripts[ALLOW_SCRIPT].call_args.kwargs["keys"] == ["circuit:twilio"]
+    assert scripts[ALLOW_SCRIPT].call_args.kwargs["args"][1] == 30000
+
+
+def test_redis_errors_keep_breaker_closed():
+    """Test providers stay reachable when Redis is unavailable"""
+    breaker, scripts = make_breaker()
+    scripts[ALLOW_SCRIPT].side_effect = redis.ConnectionError("down")
+    scripts[RECORD_SCRIPT].side_effect = redis.ConnectionError("down")
+
+    assert breaker.allow("smtp") == (0.0, "closed")
+    assert breaker.record("smtp", 0, 3) == "closed"
+
+
+def test_states_decode_breaker_hashes():
+    """Test breaker hashes are reported per provider"""
+    breaker, _ = make_breaker()
+    breaker._now_ms = lambda: 10000
+    breaker.client.scan_iter.return_value = [b"circuit:twilio"]
+    breaker.client.hgetall.return_value = {
+        b"state": b"open", b"failures": b"6", b"opened_at": b"4000", b"retry_at": b"34000"
+    }
+
+    assert breaker.states() == {
+        "twilio": {"state": "open", "failures": 6, "opened_at": 4.0, "retry_in": 24.0}
+    }
+
+
+def test_states_unavailable_without_redis():
+    """Test listing breakers reports None instead of raising when Redis is down"""
+    breaker, _ = make_breaker()
+    breaker.client.scan_iter.side_effect = redis.ConnectionError("down")
+
+    assert breaker.states() is None
+
+
+def test_open_breaker_defers_every_send(sender):
+    """Test no notification is sent while the breaker is open"""
+    sender.circuit_breaker, _ = make_breaker(allow=[8000, b"open"])
+
+    results = sender.preflight([SimpleNamespace(), SimpleNamespace()])
+
+    assert [result.error_code for result in results] == [CIRCUIT_OPEN, CIRCUIT_OPEN]
+    assert all(result.retry_after == 8.0 for result in results)
+
+
+def test_half_open_breaker_lets_one_probe_through(sender):
+    """Test only the first notification is sent while the breaker is probing"""
+    sender.circuit_breaker, _ = make_breaker(allow=[0, b"half_open"])
+
+    results = sender.preflight([SimpleNamespace(), SimpleNamespace(), SimpleNamespace()])
+
+    assert results[0] is None
+    assert [result.error_code for result in results[1:]] == [CIRCUIT_OPEN, CIRCUIT_OPEN]
+    assert results[1].retry_after == 30
+
+
+def test_record_results_counts_provider_failures(sender):
+    """Test transient errors count as failures while permanent and deferred ones do not"""
+    sender.circuit_breaker, scripts = make_breaker(record=b"open")
+
+    sender.record_results([
+        SendResult(success=False, error_code="TIMEOUT"),
+        SendResult(success=False, error_code="503"),
+        SendResult(success=False, error_code=CIRCUIT_OPEN),
+    ])
+    sender.record_results([SendResult(success=False, error_code="21211")])
+
+    first, second = scripts[RECORD_SCRIPT].call_args_list
+    assert first.kwargs["args"][1:3] == [0, 2]
+    assert second.kwargs["args"][1:3] == [1, 0]
@@ -18,12 +18,12 @@ def test_successful_email_send(email_sender, mock_notification_for_service):
     with patch('smtplib.SMTP') as mock_smtp:
         # Setup mock SMTP instance
         mock_server = MagicMock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_smtp.return_value = mock_server
 
         result = email_sender.send(mock_notification_for_service)
 
         # Verify SMTP server setup
-        mock_smtp.assert_called_once_with(settings.SMTP_HOST, settings.SMTP_PORT)
+        mock_smtp.assert_called_once_with(settings.SMTP_HOST, settings.SMTP_PORT, timeout=settings.SMTP_TIMEOUT)
         mock_server.starttls.assert_called_once()
         mock_server.login.assert_called_once_with(settings.SMTP_USER, settings.SMTP_PASSWORD)
         
@@ -36,7 +36,7 @@ def test_email_content_and_headers(email_sender, test_notification, test_templat
     """Test email content and headers are set correctly"""
     with patch('smtplib.SMTP') as mock_smtp:
         mock_server = MagicMock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_smtp.return_value = mock_server
 
         email_sender.send(test_notification)
 
@@ -44,13 +44,14 @@ def test_email_content_and_headers(email_sender, test_notification, test_templat
         
         assert sent_message['Subject'] == test_template.name
         assert sent_message['To'] == test_notification.user.email
+        assert sent_message['To'] == test_notification.recipient
         assert settings.EMAILS_FROM_EMAIL in sent_message['From']
         assert settings.EMAILS_FROM_NAME in sent_message['From']
 
 def test_smtp_error_handling(email_sender, mock_notification_for_service):
     """Test SMTP error handling"""
     with patch('smtplib.SMTP') as mock_smtp:
-        mock_smtp.return_value.__enter__.side_effect = Exception("SMTP Connection Error")
+        mock_smtp.side_effect = Exception("SMTP Connection Error")
 
         result = email_sender.send(mock_notification_for_service)
 
@@ -62,7 +63,7 @@ def test_login_error_handling(email_sender, mock_notification_for_service):
     """Test SMTP login error handling"""
     with patch('smtplib.SMTP') as mock_smtp:
         mock_server = MagicMock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_smtp.return_value = mock_server
         mock_server.login.side_effect = Exception("Authentication failed")
 
         result = email_sender.send(mock_notification_for_service)
@@ -75,7 +76,7 @@ def test_send_message_error_handling(email_sender, mock_notification_for_service
     """Test send message error handling"""
     with patch('smtplib.SMTP') as mock_smtp:
         mock_server = MagicMock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_smtp.return_value = mock_server
         mock_server.send_message.side_effect = Exception("Failed to send")
 
         result = email_sender.send(mock_notification_for_service)
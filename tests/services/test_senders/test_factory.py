@@ -0,0 +1,92 @@
+# tests/services/test_senders/test_factory.py
+
+# Standard library imports
+from unittest.mock import Mock
+
+# Third-party imports
+import pytest
+
+# Local application imports
+from app.services.senders.base import NotificationSender, SendResult
+from app.services.senders.factory import NotificationSenderFactory, SenderRegistry
+from app.services.senders.sms_sender import SMSSender
+
+
+class RecordingSender(NotificationSender):
+    """Sender stub that records lifecycle calls"""
+    instances = 0
+
+    def __init__(self):
+        RecordingSender.instances += 1
+        self.opened = False
+        self.closed = False
+
+    def open(self):
+        self.opened = True
+
+    def close(self):
+        self.closed = True
+
+    def send(self, notification) -> SendResult:
+        return SendResult(success=True)
+
+
+@pytest.fixture
+def registry():
+    """Create a registry with entry point discovery disabled"""
+    registry = SenderRegistry()
+    registry._entry_points_loaded = True
+    RecordingSender.instances = 0
+    return registry
+
+def test_sender_is_built_lazily_once(registry):
+    """Test a channel's sender is built on first use and then reused"""
+    registry.register("webhook", RecordingSender)
+    assert RecordingSender.instances == 0
+
+    first = registry.get("webhook")
+    second = registry.get("WEBHOOK")
+
+    assert first is second
+    assert first.opened is True
+    assert RecordingSender.instances == 1
+
+def test_only_requested_channel_is_built(registry):
+    """Test getting one channel does not build the others"""
+    registry.register("webhook", RecordingSender)
+    registry.register("other", Mock(side_effect=AssertionError("should not be built")))
+
+    registry.get("webhook")
+
+    assert RecordingSender.instances == 1
+
+def test_close_releases_senders(registry):
+    """Test close() closes built senders and forgets them"""
+    registry.register("webhook", RecordingSender)
+    sender = registry.get("webhook")
+
+    registry.close()
+
+    assert sender.closed is True
+    assert registry.get("webhook") is not sender
+
+def test_relationships_are_read_without_building_the_sender(registry):
+    """Test relationships come from the registered class and nothing is built"""
+    class PluginSender(RecordingSender):
+        relationships = ("user", "template")
+
+    registry.register("webhook", PluginSender)
+
+    assert registry.relationships("webhook") == ("user", "template")
+    assert registry.relationships("fax") == ()
+    assert RecordingSender.instances == 0
+
+def test_unsupported_channel(registry):
+    """Test unknown channels raise ValueError"""
+    with pytest.raises(ValueError, match="Unsupported channel"):
+        registry.get("fax")
+
+def test_factory_returns_shared_sender():
+    """Test NotificationSenderFactory reuses the registry's sender"""
+    assert NotificationSenderFactory.get_sender("sms") is NotificationSenderFactory.get_sender("sms")
+    assert isinstance(NotificationSenderFactory.get_sender("sms"), SMSSender)
@@ -0,0 +1,148 @@
+# tests/services/test_senders/test_push_sender.py
+
+# Standard library imports
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+# Third-party imports
+import pytest
+
+# Local application imports
+from app.core.config import settings
+from app.services.senders.push_sender import PushSender
+
+def make_notification(content: str = "Hello") -> Mock:
+    notification = Mock()
+    notification.user_id = uuid4()
+    notification.template_id = "template-1"
+    notification.subject = "Test Template"
+    notification.content = content
+    notification.notification_metadata = {"source": "test"}
+    return notification
+
+@pytest.fixture
+def push_sender(push_server):
+    """Create a push sender pointed at the stand-in provider"""
+    with patch.object(settings, "PUSH_PROVIDER_URL", push_server.url), \
+         patch.object(settings, "PUSH_PROVIDER_API_KEY", "push-key"), \
+         patch.object(settings, "PUSH_HTTP_READ_TIMEOUT", 0.5):
+        sender = PushSender()
+        sender.open()
+        yield sender
+        sender.close()
+
+def test_push_send_reuses_connection(push_sender, push_server):
+    """Test consecutive pushes share one keep-alive connection"""
+    results = [push_sender.send(make_notification(f"Message {index}")) for index in range(5)]
+
+    assert all(result.success for result in results)
+    assert len(push_server.requests) == 5
+    assert push_server.connections == 1
+
+def test_push_send_payload_and_headers(push_sender, push_server):
+    """Test the provider receives the expected payload and credentials"""
+    notification = make_notification()
+
+    push_sender.send(notification)
+
+    request = push_server.requests[0]
+    assert request["headers"]["Authorization"] == "Bearer push-key"
+    assert request["json"] == {
+        "user_id": str(notification.user_id),
+        "title": "Test Template",
+        "body": "Hello",
+        "metadata": {"source": "test"}
+    }
+
+def test_push_send_provider_error(push_sender, push_server):
+    """Test provider error responses are reported with their status code"""
+    push_server.respond = lambda payload: (503, {"message": "Service unavailable"})
+
+    result = push_sender.send(make_notification())
+
+    assert result.success is False
+    assert result.error_code == "503"
+    assert result.error_message == "Service unavailable"
+
+def test_push_send_malformed_response(push_sender, push_server):
+    """Test a JSON body that is not an object is reported as a provider error"""
+    push_server.respond = lambda payload: (500, ["unexpected"])
+
+    result = push_sender.send(make_notification())
+
+    assert result.success is False
+    assert result.error_code == "PROVIDER_ERROR"
+    assert result.response == {"body": ["unexpected"]}
+
+def test_push_send_read_timeout(push_sender, push_server):
+    """Test slow providers fail fast with a timeout error"""
+    push_server.delay = 2
+
+    result = push_sender.send(make_notification())
+
+    assert result.success is False
+    assert result.error_code == "TIMEOUT"
+
+def multicast_response(payload):
+    """Provider stub that fails recipients whose id starts with '0'"""
+    return 200, {
+        "results": [
+            {"success": True, "message_id": f"msg-{user_id}"}
+            if not user_id.startswith("0")
+            else {"success": False, "error_code": "UNREGISTERED", "message": "Unknown device"}
+            for user_id in payload["user_ids"]
+        ]
+    }
+
+def test_send_batch_groups_and_chunks(push_sender, push_server):
+    """Test identical pushes are multicast in provider-sized chunks"""
+    push_server.respond = multicast_response
+    notifications = [make_notification("Sale") for _ in range(5)] + [make_notification("Other")]
+
+    with patch.object(settings, "PUSH_MULTICAST_URL", push_server.url), \
+         patch.object(settings, "PUSH_MULTICAST_MAX_RECIPIENTS", 2):
+        results = push_sender.send_batch(notifications)
+
+    assert len(results) == 6
+    assert len(push_server.requests) == 4
+    assert [len(request["json"]["user_ids"]) for request in push_server.requests] == [2, 2, 1, 1]
+    for notification, result in zip(notifications, results):
+        expected = not str(notification.user_id).startswith("0")
+        assert result.success is expected
+        if expected:
+            assert result.response["message_id"] == f"msg-{notification.user_id}"
+        else:
+            assert result.error_code == "UNREGISTERED"
+
+def test_send_batch_provider_error_fails_chunk(push_sender, push_server):
+    """Test a failed multicast request fails every recipient in the chunk"""
+    push_server.respond = lambda payload: (500, {"message": "Internal error"})
+    notifications = [make_notification("Sale") for _ in range(3)]
+
+    with patch.object(settings, "PUSH_MULTICAST_URL", push_server.url):
+        results = push_sender.send_batch(notifications)
+
+    assert len(push_server.requests) == 1
+    assert all(result.error_code == "500" for result in results)
+
+def test_send_batch_malformed_responses(push_sender, push_server):
+    """Test malformed multicast bodies and recipient entries are provider errors"""
+    notifications = [make_notification("Sale") for _ in range(2)]
+
+    with patch.object(settings, "PUSH_MULTICAST_URL", push_server.url):
+        push_server.respond = lambda payload: (200, "ok")
+        whole = push_sender.send_batch(notifications)
+
+        push_server.respond = lambda payload: (200, {"results": [{"success": True}, "bad"]})
+        partial = push_sender.send_batch(notifications)
+
+    assert [result.error_code for result in whole] == ["PROVIDER_ERROR", "PROVIDER_ERROR"]
+    assert partial[0].success is True
+    assert partial[1].error_code == "PROVIDER_ERROR"
+
+def test_send_batch_without_multicast_endpoint(push_sender, push_server):
+    """Test batches fall back to one request per push without a multicast URL"""
+    results = push_sender.send_batch([make_notification() for _ in range(3)])
+
+    assert all(result.success for result in results)
+    assert len(push_server.requests) == 3
@@ -0,0 +1,109 @@
+# tests/services/test_senders/test_smtp_pool.py
+
+# Standard library imports
+from concurrent.futures import ThreadPoolExecutor
+from email.mime.text import MIMEText
+import smtplib
+
+# Third-party imports
+import pytest
+
+# Local application imports
+from app.services.senders.email_sender import EmailSender
+from app.services.senders.smtp_pool import SMTPConnectionPool
+
+def make_message(index: int = 0) -> MIMEText:
+    message = MIMEText(f"<p>Message {index}</p>", "html")
+    message["Subject"] = f"Test {index}"
+    message["From"] = "sender@example.com"
+    message["To"] = "recipient@example.com"
+    return message
+
+def make_pool(smtp_server, **overrides) -> SMTPConnectionPool:
+    options = dict(
+        host="127.0.0.1",
+        port=smtp_server.port,
+        username="user",
+        password="secret",
+        use_tls=False,
+        max_size=2,
+        idle_timeout=60,
+        max_messages_per_connection=100,
+        timeout=5,
+    )
+    options.update(overrides)
+    return SMTPConnectionPool(**options)
+
+def test_pool_reuses_authenticated_connection(smtp_server):
+    """Test consecutive sends share one connection and one AUTH"""
+    pool = make_pool(smtp_server)
+    for index in range(5):
+        pool.send_message(make_message(index))
+    pool.close()
+
+    assert len(smtp_server.messages) == 5
+    assert smtp_server.connections == 1
+    assert smtp_server.logins == 1
+    assert smtp_server.noops == 4
+
+def test_pool_rotates_after_max_messages(smtp_server):
+    """Test a connection is retired once its message budget is spent"""
+    pool = make_pool(smtp_server, max_messages_per_connection=2)
+    for index in range(5):
+        pool.send_message(make_message(index))
+    pool.close()
+
+    assert len(smtp_server.messages) == 5
+    assert smtp_server.connections == 3
+
+def test_pool_discards_idle_connections(smtp_server):
+    """Test connections idle beyond the timeout are not reused"""
+    pool = make_pool(smtp_server, idle_timeout=0)
+    pool.send_message(make_message(0))
+    pool.send_message(make_message(1))
+    pool.close()
+
+    assert smtp_server.connections == 2
+    assert smtp_server.noops == 0
+
+def test_pool_reconnects_after_server_drop(smtp_server):
+    """Test a dropped session fails the NOOP health check and is replaced"""
+    pool = make_pool(smtp_server)
+    pool.send_message(make_message(0))
+    smtp_server.drop_connections()
+    pool.send_message(make_message(1))
+    pool.close()
+
+    assert len(smtp_server.messages) == 2
+    assert smtp_server.connections == 2
+    assert smtp_server.logins == 2
+
+def test_pool_caps_open_connections(smtp_server):
+    """Test concurrent sends never open more than max_size connections"""
+    pool = make_pool(smtp_server, max_size=2)
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        list(executor.map(pool.send_message, [make_message(index) for index in range(12)]))
+    pool.close()
+
+    assert len(smtp_server.messages) == 12
+    assert smtp_server.connections <= 2
+
+def test_pool_fails_when_every_connection_is_busy(smtp_server):
+    """Test a send gives up after the timeout instead of opening another connection"""
+    pool = make_pool(smtp_server, max_size=1, timeout=0.05)
+    pool._slots.acquire()
+
+    with pytest.raises(smtplib.SMTPException, match="exhausted"):
+        pool.send_message(make_message(0))
+    assert smtp_server.connections == 0
+
+def test_email_sender_sends_through_pool(smtp_server, mock_notification_for_service):
+    """Test EmailSender delivers many emails over a single pooled session"""
+    sender = EmailSender(pool=make_pool(smtp_server))
+    results = [sender.send(mock_notification_for_service) for _ in range(3)]
+    sender.pool.close()
+
+    assert all(result.success for result in results)
+    assert len(smtp_server.messages) == 3
+    assert smtp_server.connections == 1
+    assert b"test@example.com" in smtp_server.messages[0]
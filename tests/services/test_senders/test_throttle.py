@@ -0,0 +1,90 @@
+# tests/services/test_senders/test_throttle.py
+
+# Standard library imports
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+# Third-party imports
+import pytest
+import redis
+
+# Local application imports
+from app.services.senders.base import NotificationSender, SendResult, THROTTLED
+from app.services.senders.email_sender import email_rate_limit_keys
+from app.services.senders.throttle import TOKEN_BUCKET_SCRIPT, TokenBucketLimiter
+
+
+@pytest.fixture
+def redis_client():
+    client = Mock()
+    client.register_script.return_value = Mock(return_value=[1, 0])
+    return client
+
+
+class _KeyedSender(NotificationSender):
+    def rate_limit_keys(self, notification):
+        return ["email", f"email:{notification.domain}"]
+
+    def send(self, notification) -> SendResult:
+        return SendResult(success=True)
+
+
+def test_unconfigured_buckets_skip_redis(redis_client):
+    """Test sends are allowed without touching Redis when no bucket has a rate"""
+    limiter = TokenBucketLimiter(rates={"push": 100}, client=redis_client)
+
+    assert limiter.acquire(["sms", "sms:+15550100"], 3) == [0.0, 0.0, 0.0]
+    redis_client.register_script.assert_not_called()
+
+
+def test_acquire_checks_configured_buckets_in_one_call(redis_client):
+    """Test all configured buckets are checked together and queued sends are spaced"""
+    script = redis_client.register_script.return_value
+    script.return_value = [2, 500]
+    limiter = TokenBucketLimiter(rates={"sms": 10, "sms:+15550100": 2}, burst=2, client=redis_client)
+
+    waits = limiter.acquire(["sms", "sms:+15550100", "sms:unlimited"], 4)
+
+    assert waits == [0.0, 0.0, 0.5, 1.0]
+    redis_client.register_script.assert_called_once_with(TOKEN_BUCKET_SCRIPT)
+    kwargs = script.call_args.kwargs
+    assert kwargs["keys"] == ["throttle:sms", "throttle:sms:+15550100"]
+    assert kwargs["args"][1:] == [4, 10, 20, 2, 4]
+
+
+def test_redis_errors_fail_open(redis_client):
+    """Test sends are allowed when Redis is unavailable"""
+    redis_client.register_script.return_value.side_effect = redis.ConnectionError("down")
+    limiter = TokenBucketLimiter(rates={"push": 100}, client=redis_client)
+
+    assert limiter.acquire(["push"], 2) == [0.0, 0.0]
+
+
+def test_preflight_groups_by_bucket(redis_client):
+    """Test preflight takes tokens once per bucket set and marks denied sends as throttled"""
+    script = redis_client.register_script.return_value
+    script.return_value = [1, 250]
+    sender = _KeyedSender()
+    sender.rate_limiter = TokenBucketLimiter(rates={"email": 50}, client=redis_client)
+
+    notifications = [
+        SimpleNamespace(domain="gmail.com"),
+        SimpleNamespace(domain="example.com"),
+        SimpleNamespace(domain="gmail.com"),
+    ]
+    results = sender.preflight(notifications)
+
+    assert script.call_count == 1
+    assert results[0] is None
+    assert results[1] is not None and results[2] is not None
+    assert results[1].error_code == THROTTLED
+    assert results[1].throttled
+    assert results[1].retry_after == pytest.approx(0.25)
+    assert results[2].retry_after == pytest.approx(0.27)
+
+
+def test_email_keys_use_recipient_domain():
+    """Test email buckets are per relay and per recipient domain"""
+    notification = SimpleNamespace(recipient="Someone@Example.COM")
+
+    assert email_rate_limit_keys(notification) == ["email", "email:example.com"]
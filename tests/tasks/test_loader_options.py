@@ -0,0 +1,74 @@
+# tests/tasks/test_loader_options.py
+
+# Third-party imports
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+# Local application imports
+from app.models import Notification
+from app.services.senders.push_sender import PushSender
+from app.services.senders.sms_sender import SMSSender
+from app.tasks import notifications as tasks
+
+class _PluginSender:
+    relationships = ("user", "template")
+
+class _UserOnlySender:
+    relationships = ("user",)
+
+@pytest.fixture
+def senders(monkeypatch):
+    registry = {
+        "sms": SMSSender,
+        "push": PushSender,
+        "pager": _UserOnlySender,
+        "chat": _PluginSender,
+    }
+
+    def get_relationships(channel):
+        if channel == "broken":
+            raise RuntimeError("entry point import failed")
+        return tuple(getattr(registry.get(channel), "relationships", ()))
+
+    def get_sender(channel):
+        raise AssertionError("claims must not build senders")
+
+    monkeypatch.setattr(tasks.NotificationSenderFactory, "get_relationships", get_relationships)
+    monkeypatch.setattr(tasks.NotificationSenderFactory, "get_sender", get_sender)
+
+def compile_claim(options) -> str:
+    return str(select(Notification).options(*options).compile(dialect=postgresql.dialect()))
+
+def test_snapshot_senders_load_nothing(senders):
+    """Test built-in senders read the contact snapshot and need no joins"""
+    assert tasks._sender_load_options("sms", batch=False) == []
+    assert tasks._sender_load_options("push", batch=True) == []
+
+def test_single_send_joins_only_what_the_sender_reads(senders):
+    """Test the claim query joins just the relationships a plugin sender declares"""
+    pager_sql = compile_claim(tasks._sender_load_options("pager", batch=False))
+    chat_sql = compile_claim(tasks._sender_load_options("chat", batch=False))
+
+    assert 'JOIN "user"' in pager_sql and "notificationtemplate" not in pager_sql
+    assert 'JOIN "user"' in chat_sql and "JOIN notificationtemplate" in chat_sql
+
+def test_unknown_channel_loads_nothing(senders):
+    """Test a claim without a channel leaves relationships to lazy loading"""
+    assert tasks._sender_load_options(None, batch=False) == []
+
+def test_batches_preload_with_one_query_per_relationship(senders):
+    """Test batch loads use selectin loading for the sender's relationships"""
+    options = tasks._sender_load_options("pager", batch=True)
+
+    assert len(options) == 1
+    assert options[0].context[0].strategy == (("lazy", "selectin"),)
+    assert "Notification.user" in str(options[0].path)
+
+def test_unsupported_channel_loads_nothing(senders):
+    """Test unsupported channels skip eager loading and fail at send time instead"""
+    assert tasks._sender_load_options("carrier-pigeon", batch=True) == []
+
+def test_relationship_lookup_errors_load_nothing(senders):
+    """Test any error reading a sender's relationships falls back to lazy loading"""
+    assert tasks._sender_load_options("broken", batch=False) == []
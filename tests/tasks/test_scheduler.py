@@ -0,0 +1,41 @@
+# tests/tasks/test_scheduler.py
+
+# Standard library imports
+from datetime import datetime, timedelta
+
+# Third-party imports
+import pytest
+import pytz
+
+# Local application imports
+from app.tasks.scheduler import NotificationScheduler
+
+@pytest.fixture
+def scheduler():
+    """Create a scheduler with small, predictable idle bounds"""
+    return NotificationScheduler(batch_size=100, min_idle=0.5, max_idle=8)
+
+def test_full_batch_drains_immediately(scheduler):
+    """Test a full batch triggers another pass without sleeping"""
+    now = datetime.now(pytz.UTC)
+    assert scheduler.next_sleep(100, now - timedelta(seconds=30), now) == 0.0
+
+def test_empty_queue_backs_off_exponentially(scheduler):
+    """Test consecutive empty passes double the idle interval up to the cap"""
+    now = datetime.now(pytz.UTC)
+    sleeps = [scheduler.next_sleep(0, None, now) for _ in range(6)]
+    assert sleeps == [1.0, 2.0, 4.0, 8.0, 8.0, 8.0]
+
+def test_work_resets_backoff(scheduler):
+    """Test dispatching a partial batch resets the idle interval"""
+    now = datetime.now(pytz.UTC)
+    for _ in range(4):
+        scheduler.next_sleep(0, None, now)
+    assert scheduler.next_sleep(10, None, now) == 0.5
+
+def test_wakes_early_for_next_scheduled_notification(scheduler):
+    """Test the scheduler sleeps only until the next scheduled_for"""
+    now = datetime.now(pytz.UTC)
+    for _ in range(4):
+        scheduler.next_sleep(0, None, now)
+    assert scheduler.next_sleep(0, now + timedelta(seconds=1.5), now) == pytest.approx(1.5)
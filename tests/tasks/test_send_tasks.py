@@ -0,0 +1,158 @@
+# tests/tasks/test_send_tasks.py
+
+# Standard library imports
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
+from uuid import uuid4
+
+# Third-party imports
+import pytest
+import pytz
+
+# Local application imports
+from app.core.celery import celery_app
+from app.schemas.notification import NotificationStatus
+from app.services.senders.base import UNSUPPORTED_CHANNEL, SendResult
+from app.services.senders.email_sender import EmailSender
+from app.tasks import notifications as tasks
+
+def make_notification(index: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid4(),
+        user_id=uuid4(),
+        subject=f"Template {index}",
+        recipient=f"user{index}@example.com",
+        content=f"<p>Message {index}</p>",
+        retry_count=0,
+        max_retries=3,
+        channel="email"
+    )
+
+@pytest.fixture
+def claimed(monkeypatch):
+    """Stand in for the database so the task claims a fixed list of notifications"""
+    notifications = [make_notification(index) for index in range(3)]
+    db = MagicMock()
+    db.__enter__.return_value = db
+    db.execute.return_value.scalars.return_value.all.return_value = [n.id for n in notifications]
+    db.query.return_value.options.return_value.filter.return_value.all.return_value = notifications
+
+    monkeypatch.setattr(tasks, "SessionLocal", lambda: db)
+    monkeypatch.setattr(tasks.NotificationService, "refresh_contact_snapshots", Mock())
+    monkeypatch.setattr(tasks, "_frequency_limit_waits", lambda db, channel, items: [0.0] * len(items))
+    monkeypatch.setattr(tasks, "_preflight_waits", lambda channel, items: [0.0] * len(items))
+    return notifications
+
+def test_email_batch_uses_batched_sender(monkeypatch, claimed):
+    """Test an email batch is handed to the concurrent sender in one call"""
+    batch_sender = Mock(concurrency=8)
+    batch_sender.send_many.return_value = [SendResult(success=True) for _ in claimed]
+    sender = EmailSender(pool=Mock(**{"reserve.return_value": 3}), batch_sender=batch_sender)
+    sender.circuit_breaker = Mock()
+    monkeypatch.setattr(tasks.NotificationSenderFactory, "get_sender", lambda channel: sender)
+
+    assert tasks.send_notification_batch("email", [str(n.id) for n in claimed]) == 3
+
+    batch_sender.send_many.assert_called_once_with(claimed, concurrency=3)
+    sender.pool.send_message.assert_not_called()
+
+def test_preflight_deferrals_release_frequency_slots(monkeypatch, claimed):
+    """Test notifications held back by the throttle give their frequency slot back"""
+    limiter = Mock()
+    sender = Mock()
+    sender.send_many.side_effect = lambda items: [SendResult(success=True) for _ in items]
+    monkeypatch.setattr(tasks, "frequency_limiter", limiter)
+    monkeypatch.setattr(tasks, "_preflight_waits", lambda channel, items: [0.0, 2.5, 0.0])
+    monkeypatch.setattr(tasks.NotificationSenderFactory, "get_sender", lambda channel: sender)
+
+    assert tasks.send_notification_batch("email", [str(n.id) for n in claimed]) == 2
+
+    limiter.release.assert_called_once_with([(claimed[1].user_id, "email", claimed[1].id)])
+    assert sender.send_many.call_args.args[0] == [claimed[0], claimed[2]]
+
+def test_single_send_commits_claim_before_sending(monkeypatch, claimed):
+    """Test the claim is committed so no transaction is open during the provider call"""
+    db = tasks.SessionLocal()
+    db.execute.return_value.scalar_one_or_none.return_value = claimed[0].id
+    db.query.return_value.options.return_value.filter.return_value.first.return_value = claimed[0]
+    commits_before_send = []
+    sender = Mock()
+    sender.send.side_effect = lambda item: commits_before_send.append(db.commit.call_count) or SendResult(success=True)
+    monkeypatch.setattr(tasks.NotificationSenderFactory, "get_sender", lambda channel: sender)
+
+    assert tasks.send_notification(str(claimed[0].id), "email") is True
+
+    claim = db.execute.call_args_list[0].args[0]
+    assert claim.compile().params["status"] == NotificationStatus.PROCESSING
+    assert commits_before_send == [1]
+    assert db.commit.call_count == 2
+
+def test_unclaimable_single_send_is_skipped(monkeypatch, claimed):
+    """Test a notification another worker claimed is neither loaded nor sent"""
+    db = tasks.SessionLocal()
+    db.execute.return_value.scalar_one_or_none.return_value = None
+    sender = Mock()
+    monkeypatch.setattr(tasks.NotificationSenderFactory, "get_sender", lambda channel: sender)
+
+    assert tasks.send_notification(str(claimed[0].id), "email") is False
+
+    db.query.assert_not_called()
+    sender.send.assert_not_called()
+
+def test_requeue_returns_stale_processing_rows():
+    """Test rows left 'processing' by a dead worker are made pending again"""
+    db = MagicMock()
+    db.execute.return_value.rowcount = 2
+
+    assert tasks.requeue_stale_notifications(db) == 2
+
+    sql = str(db.execute.call_args.args[0].compile(compile_kwargs={"literal_binds": True})).lower()
+    assert "'queued'" in sql and "'processing'" in sql
+    db.commit.assert_called_once()
+
+def test_requeue_spares_rows_of_tasks_still_within_their_time_limit(monkeypatch):
+    """Test a 'processing' row is not requeued before its task could have been killed"""
+    monkeypatch.setattr(tasks.settings, "NOTIFICATION_PROCESSING_TIMEOUT", 60)
+    db = MagicMock()
+    db.execute.return_value.rowcount = 0
+    started = datetime.now(pytz.UTC)
+
+    tasks.requeue_stale_notifications(db)
+
+    time_limit = timedelta(seconds=celery_app.conf.task_time_limit)
+    cutoffs = [
+        value for value in db.execute.call_args.args[0].compile().params.values()
+        if isinstance(value, datetime)
+    ]
+    assert tasks.processing_timeout() > celery_app.conf.task_time_limit
+    assert min(cutoffs) < started - time_limit
+
+def test_dispatch_routes_plugin_channels_to_a_consumed_queue(monkeypatch):
+    """Test a channel without its own queues is enqueued on a queue workers consume"""
+    db = MagicMock()
+    db.execute.return_value.all.return_value = [(uuid4(), "pager", 5), (uuid4(), "sms", 1)]
+    apply_async = Mock()
+    monkeypatch.setattr(tasks.send_notification_batch, "apply_async", apply_async)
+
+    assert tasks.dispatch_due_notifications(db, batch_size=10) == 2
+
+    declared = {queue.name for queue in celery_app.conf.task_queues}
+    queues = {call.kwargs["args"][0]: call.kwargs["queue"] for call in apply_async.call_args_list}
+    assert queues == {"pager": "notifications.other.high", "sms": "notifications.sms.low"}
+    assert set(queues.values()) <= declared
+
+def test_unsupported_channel_fails_permanently(monkeypatch, claimed):
+    """Test a batch for a channel without a sender fails for good instead of cycling"""
+    def get_sender(channel):
+        raise tasks.UnsupportedChannelError(f"Unsupported channel: {channel}")
+
+    recorded = Mock(return_value=0)
+    monkeypatch.setattr(tasks.NotificationSenderFactory, "get_sender", get_sender)
+    monkeypatch.setattr(tasks, "_record_send_results", recorded)
+
+    assert tasks.send_notification_batch("pager", [str(n.id) for n in claimed]) == 0
+
+    results = recorded.call_args.args[2]
+    assert [result.error_code for result in results] == [UNSUPPORTED_CHANNEL] * 3
+    assert tasks.retry_policy.is_permanent(UNSUPPORTED_CHANNEL)